@@ -8,8 +8,16 @@ from mario.log_exc.exceptions import (
 )
 from mario.log_exc.logger import log_time
 from mario.api.metadata import MARIOMetaData
-from mario.compute.helpers import _is_sparse_backed_dataframe, sum_columns
-from mario.internal.access import block_to_matrix, block_to_pandas, block_to_table
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values, sum_columns
+from mario.compute.ordering import model_ordering_cache
+from mario.compute.runtime import resolver_max_workers
+from mario.internal.access import (
+    block_buffers,
+    block_to_matrix,
+    block_to_pandas,
+    block_to_table,
+    share_block,
+)
 from mario.model.assumptions import resolve_tech_assumption
 from mario.parsers.tabular import dataframe_parser
 from mario.settings.settings import IndexAliases, Nomenclature
@@ -25,6 +33,7 @@ import os
 import copy
 import re
 import warnings
+import weakref
 
 # constants
 from mario.model.conventions import (
@@ -42,6 +51,17 @@ except ModuleNotFoundError:
     __cvxpy__ = False
 
 
+# Table type of every exploded multiplier matrix.
+_EXPLODED_TABLES = {
+    "f_ex": "IOT",
+    "m_ex": "IOT",
+    "fa_ex": "SUT",
+    "fc_ex": "SUT",
+    "ma_ex": "SUT",
+    "mc_ex": "SUT",
+}
+
+
 def _prune_eager_parser_blocks(matrices: dict[str, object]) -> dict[str, object]:
     """Drop blocks that should remain demand-driven after parsing."""
     matrices.pop(_ENUM.X, None)
@@ -266,6 +286,11 @@ def _expand_sut_unified_update_payload(
     return {canonical: value, **split_payload}
 
 
+def _share_matrices(matrices: dict[str, object]) -> dict[str, object]:
+    """Return copy-on-write handles on every block of one scenario."""
+    return {name: share_block(value) for name, value in matrices.items()}
+
+
 def _main_index_count(indeces: dict[str, dict[str, list[object]]], code: str) -> int | None:
     """Return the size of one main database index when available."""
     levels = indeces.get(code)
@@ -565,6 +590,17 @@ class CoreModel:
             compute_options=compute_options,
         )
         resolver = _resolver_module().Resolver(self, scenario=scenario, context=context)
+        ordering_builds = model_ordering_cache(self).stats().builds
+
+        if not force_rewrite and resolver_max_workers(context) > 1:
+            # With opt-in concurrency, independent targets are materialized on
+            # the worker threads first; the loop below then finds them stored
+            # and reports any failure in order.
+            pending = [item for item in dict.fromkeys(requested) if not self.has_matrix(item, scenario=scenario)]
+            try:
+                resolver.resolve_many(pending)
+            except self._resolver_failure_types():
+                pass
 
         for item in requested:
             if self.has_matrix(item, scenario=scenario) and not force_rewrite:
@@ -581,11 +617,19 @@ class CoreModel:
                 resolver.resolve_requested(item)
             except self._resolver_failure_types() as exc:
                 if removed:
-                    self.set_block(item, previous, scenario=scenario)
+                    self.matrices[scenario][_resolve_storage_matrix_name(item)] = previous
                 raise DataMissing(
                     f"MARIO is not able to calculate {item} because of missing or unresolved dependencies.\n{exc}"
                 ) from exc
 
+        ordering_builds = model_ordering_cache(self).stats().builds - ordering_builds
+        if ordering_builds:
+            log_time(
+                logger,
+                f"Resolver: SUT ordering built {ordering_builds} time(s) for {self._public_scenario_name(scenario)}.",
+                "debug",
+            )
+
     def _validate_scenario(self, scenario: str) -> None:
         """Ensure that the requested scenario exists and return its storage key."""
         return self._resolve_scenario_name(scenario)
@@ -674,7 +718,23 @@ class CoreModel:
             return _resolver_module().resolve(item, self, scenario=scenario, context=context)
         except self._resolver_failure_types() as exc:
             if removed:
-                self.set_block(item, previous, scenario=scenario)
+                self.matrices[scenario][_resolve_storage_matrix_name(item)] = previous
+            raise DataMissing(
+                f"MARIO is not able to calculate {item} because of missing or unresolved dependencies.\n{exc}"
+            ) from exc
+
+    def _resolve_rows(self, item: str, rows, *, scenario: str, compute_options=None):
+        """Resolve selected rows of one matrix without materializing it."""
+        scenario = self._validate_scenario(scenario)
+        rows = [rows] if isinstance(rows, (str, tuple)) else list(rows)
+        context = _build_resolution_context(
+            compute_options=compute_options,
+        )
+        try:
+            return _resolver_module().resolve(item, self, scenario=scenario, context=context, rows=rows)
+        except KeyError as exc:
+            raise WrongInput(f"Some of the requested rows are not available for {item}: {exc}") from exc
+        except self._resolver_failure_types() as exc:
             raise DataMissing(
                 f"MARIO is not able to calculate {item} because of missing or unresolved dependencies.\n{exc}"
             ) from exc
@@ -686,6 +746,7 @@ class CoreModel:
         scenario: str = "baseline",
         force_rewrite: bool = False,
         compute_options=None,
+        rows=None,
     ):
         """Resolve and materialize one matrix through the compute resolver.
 
@@ -700,15 +761,26 @@ class CoreModel:
         compute_options:
             Optional advanced compute options payload used to steer runtime
             planning and backend selection.
+        rows:
+            Optional row labels to return instead of the whole block. For the
+            ``f``, ``m``, ``fa``, ``fc``, ``ma`` and ``mc`` multipliers only
+            those rows are computed, from the matching rows of the direct
+            coefficients, and the result is cached on the database instead of
+            being stored in ``self.matrices``.
 
         Returns
         -------
         object
-            The resolved block as stored in ``self.matrices[scenario]``.
+            The resolved block as stored in ``self.matrices[scenario]``, or
+            the requested rows of it.
         """
         matrix = _resolve_canonical_matrix_name(matrix)
         self._validate_scenario(scenario)
         self._validate_matrices([matrix])
+        if rows is not None:
+            if force_rewrite:
+                raise WrongInput("rows cannot be combined with force_rewrite.")
+            return self._resolve_rows(matrix, rows, scenario=scenario, compute_options=compute_options)
         return self._resolve_one(
             matrix,
             scenario=scenario,
@@ -987,9 +1059,14 @@ class CoreModel:
         scenario = self._validate_scenario(scenario)
         return self.matrices[scenario][_resolve_storage_matrix_name(name)]
 
-    def set_block(self, name: str, value, scenario: str = "baseline") -> None:
+    def set_block(self, name: str, value, scenario: str = "baseline", *, derived_from=None) -> None:
         """Store one block in the selected scenario.
 
+        Every write bumps the version of the block. Writes without
+        ``derived_from`` are treated as edits of the scenario data: materialized
+        blocks that were computed from the previous content of ``name`` are
+        dropped, so the next query recomputes only those dependents.
+
         Parameters
         ----------
         name:
@@ -998,9 +1075,87 @@ class CoreModel:
             Block payload to assign.
         scenario:
             Scenario to update.
+        derived_from:
+            Optional names of the blocks ``value`` was computed from. The
+            resolver passes them so the block records the versions of its
+            inputs and is dropped once any of them is rewritten.
         """
         scenario = self._validate_scenario(scenario)
-        self.matrices[scenario][_resolve_storage_matrix_name(name)] = value
+        storage_name = _resolve_storage_matrix_name(name)
+        self.matrices[scenario][storage_name] = value
+        versions = self._block_versions(scenario)
+        versions[storage_name] = versions.get(storage_name, 0) + 1
+
+        lineage = self._block_lineage(scenario)
+        if derived_from is None:
+            lineage.pop(storage_name, None)
+            self._invalidate_dependents(storage_name, scenario=scenario)
+            return
+
+        try:
+            reference = weakref.ref(value)
+        except TypeError:
+            # Blocks that cannot be tracked are simply never invalidated.
+            lineage.pop(storage_name, None)
+            return
+        inputs = {_resolve_storage_matrix_name(item) for item in derived_from}
+        inputs.discard(storage_name)
+        lineage[storage_name] = (reference, {item: versions.get(item, 0) for item in inputs})
+
+    def _block_versions(self, scenario: str) -> dict[str, int]:
+        """Return the write counters of one scenario, creating them lazily."""
+        return self.__dict__.setdefault("_versions", {}).setdefault(scenario, {})
+
+    def _block_lineage(self, scenario: str) -> dict[str, tuple]:
+        """Return ``name -> (block reference, input versions)`` for one scenario.
+
+        Entries only apply while the stored object is still the one they were
+        recorded for, so blocks replaced through any other path silently lose
+        their lineage instead of being invalidated by mistake.
+        """
+        return self.__dict__.setdefault("_lineage", {}).setdefault(scenario, {})
+
+    def _invalidate_dependents(self, name: str, *, scenario: str) -> tuple[str, ...]:
+        """Drop the materialized blocks computed from an older version of ``name``."""
+        lineage = self._block_lineage(scenario)
+        if not lineage:
+            return ()
+
+        blocks = self.matrices[scenario]
+        versions = self._block_versions(scenario)
+        dropped = []
+        changed = [name]
+        while changed:
+            current = changed.pop()
+            for dependent, (reference, inputs) in list(lineage.items()):
+                if current not in inputs or inputs[current] == versions.get(current, 0):
+                    continue
+                del lineage[dependent]
+                if dependent in blocks and blocks[dependent] is reference():
+                    del blocks[dependent]
+                    versions[dependent] = versions.get(dependent, 0) + 1
+                    dropped.append(dependent)
+                    changed.append(dependent)
+
+        if dropped:
+            log_time(
+                logger,
+                f"Database: {name} changed in {self._public_scenario_name(scenario)}; "
+                f"dropped derived blocks {sorted(dropped)}.",
+                "debug",
+            )
+        return tuple(dropped)
+
+    def _share_lineage(self, source: str, target: str, matrices: dict[str, object], *, model=None) -> None:
+        """Copy the lineage of ``source`` onto the shared blocks of ``target``."""
+        model = self if model is None else model
+        versions = model._block_versions(target)
+        lineage = model._block_lineage(target)
+        versions.update(self._block_versions(source))
+        blocks = self.matrices[source]
+        for name, (reference, inputs) in self._block_lineage(source).items():
+            if name in blocks and blocks[name] is reference() and name in matrices:
+                lineage[name] = (weakref.ref(matrices[name]), dict(inputs))
 
     def get_block_as_pandas(self, name: str, scenario: str = "baseline"):
         """Return one block converted to a pandas object.
@@ -1246,6 +1401,39 @@ class CoreModel:
 
         return data
 
+    @staticmethod
+    def _exploded_index(accounts: pd.Index, contributors: pd.Index, *, outer_name: str) -> pd.MultiIndex:
+        """Return the ``(account, *contributor)`` row index of an exploded block.
+
+        The index is built from integer codes, without materializing one
+        label tuple per row.
+        """
+        account_codes, account_levels = pd.factorize(accounts)
+        if isinstance(contributors, pd.MultiIndex):
+            inner_codes = list(contributors.codes)
+            inner_levels = list(contributors.levels)
+            inner_names = list(contributors.names)
+        else:
+            codes, uniques = pd.factorize(contributors)
+            inner_codes, inner_levels, inner_names = [codes], [uniques], [contributors.name]
+        repeat = len(contributors)
+        return pd.MultiIndex(
+            levels=[account_levels, *inner_levels],
+            codes=[np.repeat(account_codes, repeat), *(np.tile(codes, len(accounts)) for codes in inner_codes)],
+            names=[outer_name, *inner_names],
+            verify_integrity=False,
+        )
+
+    @staticmethod
+    def _aligned_transfer(direct: pd.DataFrame, transfer: pd.DataFrame) -> pd.DataFrame:
+        """Return ``transfer`` rows aligned to the columns of ``direct``."""
+        missing = direct.columns.difference(transfer.index)
+        if len(missing):
+            raise WrongInput(
+                f"direct columns are not aligned with transfer index. Missing labels in transfer: {list(missing)}"
+            )
+        return transfer.loc[direct.columns, :]
+
     @staticmethod
     def _explode_with_left_diagonal(
         direct: pd.DataFrame,
@@ -1266,31 +1454,79 @@ class CoreModel:
         if direct.shape[0] == 0:
             return pd.DataFrame(columns=transfer.columns)
 
-        missing = direct.columns.difference(transfer.index)
-        if len(missing):
-            raise WrongInput(
-                f"direct columns are not aligned with transfer index. Missing labels in transfer: {list(missing)}"
-            )
+        aligned_transfer = CoreModel._aligned_transfer(direct, transfer)
+        values = dense_values(direct)[:, :, None] * dense_values(aligned_transfer)[None, :, :]
+        return pd.DataFrame(
+            values.reshape(-1, aligned_transfer.shape[1]),
+            index=CoreModel._exploded_index(direct.index, aligned_transfer.index, outer_name=outer_name),
+            columns=aligned_transfer.columns,
+        )
 
-        aligned_transfer = transfer.loc[direct.columns, :]
+    @staticmethod
+    def _iter_left_diagonal_chunks(
+        direct: pd.DataFrame,
+        transfer: pd.DataFrame,
+        *,
+        chunk_size: int | None = None,
+        threshold: float | None = None,
+    ):
+        """Yield ``(account position, start, stop, values)`` chunks of one exploded block.
 
-        blocks = []
-        for account, weights in direct.iterrows():
-            exploded = aligned_transfer.mul(weights, axis=0)
-            if isinstance(exploded.index, pd.MultiIndex):
-                exploded_index = pd.MultiIndex.from_tuples(
-                    [(account, *idx) for idx in exploded.index.tolist()],
-                    names=[outer_name, *exploded.index.names],
-                )
+        ``values`` holds rows ``start:stop`` of ``diag(direct_i) @ transfer``
+        for the account at that position; cells below ``threshold`` in
+        absolute value are zeroed. Only one chunk is held at a time.
+        """
+        aligned_transfer = CoreModel._aligned_transfer(direct, transfer)
+        weights = dense_values(direct)
+        transfer_values = dense_values(aligned_transfer)
+        contributor_count = transfer_values.shape[0]
+        step = contributor_count if chunk_size is None else chunk_size
+        for position in range(weights.shape[0]):
+            for start in range(0, contributor_count, max(1, step)):
+                stop = min(start + step, contributor_count)
+                values = transfer_values[start:stop] * weights[position, start:stop, None]
+                if threshold is not None:
+                    values[np.abs(values) < threshold] = 0.0
+                yield position, start, stop, values
+
+    @staticmethod
+    def _explode_parts(parts, *, outer_name: str) -> pd.DataFrame:
+        """Explode and stack the ``(direct, transfer)`` parts of one exploded matrix."""
+        blocks = [
+            CoreModel._explode_with_left_diagonal(direct, transfer, outer_name=outer_name)
+            for direct, transfer in parts
+        ]
+        return blocks[0] if len(blocks) == 1 else pd.concat(blocks, axis=0)
+
+    def _exploded_parts(self, matrix: str, selection, *, scenario: str, factored: bool = False):
+        """Return the ``(direct, transfer)`` parts and outer level of one exploded matrix.
+
+        ``selection`` restricts the satellite accounts (``f`` family) or
+        factors of production (``m`` family) to explode. SUT matrices have an
+        activity part and a commodity part, stacked in that order. With
+        ``factored``, the activity transfer of the commodity side is returned
+        as the pair ``(s, wcc)`` instead of their product.
+        """
+        self._validate_scenario(scenario)
+        if matrix.startswith("f"):
+            direct_names, label, outer_name = (_ENUM.e, "ea", "ec"), "satellite accounts", _MASTER_INDEX["k"]
+        else:
+            direct_names, label, outer_name = (_ENUM.v, "va", "vc"), "factors of production", _MASTER_INDEX["f"]
+
+        if matrix in ("f_ex", "m_ex"):
+            directs = [self.query(direct_names[0], scenarios=[scenario])]
+            transfers = [self.query("w", scenarios=[scenario])]
+        else:
+            directs = [self.query(name, scenarios=[scenario]) for name in direct_names[1:]]
+            if matrix in ("fa_ex", "ma_ex"):
+                transfers = [self.query(name, scenarios=[scenario]) for name in ("waa", "wca")]
             else:
-                exploded_index = pd.MultiIndex.from_arrays(
-                    [[account] * len(exploded.index), exploded.index.tolist()],
-                    names=[outer_name, exploded.index.name],
-                )
-            exploded.index = exploded_index
-            blocks.append(exploded)
+                s = self.query("s", scenarios=[scenario])
+                wcc = self.query("wcc", scenarios=[scenario])
+                transfers = [(s, wcc) if factored else s.dot(wcc), wcc]
 
-        return pd.concat(blocks, axis=0)
+        selected = self._normalize_exploded_selector(selection, available=directs[0].index, label=label)
+        return [(direct.loc[selected], transfer) for direct, transfer in zip(directs, transfers)], outer_name
 
     @staticmethod
     def _explode_with_summed_rows(
@@ -1368,19 +1604,8 @@ class CoreModel:
         """
         if self.table_type != "IOT":
             raise WrongInput("f_ex is only available for IOT. Use fa_ex or fc_ex for SUT.")
-        self._validate_scenario(scenario)
-        e = self.query(_ENUM.e, scenarios=[scenario])
-        w = self.query("w", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            satellite_accounts,
-            available=e.index,
-            label="satellite accounts",
-        )
-        return self._explode_with_left_diagonal(
-            e.loc[selected],
-            w,
-            outer_name=_MASTER_INDEX["k"],
-        )
+        parts, outer_name = self._exploded_parts("f_ex", satellite_accounts, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
 
     def fa_ex(
         self,
@@ -1410,27 +1635,8 @@ class CoreModel:
         """
         if self.table_type != "SUT":
             raise WrongInput("fa_ex is only available for SUT. Use f_ex for IOT.")
-        self._validate_scenario(scenario)
-        ea = self.query("ea", scenarios=[scenario])
-        ec = self.query("ec", scenarios=[scenario])
-        waa = self.query("waa", scenarios=[scenario])
-        wca = self.query("wca", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            satellite_accounts,
-            available=ea.index,
-            label="satellite accounts",
-        )
-        activity = self._explode_with_left_diagonal(
-            ea.loc[selected],
-            waa,
-            outer_name=_MASTER_INDEX["k"],
-        )
-        commodity = self._explode_with_left_diagonal(
-            ec.loc[selected],
-            wca,
-            outer_name=_MASTER_INDEX["k"],
-        )
-        return pd.concat([activity, commodity], axis=0)
+        parts, outer_name = self._exploded_parts("fa_ex", satellite_accounts, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
 
     def fc_ex(
         self,
@@ -1460,28 +1666,8 @@ class CoreModel:
         """
         if self.table_type != "SUT":
             raise WrongInput("fc_ex is only available for SUT. Use f_ex for IOT.")
-        self._validate_scenario(scenario)
-        ea = self.query("ea", scenarios=[scenario])
-        ec = self.query("ec", scenarios=[scenario])
-        s = self.query("s", scenarios=[scenario])
-        wcc = self.query("wcc", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            satellite_accounts,
-            available=ea.index,
-            label="satellite accounts",
-        )
-        transfer = s.dot(wcc)
-        activity = self._explode_with_left_diagonal(
-            ea.loc[selected],
-            transfer,
-            outer_name=_MASTER_INDEX["k"],
-        )
-        commodity = self._explode_with_left_diagonal(
-            ec.loc[selected],
-            wcc,
-            outer_name=_MASTER_INDEX["k"],
-        )
-        return pd.concat([activity, commodity], axis=0)
+        parts, outer_name = self._exploded_parts("fc_ex", satellite_accounts, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
 
     def m_ex(
         self,
@@ -1512,19 +1698,8 @@ class CoreModel:
         """
         if self.table_type != "IOT":
             raise WrongInput("m_ex is only available for IOT. Use ma_ex or mc_ex for SUT.")
-        self._validate_scenario(scenario)
-        v = self.query(_ENUM.v, scenarios=[scenario])
-        w = self.query("w", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            factors,
-            available=v.index,
-            label="factors of production",
-        )
-        return self._explode_with_left_diagonal(
-            v.loc[selected],
-            w,
-            outer_name=_MASTER_INDEX["f"],
-        )
+        parts, outer_name = self._exploded_parts("m_ex", factors, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
 
     def ma_ex(
         self,
@@ -1554,27 +1729,8 @@ class CoreModel:
         """
         if self.table_type != "SUT":
             raise WrongInput("ma_ex is only available for SUT. Use m_ex for IOT.")
-        self._validate_scenario(scenario)
-        va = self.query("va", scenarios=[scenario])
-        vc = self.query("vc", scenarios=[scenario])
-        waa = self.query("waa", scenarios=[scenario])
-        wca = self.query("wca", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            factors,
-            available=va.index,
-            label="factors of production",
-        )
-        activity = self._explode_with_left_diagonal(
-            va.loc[selected],
-            waa,
-            outer_name=_MASTER_INDEX["f"],
-        )
-        commodity = self._explode_with_left_diagonal(
-            vc.loc[selected],
-            wca,
-            outer_name=_MASTER_INDEX["f"],
-        )
-        return pd.concat([activity, commodity], axis=0)
+        parts, outer_name = self._exploded_parts("ma_ex", factors, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
 
     def mc_ex(
         self,
@@ -1604,28 +1760,166 @@ class CoreModel:
         """
         if self.table_type != "SUT":
             raise WrongInput("mc_ex is only available for SUT. Use m_ex for IOT.")
-        self._validate_scenario(scenario)
-        va = self.query("va", scenarios=[scenario])
-        vc = self.query("vc", scenarios=[scenario])
-        s = self.query("s", scenarios=[scenario])
-        wcc = self.query("wcc", scenarios=[scenario])
-        selected = self._normalize_exploded_selector(
-            factors,
-            available=va.index,
-            label="factors of production",
-        )
-        transfer = s.dot(wcc)
-        activity = self._explode_with_left_diagonal(
-            va.loc[selected],
-            transfer,
-            outer_name=_MASTER_INDEX["f"],
+        parts, outer_name = self._exploded_parts("mc_ex", factors, scenario=scenario)
+        return self._explode_parts(parts, outer_name=outer_name)
+
+    def _exploded_stream(self, matrix: str, accounts, *, scenario: str, chunk_size, threshold):
+        """Validate a streaming request and return the parts and outer level to explode."""
+        table = _EXPLODED_TABLES.get(matrix)
+        if table is None:
+            raise WrongInput(f"matrix should be one of {list(_EXPLODED_TABLES)}.")
+        if self.table_type != table:
+            raise WrongInput(f"{matrix} is only available for {table}.")
+        if chunk_size is not None and (
+            isinstance(chunk_size, bool) or not isinstance(chunk_size, (int, np.integer)) or chunk_size < 1
+        ):
+            raise WrongInput("chunk_size should be a positive integer or None.")
+        if threshold is not None and not threshold >= 0:
+            raise WrongInput("threshold should be a non-negative number or None.")
+        return self._exploded_parts(matrix, accounts, scenario=scenario)
+
+    def iter_exploded(
+        self,
+        matrix: str,
+        *,
+        accounts=None,
+        scenario: str = "baseline",
+        chunk_size: int | None = None,
+        threshold: float | None = None,
+    ):
+        """Yield an exploded multiplier matrix one account at a time.
+
+        This is the streaming form of :meth:`f_ex`, :meth:`m_ex` and their SUT
+        variants: only the chunk being yielded is held in memory instead of
+        the whole ``(accounts x contributors) x products`` matrix.
+
+        Parameters
+        ----------
+        matrix:
+            One of ``"f_ex"``, ``"m_ex"`` (IOT), ``"fa_ex"``, ``"fc_ex"``,
+            ``"ma_ex"`` or ``"mc_ex"`` (SUT).
+        accounts:
+            Optional subset of satellite accounts (``f`` family) or factors
+            of production (``m`` family) to explode.
+        scenario:
+            Scenario used to read source matrices.
+        chunk_size:
+            Optional number of contributor rows per yielded block. By default
+            every account is yielded whole.
+        threshold:
+            Optional magnitude below which contributor-to-product cells are
+            dropped. When given, blocks are yielded as sparse dataframes that
+            only store the significant cells.
+
+        Yields
+        ------
+        pandas.DataFrame
+            Consecutive row blocks of the exploded matrix, in the row order of
+            the method form; stacking them gives the same matrix.
+        """
+        from scipy import sparse
+
+        from mario.compute.helpers import sparse_frame_from_spmatrix
+
+        parts, outer_name = self._exploded_stream(
+            matrix,
+            accounts,
+            scenario=scenario,
+            chunk_size=chunk_size,
+            threshold=threshold,
         )
-        commodity = self._explode_with_left_diagonal(
-            vc.loc[selected],
-            wcc,
-            outer_name=_MASTER_INDEX["f"],
+        for direct, transfer in parts:
+            for position, start, stop, values in self._iter_left_diagonal_chunks(
+                direct,
+                transfer,
+                chunk_size=chunk_size,
+                threshold=threshold,
+            ):
+                index = self._exploded_index(
+                    direct.index[position : position + 1],
+                    direct.columns[start:stop],
+                    outer_name=outer_name,
+                )
+                if threshold is None:
+                    yield pd.DataFrame(values, index=index, columns=transfer.columns)
+                else:
+                    yield sparse_frame_from_spmatrix(sparse.csr_matrix(values), index=index, columns=transfer.columns)
+
+    def exploded_to_parquet(
+        self,
+        matrix: str,
+        path,
+        *,
+        accounts=None,
+        scenario: str = "baseline",
+        chunk_size: int | None = None,
+        threshold: float | None = None,
+    ):
+        """Stream an exploded multiplier matrix to a sparse Parquet file.
+
+        The matrix is written chunk by chunk as COO triplets, in the same
+        layout as sparse blocks written by :meth:`to_parquet`, so it can be
+        read back with ``read_coo_parquet`` (optionally filtered on accounts)
+        without ever being built in memory.
+
+        Parameters
+        ----------
+        matrix:
+            One of ``"f_ex"``, ``"m_ex"`` (IOT), ``"fa_ex"``, ``"fc_ex"``,
+            ``"ma_ex"`` or ``"mc_ex"`` (SUT).
+        path:
+            Target ``.parquet`` file.
+        accounts:
+            Optional subset of satellite accounts or factors of production.
+        scenario:
+            Scenario used to read source matrices.
+        chunk_size:
+            Optional number of contributor rows computed at once.
+        threshold:
+            Optional magnitude below which cells are not written.
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written file.
+        """
+        from pathlib import Path
+
+        from scipy import sparse
+
+        from mario.storage.sparse_parquet import CooParquetWriter
+
+        parts, outer_name = self._exploded_stream(
+            matrix,
+            accounts,
+            scenario=scenario,
+            chunk_size=chunk_size,
+            threshold=threshold,
         )
-        return pd.concat([activity, commodity], axis=0)
+        part_indexes = [
+            self._exploded_index(direct.index, direct.columns, outer_name=outer_name) for direct, _ in parts
+        ]
+        index = part_indexes[0] if len(part_indexes) == 1 else part_indexes[0].append(part_indexes[1:])
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        writer = CooParquetWriter(path, index=index, columns=parts[0][1].columns)
+        try:
+            offset = 0
+            for (direct, transfer), part_index in zip(parts, part_indexes):
+                contributor_count = len(direct.columns)
+                for position, start, _, values in self._iter_left_diagonal_chunks(
+                    direct,
+                    transfer,
+                    chunk_size=chunk_size,
+                    threshold=threshold,
+                ):
+                    writer.write(sparse.csr_matrix(values), row_offset=offset + position * contributor_count + start)
+                offset += len(part_index)
+        finally:
+            writer.close()
+        log_time(logger, f"Database: {matrix} streamed to {path}.", "info")
+        return path
 
     def p_ex(
         self,
@@ -1772,14 +2066,17 @@ class CoreModel:
         Notes
         -----
         ``update_scenarios(...)`` is a low-level storage operation. It does
-        not create a new scenario, does not recompute dependent matrices and
-        does not clear already materialized derived matrices automatically.
-
-        This means that manual scenario edits are safest when paired with
-        either :meth:`reset_to_flows` or :meth:`reset_to_coefficients` before
+        not create a new scenario and does not recompute dependent matrices.
+        Matrices that MARIO computed from an updated block (for example ``X``,
+        ``z`` or ``F`` after a ``Y`` update) are dropped from the scenario, so
+        the next query rebuilds only those dependents. Matrices that were
+        parsed or stored by the user are never dropped.
+
+        Manual scenario edits are still clearest when paired with either
+        :meth:`reset_to_flows` or :meth:`reset_to_coefficients` before
         changing the selected blocks. Those reset methods collapse the scenario
-        to one consistent storage mode and avoid keeping stale derived
-        matrices around.
+        to one consistent storage mode, so it is explicit which side of the
+        model the update propagates through.
 
         When preparing an editable matrix taken from the database, use
         ``.copy()`` before mutating it. For example, ``Z = db.Z.copy()`` or
@@ -2950,7 +3247,10 @@ class CoreModel:
         if target_name in self.scenarios or target_name in self._storage_scenarios():
             raise WrongInput(f"{target_name} already exists and cannot be overwritten.")
 
-        self.matrices[target_name] = copy.deepcopy(self[scenario])
+        # Blocks are shared copy-on-write with the source scenario: memory is
+        # only duplicated for the blocks later written on either side.
+        self.matrices[target_name] = _share_matrices(self[scenario])
+        self._share_lineage(scenario, target_name, self.matrices[target_name])
         self.meta._add_history(
             f"Scenarios: {target_name} added to scenarios by cloning {self._public_scenario_name(scenario)}"
         )
@@ -3014,6 +3314,10 @@ class CoreModel:
             raise WrongInput(f"{target_name} already exists and cannot be overwritten.")
 
         self.matrices[target_name] = self.matrices.pop(resolved_scenario)
+        for state in ("_versions", "_lineage"):
+            tracked = self.__dict__.get(state, {})
+            if resolved_scenario in tracked:
+                tracked[target_name] = tracked.pop(resolved_scenario)
         self.meta._add_history(
             f"Scenarios: {self._public_scenario_name(resolved_scenario)} renamed to {target_name}"
         )
@@ -3068,6 +3372,7 @@ class CoreModel:
 
         log_time(logger, "Databases: reset to flows.")
         self.matrices[scenario] = matrices
+        self._block_lineage(scenario).clear()
 
     def reset_to_coefficients(self, scenario):
         """Reset a scenario so only coefficient-side matrices remain materialized.
@@ -3117,6 +3422,7 @@ class CoreModel:
 
         log_time(logger, "Databases: reset to coefficients.")
         self.matrices[scenario] = matrices
+        self._block_lineage(scenario).clear()
 
     def change_assumption(self, tech_assumption: str) -> None:
         """Change the structural SUT technology assumption.
@@ -3455,13 +3761,33 @@ class CoreModel:
     def copy(self):
         """Return a deep copy of the database object.
 
+        Matrices are shared copy-on-write with the original object: the copy
+        behaves as fully independent, but a block is only duplicated in
+        memory once either object writes to it.
+
         Returns
         -------
         CoreModel
             Independent copy of the current object with copied matrices,
             indices, units and metadata.
         """
-        new = copy.deepcopy(self)
+        matrices = self.matrices
+        backup = self.__dict__.pop("_backup", None)
+        self.matrices = {}
+        try:
+            new = copy.deepcopy(self)
+        finally:
+            self.matrices = matrices
+            if backup is not None:
+                self._backup = backup
+        new.matrices = {scenario: _share_matrices(blocks) for scenario, blocks in matrices.items()}
+        new.__dict__.pop("_lineage", None)
+        for scenario, blocks in new.matrices.items():
+            self._share_lineage(scenario, scenario, blocks, model=new)
+        if backup is not None:
+            new._backup = backup._replace(
+                matrices={scenario: _share_matrices(blocks) for scenario, blocks in backup.matrices.items()}
+            )
         new.meta._add_history("deep copy created from object")
         return new
 
@@ -3964,8 +4290,14 @@ class CoreModel:
                 raise AttributeError(attr)
 
     def __getstate__(self):
-        """Return the instance state for pickle serialization."""
-        return self.__dict__
+        """Return the instance state for pickle serialization.
+
+        Block lineage holds weak references and is not pickled; unpickled
+        databases treat every stored block as user data.
+        """
+        state = dict(self.__dict__)
+        state.pop("_lineage", None)
+        return state
 
     def __setstate__(self, value):
         """Restore the instance state after pickle deserialization."""
@@ -3991,13 +4323,59 @@ class CoreModel:
     def backup(self):
         """Store a deep-copy backup of matrices, indexes and units.
 
+        Matrices are kept as copy-on-write handles, so the backup costs no
+        extra memory until the live blocks are modified.
+
         Returns
         -------
         None
             Backup data is stored on ``self._backup``.
         """
         self._backup = self._backup_(
-            copy.deepcopy(self.matrices),
+            {scenario: _share_matrices(blocks) for scenario, blocks in self.matrices.items()},
             copy.deepcopy(self._indeces),
             copy.deepcopy(self.units),
         )
+
+    def memory_report(self):
+        """Return the memory owned and shared by every scenario.
+
+        Scenarios created with :meth:`clone_scenario`, :meth:`copy` or
+        :meth:`backup` share unchanged blocks with their source. Each buffer is
+        counted once, as owned by the first scenario (in storage order) that
+        holds it; later scenarios report it as shared.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per scenario with the number of blocks, the number of
+            fully shared blocks, and the owned and shared bytes.
+        """
+        seen = set()
+        rows = {}
+        for scenario, blocks in self.matrices.items():
+            owned_bytes = shared_bytes = shared_blocks = 0
+            for value in blocks.values():
+                buffers = block_buffers(value)
+                block_shared = bool(buffers)
+                for key, nbytes in buffers:
+                    if key in seen:
+                        shared_bytes += nbytes
+                    else:
+                        seen.add(key)
+                        owned_bytes += nbytes
+                        block_shared = False
+                shared_blocks += int(block_shared)
+            rows[self._public_scenario_name(scenario)] = {
+                "blocks": len(blocks),
+                "shared_blocks": shared_blocks,
+                "owned_bytes": owned_bytes,
+                "shared_bytes": shared_bytes,
+            }
+        report = pd.DataFrame.from_dict(
+            rows,
+            orient="index",
+            columns=["blocks", "shared_blocks", "owned_bytes", "shared_bytes"],
+        )
+        report.index.name = "Scenario"
+        return report
@@ -67,9 +67,14 @@ from mario.compute.primitives import (
     calc_all_shock,
     calc_X,
     linkages_calculation,
+    linkages_calculation_solve,
 )
-from mario.compute.helpers import dense_values
+from mario.compute.factorization import model_factorization_cache
+from mario.compute.helpers import as_column_frame, dense_values, sum_final_demand
+from mario.compute.lowrank import build_woodbury_solver, residual_is_small
 from mario.compute.ordering import SUTUnifiedOrderingPolicy
+from mario.compute.spa import csc_values as spa_csc_values, structural_paths
+from mario.compute.runtime import should_prefer_solve_for_iot_target
 from mario.compute.views import (
     concat_sut_Y,
     concat_sut_b,
@@ -87,6 +92,7 @@ import copy
 import os
 import tempfile
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 import plotly.express as px
@@ -95,8 +101,14 @@ import plotly.graph_objects as go
 
 from mario.model.conventions import MATRIX_TITLES, TABLE_LEVELS
 from mario.model.conventions import _MASTER_INDEX, _ENUM
+from mario.model.labels import PRODUCTION_LABEL
 
-from mario.api.core_model import CoreModel, _normalize_parsed_matrix_name, _prune_eager_parser_blocks
+from mario.api.core_model import (
+    CoreModel,
+    _build_resolution_context,
+    _normalize_parsed_matrix_name,
+    _prune_eager_parser_blocks,
+)
 from mario.ops import (
     aggregate_database,
     build_new_instance_from_scenario,
@@ -123,6 +135,50 @@ except ModuleNotFoundError:
     __cvxpy__ = False
 
 
+@dataclass(frozen=True)
+class _TradeContentWeights:
+    """Contributor-by-traded-item content weights kept in factored form.
+
+    The weight matrix is the sum of ``diag(scale) @ transfer`` over ``terms``;
+    a term without ``transfer`` is ``diag(scale)`` on the traded items
+    themselves, and a ``(left, right)`` pair stands for ``left @ right``,
+    applied right to left. ``index`` is the contributor axis of the full
+    matrix, which is never built.
+    """
+
+    index: pd.Index
+    terms: tuple
+
+    def contributions(self, items: pd.Index, flows: np.ndarray) -> np.ndarray:
+        """Return ``weights[:, items] @ flows`` as a contributor-by-column array."""
+        result = np.zeros((len(self.index), flows.shape[1]))
+        for scale, transfer in self.terms:
+            if transfer is None:
+                positions = scale.index.get_indexer(items)
+                found = positions >= 0
+                rows = self.index.get_indexer(items[found])
+                values = dense_values(scale)[positions[found], None] * flows[found]
+                np.add.at(result, rows, values)
+                continue
+
+            left, right = transfer if isinstance(transfer, tuple) else (None, transfer)
+            # Flows are spread over the transfer columns rather than slicing
+            # the transfer, which would copy it.
+            positions = right.columns.get_indexer(items)
+            found = positions >= 0
+            spread = np.zeros((right.shape[1], flows.shape[1]))
+            np.add.at(spread, positions[found], flows[found])
+            values = dense_values(right) @ spread
+            if left is not None:
+                values = dense_values(left) @ values
+            contributors = right.index if left is None else left.index
+            values *= dense_values(scale.reindex(contributors, fill_value=0.0))[:, None]
+            rows = self.index.get_indexer(contributors)
+            kept = rows >= 0
+            result[rows[kept]] += values[kept]
+        return result
+
+
 class Database(CoreModel):
     """Main user-facing database class."""
 
@@ -568,9 +624,14 @@ class Database(CoreModel):
         notes=None,
         tol: float = 1e-8,
         max_iter: int = 1000,
+        method: str = "auto",
     ):
         """Balance the ``Z`` block of one IOT scenario with the RAS method.
 
+        The balancing runs on row and column scaling vectors and keeps sparse
+        ``Z`` blocks sparse, so large tables are balanced without a dense copy
+        per iteration.
+
         Parameters
         ----------
         target_rows:
@@ -591,6 +652,9 @@ class Database(CoreModel):
             Absolute convergence tolerance passed to :func:`mario.ras`.
         max_iter:
             Maximum number of RAS iterations.
+        method:
+            ``"ras"``, ``"gras"`` (generalized RAS for ``Z`` blocks with
+            negative entries) or ``"auto"`` to pick GRAS only when needed.
 
         Returns
         -------
@@ -611,17 +675,20 @@ class Database(CoreModel):
                 notes=notes,
                 tol=tol,
                 max_iter=max_iter,
+                method=method,
             )
             return new
 
         self._validate_scenario(scenario)
 
-        balanced_Z = ras_balance_matrix(
+        balanced_Z, diagnostics = ras_balance_matrix(
             self._get_matrix(_ENUM.Z, scenario=scenario, auto_calc=True),
             target_rows=target_rows,
             target_cols=target_cols,
             tol=tol,
             max_iter=max_iter,
+            method=method,
+            return_diagnostics=True,
         )
 
         self.reset_to_flows(scenario=scenario)
@@ -630,10 +697,11 @@ class Database(CoreModel):
         if calc_all:
             self.calc_all(scenario=scenario)
 
-        log_time(logger, f"Database: {scenario} balanced with RAS.")
+        label = diagnostics.method.upper()
+        log_time(logger, f"Database: {scenario} balanced with {label} in {diagnostics.iterations} iterations.")
         self.meta._add_history(
-            f"Database: scenario '{scenario}' balanced with RAS on Z "
-            f"(tol={tol}, max_iter={max_iter})."
+            f"Database: scenario '{scenario}' balanced with {label} on Z "
+            f"(tol={tol}, max_iter={max_iter}, iterations={diagnostics.iterations})."
         )
 
         if notes:
@@ -1726,6 +1794,8 @@ class Database(CoreModel):
         normalized=True,
         cut_diag=True,
         multi_mode=True,
+        matrix_free=None,
+        compute_options=None,
     ):
         r"""Calculate backward and forward linkages for one scenario.
 
@@ -1741,6 +1811,21 @@ class Database(CoreModel):
         multi_mode:
             When ``True``, preserve the multi-regional interpretation of the
             linkages. This is valid only for multi-regional databases.
+        matrix_free:
+            When ``True``, compute total linkages by solving ``(I - z)`` and
+            ``(I - b)`` systems against vectors of ones (one region indicator
+            per region in multi-regional mode) instead of querying the dense
+            ``w`` and ``g`` inverses. When ``None`` (default), the matrix-free
+            path is used unless ``w`` and ``g`` are already materialized or
+            the runtime compute method favours explicit inverses; the picked
+            mode is logged at info level. With ``cut_diag=True`` the
+            matrix-free path still needs the diagonals of both inverses,
+            which costs ``2n`` solves against identity columns (``n`` for
+            ``w`` and ``n`` for ``g``), about as much as building both
+            inverses without keeping them in memory.
+        compute_options:
+            Optional advanced compute options payload used to steer the
+            matrix-free solves.
 
         Returns
         -------
@@ -1763,6 +1848,56 @@ class Database(CoreModel):
                 "multi_mode option is valid only for mult-regional data"
             )
 
+        context = _build_resolution_context(compute_options=compute_options)
+        if matrix_free is None:
+            inverses = (
+                [_ENUM.w, "gcc", "gca", "gac", "gaa"]
+                if self.meta.table == "SUT"
+                else [_ENUM.w, _ENUM.g]
+            )
+            size = len(self.query(_ENUM.z, scenarios=scenario).index)
+            matrix_free = not all(
+                self.has_matrix(name, scenario=scenario) for name in inverses
+            ) and should_prefer_solve_for_iot_target(
+                _ENUM.w,
+                size=size,
+                context=context,
+            )
+            if not matrix_free:
+                cost = "reading the w and g inverses"
+            elif cut_diag:
+                cost = f"{2 * size} identity-column solves for the w and g diagonals"
+            else:
+                cost = "one transposed and one direct solve"
+            log_time(
+                logger,
+                f"Linkages: {'matrix-free' if matrix_free else 'explicit-inverse'} mode picked on "
+                f"{scenario} ({cost}); pass matrix_free explicitly to override.",
+            )
+
+        if matrix_free:
+            from mario.compute.resolver import Resolver
+
+            if self.meta.table == "SUT":
+                blocks = self.query(matrices=[_ENUM.z, "bu", "bs"], scenarios=scenario)
+                ordering = SUTUnifiedOrderingPolicy.from_blocks(
+                    z=blocks[_ENUM.z], bu=blocks["bu"], bs=blocks["bs"]
+                )
+                z = blocks[_ENUM.z]
+                b = concat_sut_b(blocks["bu"], blocks["bs"], ordering)
+            else:
+                blocks = self.query(matrices=[_ENUM.z, _ENUM.b], scenarios=scenario)
+                z, b = blocks[_ENUM.z], blocks[_ENUM.b]
+            return linkages_calculation_solve(
+                cut_diag=cut_diag,
+                z=z,
+                b=b,
+                multi_mode=multi_mode,
+                normalized=normalized,
+                context=context,
+                resolver=Resolver(self, scenario=scenario, context=context),
+            )
+
         if self.meta.table == "SUT":
             blocks = self.query(
                 matrices=[_ENUM.w, _ENUM.z, "bu", "bs", "gcc", "gca", "gac", "gaa"],
@@ -2167,7 +2302,11 @@ class Database(CoreModel):
         method: str,
         use_activity_side: bool,
     ) -> tuple[pd.Series, str]:
-        """Resolve row weights for one trade-content indicator and method."""
+        """Resolve row weights for one trade-content indicator and method.
+
+        Total weights of a single indicator are resolved row-selectively, so
+        the full ``f``/``m`` multipliers are never computed for them.
+        """
         if self.meta.table == "IOT":
             factor_direct, factor_total = _ENUM.v, _ENUM.m
             satellite_direct, satellite_total = _ENUM.e, _ENUM.f
@@ -2188,12 +2327,12 @@ class Database(CoreModel):
             unit = unit_values[0] if len(unit_values) == 1 else "Value"
         elif indicator in factor_units.index:
             direct_row = self.query(matrices=[factor_direct], scenarios=[scenario]).loc[indicator]
-            total_row = self.query(matrices=[factor_total], scenarios=[scenario]).loc[indicator]
+            total_row = self.resolve(factor_total, scenario=scenario, rows=[indicator]).loc[indicator]
             unit_value = factor_units.loc[indicator, "unit"]
             unit = str(unit_value) if pd.notna(unit_value) else "Value"
         elif indicator in satellite_units.index:
             direct_row = self.query(matrices=[satellite_direct], scenarios=[scenario]).loc[indicator]
-            total_row = self.query(matrices=[satellite_total], scenarios=[scenario]).loc[indicator]
+            total_row = self.resolve(satellite_total, scenario=scenario, rows=[indicator]).loc[indicator]
             unit_value = satellite_units.loc[indicator, "unit"]
             unit = str(unit_value) if pd.notna(unit_value) else "Value"
         else:
@@ -2213,37 +2352,33 @@ class Database(CoreModel):
         *,
         scenario,
         use_activity_side: bool,
-    ) -> tuple[pd.DataFrame, str]:
-        """Resolve exploded total content weights for contributor breakdowns."""
+    ) -> tuple[_TradeContentWeights, str]:
+        """Resolve exploded total content weights for contributor breakdowns.
+
+        The weights are ``diag(direct) @ transfer`` for every part of the
+        matching exploded matrix (see :meth:`f_ex`), kept factored down to
+        the ``s @ wcc`` transfer of the commodity side.
+        """
         if self.meta.table == "IOT":
-            factor_total = self.m_ex
-            satellite_total = self.f_ex
+            factor_total, satellite_total = "m_ex", "f_ex"
         elif use_activity_side:
-            factor_total = self.ma_ex
-            satellite_total = self.fa_ex
+            factor_total, satellite_total = "ma_ex", "fa_ex"
         else:
-            factor_total = self.mc_ex
-            satellite_total = self.fc_ex
+            factor_total, satellite_total = "mc_ex", "fc_ex"
 
         factor_units = self.units[_MASTER_INDEX["f"]]
         satellite_units = self.units[_MASTER_INDEX["k"]]
 
         if self._is_total_value_added_indicator(indicator):
-            exploded = factor_total(scenario=scenario)
-            exploded = exploded.groupby(
-                level=list(range(1, exploded.index.nlevels)),
-                sort=False,
-            ).sum()
+            parts, _ = self._exploded_parts(factor_total, None, scenario=scenario, factored=True)
             unit_values = factor_units["unit"].dropna().astype(str).unique().tolist()
             unit = unit_values[0] if len(unit_values) == 1 else "Value"
-            return exploded, unit
-
-        if indicator in factor_units.index:
-            exploded = factor_total(factors=[indicator], scenario=scenario)
+        elif indicator in factor_units.index:
+            parts, _ = self._exploded_parts(factor_total, [indicator], scenario=scenario, factored=True)
             unit_value = factor_units.loc[indicator, "unit"]
             unit = str(unit_value) if pd.notna(unit_value) else "Value"
         elif indicator in satellite_units.index:
-            exploded = satellite_total(satellite_accounts=[indicator], scenario=scenario)
+            parts, _ = self._exploded_parts(satellite_total, [indicator], scenario=scenario, factored=True)
             unit_value = satellite_units.loc[indicator, "unit"]
             unit = str(unit_value) if pd.notna(unit_value) else "Value"
         else:
@@ -2251,16 +2386,19 @@ class Database(CoreModel):
                 "indicator should be a Satellite account row, a Factor of production row, or 'total value added'."
             )
 
-        return exploded.droplevel(0), unit
+        terms = []
+        for direct, transfer in parts:
+            contributors = transfer[0].index if isinstance(transfer, tuple) else transfer.index
+            missing = direct.columns.difference(contributors)
+            if len(missing):
+                raise WrongInput(
+                    f"direct columns are not aligned with transfer index. Missing labels in transfer: {list(missing)}"
+                )
+            terms.append((direct.sum(axis=0), transfer))
 
-    @staticmethod
-    def _explode_trade_content_direct_row(direct_row: pd.Series) -> pd.DataFrame:
-        """Represent one direct content row as a contributor-by-traded-item matrix."""
-        return pd.DataFrame(
-            np.diag(direct_row.to_numpy()),
-            index=direct_row.index.copy(),
-            columns=direct_row.index.copy(),
-        )
+        contributors = [direct.columns for direct, _ in parts]
+        index = contributors[0] if len(contributors) == 1 else contributors[0].append(contributors[1:])
+        return _TradeContentWeights(index=index, terms=tuple(terms)), unit
 
     def _resolve_trade_content_exploded(
         self,
@@ -2269,29 +2407,33 @@ class Database(CoreModel):
         scenario,
         method: str,
         use_activity_side: bool,
-    ) -> tuple[pd.DataFrame, str]:
-        """Resolve contributor-level content weights for breakdown outputs."""
+    ) -> tuple[_TradeContentWeights, str]:
+        """Resolve contributor-level content weights for breakdown outputs.
+
+        Direct weights are a diagonal, so they are kept as the scaling vector
+        of the traded items rather than an item-by-item matrix.
+        """
         direct_row, unit = self._resolve_trade_content_row(
             indicator,
             scenario=scenario,
             method="direct",
             use_activity_side=use_activity_side,
         )
-        direct_exploded = self._explode_trade_content_direct_row(direct_row)
 
         if method == "direct":
-            return direct_exploded, unit
+            return _TradeContentWeights(index=direct_row.index, terms=((direct_row, None),)), unit
 
-        total_exploded, unit = self._resolve_trade_content_total_exploded(
+        total, unit = self._resolve_trade_content_total_exploded(
             indicator,
             scenario=scenario,
             use_activity_side=use_activity_side,
         )
 
         if method == "total":
-            return total_exploded, unit
+            return total, unit
 
-        return total_exploded.subtract(direct_exploded, fill_value=0.0), unit
+        index = total.index.join(direct_row.index, how="outer")
+        return _TradeContentWeights(index=index, terms=(*total.terms, (-direct_row, None))), unit
 
     @staticmethod
     def _select_trade_rows(matrix: pd.DataFrame, item=None) -> pd.DataFrame:
@@ -2328,60 +2470,56 @@ class Database(CoreModel):
         return matrix.loc[:, (slice(None), slice(None), selector)]
 
     @staticmethod
-    def _aggregate_trade_content_breakdown_matrix_by_region(
-        matrix: pd.DataFrame,
-        exploded_weights: pd.DataFrame,
-        item=None,
+    def _trade_content_breakdown_by_origin(
+        selected: pd.DataFrame,
+        weights: _TradeContentWeights,
+        destination_regions: list,
     ) -> pd.DataFrame:
-        """Break down row-oriented trade content by contributor and trade region pair."""
-        selected = Database._select_trade_rows(matrix, item)
+        """Break down selected trade rows by contributor, origin and destination region.
+
+        Each origin block is first summed by destination region, so the
+        weights only ever multiply an items-by-regions array.
+        """
         origin_regions = list(dict.fromkeys(selected.index.get_level_values(0).tolist()))
-        destination_regions = list(dict.fromkeys(matrix.columns.get_level_values(0).tolist()))
 
         frames = []
         for origin_region in origin_regions:
             origin_block = selected.loc[(origin_region, slice(None), slice(None)), :]
-            contribution = exploded_weights.reindex(columns=origin_block.index, fill_value=0.0).dot(
-                origin_block
-            )
-            contribution = contribution.T.groupby(level=0, sort=False).sum().T
-            contribution = contribution.reindex(columns=destination_regions, fill_value=0.0)
-
-            contribution.index = pd.MultiIndex.from_tuples(
-                [(origin_region, *idx) for idx in contribution.index.tolist()],
-                names=[_MASTER_INDEX["r"], *contribution.index.names],
+            flows = origin_block.T.groupby(level=0, sort=False).sum().T
+            flows = flows.reindex(columns=destination_regions, fill_value=0.0)
+            contribution = pd.DataFrame(
+                weights.contributions(origin_block.index, dense_values(flows)),
+                index=pd.MultiIndex.from_tuples(
+                    [(origin_region, *idx) for idx in weights.index.tolist()],
+                    names=[_MASTER_INDEX["r"], *weights.index.names],
+                ),
+                columns=flows.columns,
             )
             frames.append(contribution)
 
         return pd.concat(frames, axis=0)
 
+    @staticmethod
+    def _aggregate_trade_content_breakdown_matrix_by_region(
+        matrix: pd.DataFrame,
+        exploded_weights: _TradeContentWeights,
+        item=None,
+    ) -> pd.DataFrame:
+        """Break down row-oriented trade content by contributor and trade region pair."""
+        selected = Database._select_trade_rows(matrix, item)
+        destination_regions = list(dict.fromkeys(matrix.columns.get_level_values(0).tolist()))
+        return Database._trade_content_breakdown_by_origin(selected, exploded_weights, destination_regions)
+
     @staticmethod
     def _aggregate_trade_content_breakdown_supply_by_region(
         matrix: pd.DataFrame,
-        exploded_weights: pd.DataFrame,
+        exploded_weights: _TradeContentWeights,
         item=None,
     ) -> pd.DataFrame:
         """Break down supply-oriented trade content by contributor and trade region pair."""
         selected = Database._select_trade_supply_columns(matrix, item)
-        origin_regions = list(dict.fromkeys(selected.index.get_level_values(0).tolist()))
         destination_regions = list(dict.fromkeys(selected.columns.get_level_values(0).tolist()))
-
-        frames = []
-        for origin_region in origin_regions:
-            origin_block = selected.loc[(origin_region, slice(None), slice(None)), :]
-            contribution = exploded_weights.reindex(columns=origin_block.index, fill_value=0.0).dot(
-                origin_block
-            )
-            contribution = contribution.T.groupby(level=0, sort=False).sum().T
-            contribution = contribution.reindex(columns=destination_regions, fill_value=0.0)
-
-            contribution.index = pd.MultiIndex.from_tuples(
-                [(origin_region, *idx) for idx in contribution.index.tolist()],
-                names=[_MASTER_INDEX["r"], *contribution.index.names],
-            )
-            frames.append(contribution)
-
-        return pd.concat(frames, axis=0)
+        return Database._trade_content_breakdown_by_origin(selected, exploded_weights, destination_regions)
 
     @staticmethod
     def _aggregate_trade_content_breakdown_regions(
@@ -3461,11 +3599,15 @@ class Database(CoreModel):
             Maximum number of upstream ``z`` rounds included in the reported
             paths. ``0`` keeps only direct final-demand paths.
         cutoff:
-            Minimum absolute contribution required for one path to be kept and
-            expanded.
+            Minimum absolute contribution required for one path to be kept.
+            Subtrees are expanded while their total upstream content (the
+            total-intensity row times the path weight) can still reach the
+            cutoff.
         top_n:
             Optional cap on the number of returned paths after sorting by the
-            absolute contribution magnitude. Pass ``None`` to keep all paths.
+            absolute contribution magnitude. Only the best ``top_n`` paths are
+            retained during the traversal, and subtrees that cannot beat the
+            weakest retained path are skipped. Pass ``None`` to keep all paths.
         plot:
             Integrated plotting mode used when ``show_plot=True`` or when
             ``save_plot``/``path`` request output. Use ``"paths"`` for the
@@ -3576,34 +3718,30 @@ class Database(CoreModel):
         selected_total_y = selected_Y.sum(axis=1).reindex(z.index, fill_value=0.0)
         total_footprint = float(total_row.dot(selected_total_y))
 
-        upstream_cache = {}
-
-        def upstream_suppliers(node):
-            if node not in upstream_cache:
-                column = z.loc[:, node]
-                values = dense_values(column)
-                nonzero = np.flatnonzero(values)
-                upstream_cache[node] = [
-                    (z.index[index], float(values[index]))
-                    for index in nonzero
-                    if values[index] != 0
-                ]
-            return upstream_cache[node]
+        demand = np.column_stack(
+            [dense_values(selected_Y[column].reindex(z.index, fill_value=0.0)) for column in selected_Y.columns]
+        )
+        paths = structural_paths(
+            spa_csc_values(z),
+            dense_values(direct_row),
+            dense_values(total_row),
+            demand,
+            max_depth=max_depth,
+            cutoff=cutoff,
+            top_n=top_n,
+        )
 
         records = []
-
-        def explore(current_node, downstream_weight, path_nodes, depth, fd_column):
-            contribution = float(direct_row.loc[current_node] * downstream_weight)
-            if abs(contribution) < cutoff:
-                return
-
+        for spa_path in paths:
+            path_nodes = [z.index[node] for node in spa_path.nodes]
+            fd_column = selected_Y.columns[spa_path.demand_column]
             records.append(
                 {
                     "path": " -> ".join(
                         [*(self._format_spa_node(node) for node in path_nodes), f"FD: {self._format_spa_node(fd_column)}"]
                     ),
-                    "depth": depth,
-                    "contribution": contribution,
+                    "depth": spa_path.depth,
+                    "contribution": spa_path.contribution,
                     "indicator": str(indicator),
                     "scenario": scenario_name,
                     "final_demand": self._format_spa_node(fd_column),
@@ -3613,33 +3751,6 @@ class Database(CoreModel):
                 }
             )
 
-            if depth >= max_depth:
-                return
-
-            for upstream_node, coefficient in upstream_suppliers(current_node):
-                next_weight = float(coefficient * downstream_weight)
-                if next_weight == 0:
-                    continue
-                explore(
-                    upstream_node,
-                    next_weight,
-                    [upstream_node, *path_nodes],
-                    depth + 1,
-                    fd_column,
-                )
-
-        for fd_column in selected_Y.columns:
-            bundle = selected_Y[fd_column].reindex(z.index, fill_value=0.0)
-            values = dense_values(bundle)
-            nonzero = np.flatnonzero(values)
-
-            for index in nonzero:
-                demand_node = bundle.index[index]
-                demand_value = float(values[index])
-                if demand_value == 0:
-                    continue
-                explore(demand_node, demand_value, [demand_node], 0, fd_column)
-
         result = pd.DataFrame.from_records(
             records,
             columns=[
@@ -4357,6 +4468,7 @@ class Database(CoreModel):
         sep=",",
         flat=False,
         separate_files=False,
+        skip_zeros=False,
     ):
         """Export one scenario as multiple text or CSV files.
 
@@ -4384,6 +4496,11 @@ class Database(CoreModel):
             when ``flat=True``, also write one trimmed long-format file per
             matrix in the same export directory.
 
+        skip_zeros:
+            when ``flat=True``, leave zero cells out of the long-format files.
+            Rows or columns holding only zeros are then not recorded in the
+            data files.
+
         Returns
         -------
         None
@@ -4401,6 +4518,7 @@ class Database(CoreModel):
             sep=sep,
             flat=flat,
             separate_files=separate_files,
+            skip_zeros=skip_zeros,
         )
 
     def to_parquet(
@@ -4412,6 +4530,7 @@ class Database(CoreModel):
         include_meta=False,
         flat=False,
         separate_files=False,
+        skip_zeros=False,
     ):
         """Export one scenario as parquet files.
 
@@ -4428,13 +4547,20 @@ class Database(CoreModel):
         include_meta:
             When ``True``, export metadata together with matrices.
         flat:
-            ``False`` writes one parquet file per matrix.
+            ``False`` writes one parquet file per matrix; sparse-backed
+            matrices are written as COO triplets plus axis dictionaries and
+            are parsed back sparse by ``parse_from_parquet``.
             ``True`` writes one long-format ``data.parquet`` plus
             ``units.parquet``.
         separate_files:
             when ``flat=True``, also write one trimmed long-format parquet file
             per matrix in the same export directory.
 
+        skip_zeros:
+            when ``flat=True``, leave zero cells out of the long-format files.
+            Rows or columns holding only zeros are then not recorded in the
+            data files.
+
         Returns
         -------
         None
@@ -4450,6 +4576,7 @@ class Database(CoreModel):
             include_meta=include_meta,
             flat=flat,
             separate_files=separate_files,
+            skip_zeros=skip_zeros,
         )
 
     def export(
@@ -5387,6 +5514,8 @@ class Database(CoreModel):
         scenario=None,
         base_scenario=None,
         force_rewrite=False,
+        low_rank_update=True,
+        max_update_rank=None,
         **legacy_clusters,
     ):
         """Apply shocks to coefficients or demand and store the result as a scenario.
@@ -5422,6 +5551,18 @@ class Database(CoreModel):
             so shocks can be chained on any existing scenario.
         force_rewrite:
             When ``True``, allow overwriting an existing non-baseline scenario.
+        low_rank_update:
+            When ``True`` (default) and the shock only touches a few rows or
+            columns of ``z``, the shocked scenario is solved through a
+            Sherman-Morrison-Woodbury update of ``base_scenario``: the
+            baseline factorization (or its materialized ``w``) is reused and
+            only a small correction is solved. ``X`` is always obtained this
+            way; ``w``, ``f`` and ``m`` are updated too when they are already
+            materialized on ``base_scenario``. Shocks of higher rank fall back
+            to a full solve automatically.
+        max_update_rank:
+            Largest rank of the ``z`` change handled by the low-rank update.
+            Defaults to 64 (and never more than half the number of sectors).
         **legacy_clusters:
             Backward-compatible cluster mappings passed as keyword arguments.
 
@@ -5471,137 +5612,39 @@ class Database(CoreModel):
 
         # have the test for the existence of the database
 
-        note_u = []
-        note_s = []
-        note_z = []
-        note_va = []
-        note_vc = []
-        note_v = []
-        note_ea = []
-        note_ec = []
-        note_e = []
-        note_Ya = []
-        note_Yc = []
-        note_y = []
-
         try:
-            if self.table_type == "SUT":
-                ordering = SUTUnifiedOrderingPolicy.from_blocks(
+            ordering = (
+                SUTUnifiedOrderingPolicy.from_blocks(
                     U=_baseline_block(_ENUM.U),
                     S=_baseline_block(_ENUM.S),
                     Y=_baseline_block(_ENUM.Y),
                 )
-
-                if z:
-                    has_u_sheet = has_shock_sheet(shock_io, _ENUM.u, str(_ENUM.u).lower())
-                    has_s_sheet = has_shock_sheet(shock_io, _ENUM.s, str(_ENUM.s).lower())
-                    has_legacy_z_sheet = has_shock_sheet(
-                        shock_io,
-                        _ENUM.z,
-                        _ENUM.Z,
-                        str(_ENUM.z).lower(),
-                        str(_ENUM.Z).upper(),
-                    )
-
-                    if has_u_sheet or has_s_sheet:
-                        if has_legacy_z_sheet:
-                            log_time(
-                                logger,
-                                "Shock: SUT shock workbook contains both split 'u'/'s' sheets and legacy 'z'. The split sheets are used and the legacy 'z' sheet is ignored.",
-                                "warning",
-                            )
-                        u_c, note_u = U_shock(self, shock_io, z, clusters, 1)
-                        s_c, note_s = S_shock(self, shock_io, z, clusters, 1)
-                        z_c = concat_sut_z(u_c, s_c, ordering)
-                    else:
-                        z_c, note_z = Z_shock(self, shock_io, z, clusters, 1)
-                else:
-                    z_c, note_z = Z_shock(self, shock_io, z, clusters, 1)
-
-                if v:
-                    has_va_sheet = has_shock_sheet(shock_io, "va")
-                    has_vc_sheet = has_shock_sheet(shock_io, "vc")
-                    has_legacy_v_sheet = has_shock_sheet(
-                        shock_io,
-                        _ENUM.v,
-                        str(_ENUM.v).lower(),
-                        str(_ENUM.v).upper(),
-                    )
-
-                    if has_va_sheet or has_vc_sheet:
-                        if has_legacy_v_sheet:
-                            log_time(
-                                logger,
-                                "Shock: SUT shock workbook contains both split 'va'/'vc' sheets and legacy 'v'. The split sheets are used and the legacy 'v' sheet is ignored.",
-                                "warning",
-                            )
-                        va_c, note_va = va_shock(self, shock_io, v, clusters, 1)
-                        vc_c, note_vc = vc_shock(self, shock_io, v, clusters, 1)
-                        v_c = concat_sut_v(va_c, vc_c, ordering)
-                    else:
-                        v_c, note_v = V_shock(self, shock_io, "V", v, clusters, 1)
-                else:
-                    v_c, note_v = V_shock(self, shock_io, "V", v, clusters, 1)
-
-                if e:
-                    has_ea_sheet = has_shock_sheet(shock_io, "ea")
-                    has_ec_sheet = has_shock_sheet(shock_io, "ec")
-                    has_legacy_e_sheet = has_shock_sheet(
-                        shock_io,
-                        _ENUM.e,
-                        str(_ENUM.e).lower(),
-                        str(_ENUM.e).upper(),
-                    )
-
-                    if has_ea_sheet or has_ec_sheet:
-                        if has_legacy_e_sheet:
-                            log_time(
-                                logger,
-                                "Shock: SUT shock workbook contains both split 'ea'/'ec' sheets and legacy 'e'. The split sheets are used and the legacy 'e' sheet is ignored.",
-                                "warning",
-                            )
-                        ea_c, note_ea = ea_shock(self, shock_io, e, clusters, 1)
-                        ec_c, note_ec = ec_shock(self, shock_io, e, clusters, 1)
-                        e_c = concat_sut_e(ea_c, ec_c, ordering)
-                    else:
-                        e_c, note_e = V_shock(self, shock_io, "E", e, clusters, 1)
-                else:
-                    e_c, note_e = V_shock(self, shock_io, "E", e, clusters, 1)
-
-                if Y:
-                    has_Ya_sheet = has_shock_sheet(shock_io, "Ya")
-                    has_Yc_sheet = has_shock_sheet(shock_io, "Yc")
-                    has_legacy_Y_sheet = has_shock_sheet(
-                        shock_io,
-                        _ENUM.Y,
-                        str(_ENUM.Y).lower(),
-                        str(_ENUM.Y).upper(),
-                    )
-
-                    if has_Ya_sheet or has_Yc_sheet:
-                        if has_legacy_Y_sheet:
-                            log_time(
-                                logger,
-                                "Shock: SUT shock workbook contains both split 'Ya'/'Yc' sheets and legacy 'Y'. The split sheets are used and the legacy 'Y' sheet is ignored.",
-                                "warning",
-                            )
-                        Ya_c, note_Ya = Ya_shock(self, shock_io, Y, clusters, 1)
-                        Yc_c, note_Yc = Yc_shock(self, shock_io, Y, clusters, 1)
-                        Y_c = concat_sut_Y(Ya_c, Yc_c, ordering)
-                    else:
-                        Y_c, note_y = Y_shock(self, shock_io, Y, clusters, 1)
-                else:
-                    Y_c, note_y = Y_shock(self, shock_io, Y, clusters, 1)
-            else:
-                z_c, note_z = Z_shock(self, shock_io, z, clusters, 1)
-                e_c, note_e = V_shock(self, shock_io, "E", e, clusters, 1)
-                v_c, note_v = V_shock(self, shock_io, "V", v, clusters, 1)
-                Y_c, note_y = Y_shock(self, shock_io, Y, clusters, 1)
+                if self.table_type == "SUT"
+                else None
+            )
+            z_c, note_z = self._shocked_block(shock_io, _ENUM.z, z, clusters, ordering)
+            v_c, note_v = self._shocked_block(shock_io, _ENUM.v, v, clusters, ordering)
+            e_c, note_e = self._shocked_block(shock_io, _ENUM.e, e, clusters, ordering)
+            Y_c, note_y = self._shocked_block(shock_io, _ENUM.Y, Y, clusters, ordering)
 
             EY_c = _baseline_block(_ENUM.EY)
             VY_c = _baseline_block(_ENUM.VY)
 
-            _results = calc_all_shock(z_c, e_c, v_c, Y_c)
+            low_rank_blocks = (
+                self._low_rank_shock_blocks(
+                    base_scenario,
+                    _baseline_block(_ENUM.z),
+                    z_c,
+                    e_c,
+                    v_c,
+                    Y_c,
+                    max_rank=max_update_rank,
+                )
+                if low_rank_update
+                else {}
+            )
+            _results = calc_all_shock(z_c, e_c, v_c, Y_c, X=low_rank_blocks.pop(_ENUM.X, None))
+            _results.update(low_rank_blocks)
             _results["EY"] = EY_c
             _results["VY"] = VY_c
 
@@ -5666,20 +5709,7 @@ class Database(CoreModel):
             except:
                 pass
 
-            for note in (
-                note_u
-                + note_s
-                + note_z
-                + note_va
-                + note_vc
-                + note_v
-                + note_ea
-                + note_ec
-                + note_e
-                + note_Ya
-                + note_Yc
-                + note_y
-            ):
+            for note in note_z + note_v + note_e + note_y:
                 self.meta._add_history(note)
 
             log_time(logger, "Shock: Shock implemented successfully.")
@@ -5688,6 +5718,314 @@ class Database(CoreModel):
             if opened_workbook is not None:
                 opened_workbook.close()
 
+    def shock_sweep(
+        self,
+        shocks,
+        *,
+        samples=None,
+        indicators=(_ENUM.X, _ENUM.V, _ENUM.E),
+        base_scenario=None,
+        clusters=None,
+        **legacy_clusters,
+    ):
+        """Evaluate many final-demand and satellite shocks in one batched pass.
+
+        Every sweep scenario is read with the same shock readers used by
+        :meth:`shock_calc`, but ``z`` is kept fixed, so all production vectors
+        are solved together as one stacked right-hand side against a single
+        (cached) factorization of ``I - z``. Only the requested indicators are
+        returned; no scenario is added to ``self.matrices``.
+
+        Parameters
+        ----------
+        shocks:
+            Sweep definition. Either a dataframe in the shock-sheet layout with
+            two extra columns, ``Scenario`` (sweep scenario name) and
+            ``Matrix`` (target sheet such as ``Y``, ``v``, ``e`` or the split
+            SUT sheets ``Ya``, ``Yc``, ``va``, ``vc``, ``ea``, ``ec``); a
+            mapping from scenario names to workbook-like shock sources (or
+            dataframes with a ``Matrix`` column); or a callable sampler that
+            receives the sample number and returns one such source.
+        samples:
+            Number of samples to draw when ``shocks`` is a callable. Sampled
+            scenarios are named ``sample <n>``.
+        indicators:
+            Indicators to return. ``X`` gives the production vector, ``V`` the
+            total value added by factor of production and ``E`` the total
+            satellite accounts, each with one column per sweep scenario.
+        base_scenario:
+            Scenario the shocks are applied to. Defaults to the baseline.
+        clusters:
+            Preferred cluster payload, as in :meth:`shock_calc`.
+        **legacy_clusters:
+            Backward-compatible cluster mappings passed as keyword arguments.
+
+        Returns
+        -------
+        dict[str, pandas.DataFrame]
+            One frame per requested indicator, indexed by the indicator rows
+            with one column per sweep scenario.
+        """
+        from mario.compute.iot_formulas import _solve_iot_system
+        from mario.compute.resolver import Resolver
+
+        indicators = [indicators] if isinstance(indicators, str) else list(indicators)
+        acceptable = (_ENUM.X, _ENUM.V, _ENUM.E)
+        for indicator in indicators:
+            if indicator not in acceptable:
+                raise WrongInput(
+                    f"Acceptable indicators for shock_sweep are {list(acceptable)}, got {indicator!r}."
+                )
+
+        base_scenario = base_scenario or self.baseline_scenario_name
+        if base_scenario not in self.matrices:
+            raise WrongInput(
+                f"base_scenario {base_scenario!r} does not exist. Available scenarios are "
+                f"{list(self.matrices)}."
+            )
+
+        clusters = self._resolved_clusters(clusters=clusters, legacy_clusters=legacy_clusters)
+        check_clusters(
+            index_dict=self.get_index("all"), table=self.table_type, clusters=clusters
+        )
+
+        sources = self._shock_sweep_sources(shocks, samples)
+        if not sources:
+            raise WrongInput("shock_sweep requires at least one scenario.")
+
+        def _base_block(matrix_name):
+            if self.has_matrix(matrix_name, scenario=base_scenario):
+                return self.get_block_as_pandas(matrix_name, scenario=base_scenario)
+            return self.query(matrix_name, scenarios=base_scenario)
+
+        z = _base_block(_ENUM.z)
+        base_blocks = {
+            _ENUM.Y: _base_block(_ENUM.Y),
+            _ENUM.v: _base_block(_ENUM.v) if _ENUM.V in indicators else None,
+            _ENUM.e: _base_block(_ENUM.e) if _ENUM.E in indicators else None,
+        }
+        sheets = {
+            _ENUM.Y: (_ENUM.Y, "Ya", "Yc"),
+            _ENUM.v: (_ENUM.v, "va", "vc"),
+            _ENUM.e: (_ENUM.e, "ea", "ec"),
+        }
+
+        self._shock_base_scenario = base_scenario
+        try:
+            ordering = (
+                SUTUnifiedOrderingPolicy.from_blocks(
+                    U=_base_block(_ENUM.U),
+                    S=_base_block(_ENUM.S),
+                    Y=base_blocks[_ENUM.Y],
+                )
+                if self.table_type == "SUT"
+                else None
+            )
+            shocked = {name: [] for name in base_blocks}
+            for scenario, source in sources:
+                for sheet in (_ENUM.z, _ENUM.u, _ENUM.s):
+                    if has_shock_sheet(source, *self._shock_sheet_aliases(sheet)):
+                        raise WrongInput(
+                            f"shock_sweep scenario {scenario!r} shocks '{sheet}'. Sweeps keep z fixed "
+                            "and only accept Y, v and e shocks; use shock_calc for z shocks."
+                        )
+                for name, base in base_blocks.items():
+                    selected = base is not None and any(
+                        has_shock_sheet(source, *self._shock_sheet_aliases(sheet))
+                        for sheet in sheets[name]
+                    )
+                    block = (
+                        self._shocked_block(source, name, True, clusters, ordering)[0]
+                        if selected
+                        else None
+                    )
+                    shocked[name].append(block)
+        finally:
+            self._shock_base_scenario = None
+
+        names = pd.Index([scenario for scenario, _ in sources], name="Scenario")
+        Y_base = base_blocks[_ENUM.Y]
+        y_base = dense_values(sum_final_demand(Y_base))
+        demand = np.column_stack(
+            [
+                y_base if Y_c is None else dense_values(sum_final_demand(Y_c.reindex_like(Y_base)))
+                for Y_c in shocked[_ENUM.Y]
+            ]
+        )
+
+        resolver = Resolver(self, scenario=base_scenario)
+        production = dense_values(
+            _solve_iot_system(z, pd.DataFrame(demand, index=z.index, columns=names), resolver=resolver)
+        )
+
+        def _indicator(coefficients_name):
+            base = base_blocks[coefficients_name]
+            base_values = dense_values(base)
+            result = base_values @ production
+            for position, block in enumerate(shocked[coefficients_name]):
+                if block is not None:
+                    result[:, position] = dense_values(block.reindex_like(base)) @ production[:, position]
+            return pd.DataFrame(result, index=base.index, columns=names)
+
+        results = {}
+        for indicator in indicators:
+            if indicator == _ENUM.X:
+                results[indicator] = pd.DataFrame(production, index=z.index, columns=names)
+            elif indicator == _ENUM.V:
+                results[indicator] = _indicator(_ENUM.v)
+            else:
+                results[indicator] = _indicator(_ENUM.e)
+
+        log_time(
+            logger,
+            f"Shock: evaluated {len(names)} sweep scenarios on {base_scenario} with one stacked solve.",
+        )
+        return results
+
+    @staticmethod
+    def _shock_sweep_sources(shocks, samples=None):
+        """Normalize one sweep definition into ``(scenario, shock source)`` pairs."""
+
+        def _as_source(payload):
+            if isinstance(payload, pd.DataFrame):
+                if "Matrix" not in payload.columns:
+                    raise WrongInput("shock_sweep dataframes need a 'Matrix' column naming the shock sheet.")
+                return {
+                    str(matrix): rows.drop(columns="Matrix").dropna(axis=1, how="all").reset_index(drop=True)
+                    for matrix, rows in payload.groupby("Matrix", sort=False)
+                }
+            if hasattr(payload, "keys"):
+                return payload
+            raise WrongInput("shock_sweep sources should be dataframes or workbook-like mappings.")
+
+        if callable(shocks):
+            if samples is None:
+                raise WrongInput("shock_sweep requires 'samples' when shocks is a sampler.")
+            return [(f"sample {sample}", _as_source(shocks(sample))) for sample in range(int(samples))]
+
+        if isinstance(shocks, pd.DataFrame):
+            if "Scenario" not in shocks.columns:
+                raise WrongInput("shock_sweep tables need a 'Scenario' column naming each sweep scenario.")
+            return [
+                (scenario, _as_source(rows.drop(columns="Scenario")))
+                for scenario, rows in shocks.groupby("Scenario", sort=False)
+            ]
+
+        if hasattr(shocks, "items"):
+            return [(scenario, _as_source(source)) for scenario, source in shocks.items()]
+
+        raise WrongInput("shock_sweep expects a dataframe, a mapping of scenarios or a sampler callable.")
+
+    def _shocked_block(self, shock_io, name, selected, clusters, ordering=None):
+        """Read and apply the shock sheets of one coefficient or demand block.
+
+        ``name`` is one of ``z``, ``v``, ``e`` or ``Y``. For SUT databases the
+        split-native sheets (``u``/``s``, ``va``/``vc``, ``ea``/``ec``,
+        ``Ya``/``Yc``) take precedence over the legacy unified sheet and are
+        concatenated back through ``ordering``. Returns the shocked block and
+        the provenance notes of the applied rows.
+        """
+        legacy_readers = {
+            _ENUM.z: lambda: Z_shock(self, shock_io, selected, clusters, 1),
+            _ENUM.v: lambda: V_shock(self, shock_io, "V", selected, clusters, 1),
+            _ENUM.e: lambda: V_shock(self, shock_io, "E", selected, clusters, 1),
+            _ENUM.Y: lambda: Y_shock(self, shock_io, selected, clusters, 1),
+        }
+        if self.table_type != "SUT" or not selected:
+            return legacy_readers[name]()
+
+        split_readers = {
+            _ENUM.z: (_ENUM.u, _ENUM.s, U_shock, S_shock, concat_sut_z),
+            _ENUM.v: ("va", "vc", va_shock, vc_shock, concat_sut_v),
+            _ENUM.e: ("ea", "ec", ea_shock, ec_shock, concat_sut_e),
+            _ENUM.Y: ("Ya", "Yc", Ya_shock, Yc_shock, concat_sut_Y),
+        }
+        first, second, read_first, read_second, concat = split_readers[name]
+        has_split_sheet = any(
+            has_shock_sheet(shock_io, *self._shock_sheet_aliases(sheet))
+            for sheet in (first, second)
+        )
+        if not has_split_sheet:
+            return legacy_readers[name]()
+
+        if has_shock_sheet(shock_io, *self._shock_sheet_aliases(name)):
+            log_time(
+                logger,
+                f"Shock: SUT shock workbook contains both split '{first}'/'{second}' sheets "
+                f"and legacy '{name}'. The split sheets are used and the legacy '{name}' sheet is ignored.",
+                "warning",
+            )
+        first_block, first_notes = read_first(self, shock_io, selected, clusters, 1)
+        second_block, second_notes = read_second(self, shock_io, selected, clusters, 1)
+        return concat(first_block, second_block, ordering), first_notes + second_notes
+
+    @staticmethod
+    def _shock_sheet_aliases(sheet):
+        """Return the worksheet names accepted for one shock sheet."""
+        if sheet == _ENUM.z:
+            return (_ENUM.z, _ENUM.Z, str(_ENUM.z).lower(), str(_ENUM.Z).upper())
+        if sheet in (_ENUM.u, _ENUM.s):
+            return (sheet, str(sheet).lower())
+        if sheet in (_ENUM.v, _ENUM.e, _ENUM.Y):
+            return (sheet, str(sheet).lower(), str(sheet).upper())
+        return (sheet,)
+
+    def _low_rank_shock_blocks(self, base_scenario, base_z, z, e, v, Y, *, max_rank=None):
+        """Solve one shocked scenario through a Woodbury update of its base.
+
+        Returns the shocked ``X`` together with updated ``w``, ``f`` and ``m``
+        for those already materialized on ``base_scenario``. An empty mapping
+        means the ``z`` change is not low-rank enough (or the update failed
+        its residual check) and the caller should run the full solve.
+        """
+        w_base = (
+            self.get_block(_ENUM.w, scenario=base_scenario)
+            if self.table_type == "IOT" and self.has_matrix(_ENUM.w, scenario=base_scenario)
+            else None
+        )
+        solver = build_woodbury_solver(
+            base_z,
+            z,
+            w_base=w_base,
+            cache=model_factorization_cache(self),
+            max_rank=max_rank,
+        )
+        if solver is None:
+            return {}
+
+        y_total = dense_values(sum_final_demand(Y))
+        production = solver.solve(y_total)
+        if not residual_is_small(z, production, y_total):
+            log_time(
+                logger,
+                "Shock: low-rank update did not reproduce the shocked system accurately; using a full solve.",
+                "warning",
+            )
+            return {}
+
+        blocks = {_ENUM.X: as_column_frame(pd.Series(production, index=z.index), PRODUCTION_LABEL)}
+        if self.table_type == "IOT":
+            if w_base is not None:
+                blocks[_ENUM.w] = pd.DataFrame(
+                    solver.update_inverse(dense_values(w_base)),
+                    index=w_base.index,
+                    columns=w_base.columns,
+                )
+            for name, coefficients in ((_ENUM.f, e), (_ENUM.m, v)):
+                if self.has_matrix(name, scenario=base_scenario):
+                    blocks[name] = pd.DataFrame(
+                        solver.solve_transposed(dense_values(coefficients).T).T,
+                        index=coefficients.index,
+                        columns=z.columns,
+                    )
+
+        log_time(
+            logger,
+            f"Shock: solved through a rank-{solver.rank} update of {base_scenario} "
+            f"({', '.join(blocks)} updated without refactorizing z).",
+        )
+        return blocks
+
     def get_shock_excel(
         self,
         path=None,
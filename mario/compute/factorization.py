@@ -0,0 +1,218 @@
+"""Content-addressed cache of sparse factorizations shared across resolvers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import threading
+
+import numpy as np
+
+from mario.compute.runtime import physical_memory_bytes
+
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MEMORY_FRACTION = 0.1
+
+
+def matrix_fingerprint(matrix) -> str:
+    """Return a content digest of one SciPy sparse matrix or dense array.
+
+    The digest only depends on the shape and the numerical content, so two
+    independently built copies of the same coefficients share one key while
+    any changed cell produces a new one.
+    """
+    from scipy import sparse
+
+    digest = hashlib.blake2b(digest_size=16)
+    if sparse.issparse(matrix):
+        canonical = sparse.csc_matrix(matrix, dtype=float, copy=True)
+        canonical.sum_duplicates()
+        canonical.eliminate_zeros()
+        canonical.sort_indices()
+        digest.update(b"csc")
+        digest.update(np.asarray(canonical.shape, dtype=np.int64).tobytes())
+        digest.update(np.asarray(canonical.indptr, dtype=np.int64).tobytes())
+        digest.update(np.asarray(canonical.indices, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(canonical.data, dtype=float).tobytes())
+    else:
+        values = np.ascontiguousarray(matrix, dtype=float)
+        digest.update(b"dense")
+        digest.update(np.asarray(values.shape, dtype=np.int64).tobytes())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def estimate_factor_bytes(factor, *, fallback: int = 0) -> int:
+    """Estimate the memory held by one factorization object.
+
+    SuperLU solvers expose their ``L`` and ``U`` factors through the bound
+    ``solve`` method; other backends fall back to the caller-provided size.
+    """
+    owner = getattr(factor, "__self__", factor)
+    total = 0
+    for name in ("L", "U"):
+        block = getattr(owner, name, None)
+        nnz = getattr(block, "nnz", None)
+        if nnz is not None:
+            total += int(nnz) * (np.dtype(float).itemsize + np.dtype(np.int32).itemsize)
+    return total or int(fallback)
+
+
+@dataclass(frozen=True)
+class FactorizationCacheStats:
+    """Counters describing how one factorization cache has been used."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class FactorizationCache:
+    """LRU cache of sparse factorizations with an entry and memory budget.
+
+    Keys are tuples built from a content fingerprint of the factorized system
+    (see :func:`matrix_fingerprint`) plus solver flags, so they stay valid
+    across resolver instances and scenarios and cannot collide after garbage
+    collection the way ``id()``-based keys can. The mapping interface
+    (``get``, ``__getitem__``, ``__setitem__``) matches the plain dictionaries
+    previously used as per-resolver caches.
+    """
+
+    def __init__(self, *, max_entries: int | None = DEFAULT_MAX_ENTRIES, max_bytes: int | None = None) -> None:
+        """Create an empty cache with the given budget."""
+        if max_bytes is None:
+            total_memory = physical_memory_bytes()
+            if total_memory is not None:
+                max_bytes = int(total_memory * DEFAULT_MEMORY_FRACTION)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached factorizations."""
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        """Return whether one key is cached, without touching LRU order."""
+        return key in self._entries
+
+    def __getitem__(self, key):
+        """Return one cached factorization or raise ``KeyError``."""
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, factor) -> None:
+        """Store one factorization with an estimated memory footprint."""
+        self.put(key, factor)
+
+    def __deepcopy__(self, memo):
+        """Return an empty cache with the same budget.
+
+        Factorizations are derived data tied to native solver objects; copies
+        of a model rebuild them lazily instead of duplicating them.
+        """
+        return FactorizationCache(max_entries=self.max_entries, max_bytes=self.max_bytes)
+
+    def __getstate__(self):
+        """Pickle only the budget, never the native factor objects."""
+        return {"max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        """Restore an empty cache from pickled budget settings."""
+        self.__init__(max_entries=state.get("max_entries"), max_bytes=state.get("max_bytes"))
+
+    @property
+    def nbytes(self) -> int:
+        """Return the estimated memory held by all cached factorizations."""
+        return sum(size for _, size in self._entries.values())
+
+    def get(self, key, default=None):
+        """Return one cached factorization and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, factor, *, nbytes: int | None = None) -> None:
+        """Store one factorization and evict least recently used entries."""
+        size = estimate_factor_bytes(factor) if nbytes is None else int(nbytes)
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                # A factor larger than the whole budget would evict everything
+                # and still not fit; serve it uncached.
+                return
+            self._entries[key] = (factor, size)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the budget is respected."""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached factorization."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> FactorizationCacheStats:
+        """Return usage counters for diagnostics and tests."""
+        with self._lock:
+            return FactorizationCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self.nbytes,
+            )
+
+
+def cached_factorization(cache, key, lhs):
+    """Return a sparse factorization of ``lhs``, reusing ``cache[key]`` when present."""
+    from scipy.sparse.linalg import factorized
+
+    if cache is None:
+        return factorized(lhs)
+    factor = cache.get(key)
+    if factor is None:
+        factor = factorized(lhs)
+        cache[key] = factor
+    return factor
+
+
+def model_factorization_cache(dataset) -> FactorizationCache:
+    """Return the factorization cache attached to one dataset-like object.
+
+    The cache is created lazily on the dataset itself so every resolver bound
+    to the same model shares it. Datasets that cannot carry attributes (plain
+    mappings) get a fresh cache scoped to the caller.
+    """
+    state = getattr(dataset, "__dict__", None)
+    if state is None:
+        return FactorizationCache()
+    cache = state.get("_factorization_cache")
+    if isinstance(cache, FactorizationCache):
+        return cache
+    cache = FactorizationCache()
+    try:
+        state["_factorization_cache"] = cache
+    except TypeError:
+        pass
+    return cache
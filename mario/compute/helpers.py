@@ -41,11 +41,18 @@ def dense_values(
 
 def sparse_frame_from_spmatrix(matrix, *, index, columns) -> pd.DataFrame:
     """Build a pandas sparse dataframe whose implicit sparse value is zero."""
-    return pd.DataFrame.sparse.from_spmatrix(
+    frame = pd.DataFrame.sparse.from_spmatrix(
         matrix,
         index=index,
         columns=columns,
     ).fillna(0.0)
+    # ``fillna`` leaves the NaN fill value of columns without gaps in place.
+    zero = matrix.dtype.type(0).item()
+    for position, dtype in enumerate(frame.dtypes):
+        if not dtype.fill_value == zero:
+            values = frame.iloc[:, position].array.sp_values
+            frame.isetitem(position, pd.arrays.SparseArray(values, fill_value=zero))
+    return frame
 
 
 def as_dense_series(vector: pd.DataFrame | pd.Series | np.ndarray | list[float] | tuple[float, ...]) -> pd.Series:
@@ -352,11 +359,9 @@ def safe_solve(
                 factor = None
 
         if factor is not None:
-            rhs_array = np.asarray(rhs_values, dtype=float)
-            if rhs_array.ndim == 1:
-                solved = factor(rhs_array)
-            else:
-                solved = np.column_stack([factor(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            from mario.compute.linear import solve_factor_block
+
+            solved = solve_factor_block(factor, rhs_values)
     else:
         raise ValueError(f"Unsupported linear solver {solver!r}.")
 
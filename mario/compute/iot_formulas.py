@@ -25,6 +25,8 @@ from mario.compute.helpers import (
     transpose_matvec,
     validate_square,
 )
+from mario.compute.factorization import cached_factorization, matrix_fingerprint
+from mario.compute.linear import solve_columns, solve_factor_block
 from mario.compute.runtime import choose_linear_strategy, effective_compute_options
 from mario.log_exc.logger import log_time
 from mario.model.labels import PRICE_INDEX_LABEL, PRODUCTION_LABEL
@@ -91,15 +93,14 @@ def _solve_iot_system(
             "debug",
         )
         cache = _resolver_linear_cache(resolver)
-        cache_key = ("iot", id(z), bool(transpose), options.linear_solver)
 
         def _get_factor():
-            factor = cache.get(cache_key) if cache is not None else None
-            if factor is None:
-                factor = factorized(lhs_sparse)
-                if cache is not None:
-                    cache[cache_key] = factor
-            return factor
+            if cache is None:
+                return factorized(lhs_sparse)
+            # Keys are content-addressed so factorizations are shared across
+            # resolvers and scenarios holding identical coefficients.
+            cache_key = ("iot", matrix_fingerprint(system), bool(transpose), options.linear_solver)
+            return cached_factorization(cache, cache_key, lhs_sparse)
 
         def _solve_least_squares(rhs_array):
             def _solve_one(vector):
@@ -119,9 +120,7 @@ def _solve_iot_system(
                     )
                 return solved
 
-            if rhs_array.ndim == 1:
-                return _solve_one(rhs_array)
-            return np.column_stack([_solve_one(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_columns(_solve_one, rhs_array)
 
         def _solve_direct(
             rhs_array,
@@ -157,9 +156,7 @@ def _solve_iot_system(
                     )
                     return _solve_least_squares(rhs_array)
                 raise
-            if rhs_array.ndim == 1:
-                return factor(rhs_array)
-            return np.column_stack([factor(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_factor_block(factor, rhs_array)
 
         def _solve_iterative(
             rhs_array,
@@ -219,9 +216,7 @@ def _solve_iot_system(
                     )
                 return solved
 
-            if rhs_array.ndim == 1:
-                return _solve_one(rhs_array)
-            return np.column_stack([_solve_one(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_columns(_solve_one, rhs_array)
 
         rhs_values = dense_values(rhs) if isinstance(rhs, (pd.DataFrame, pd.Series)) else np.asarray(rhs, dtype=float)
         solved = _solve_iterative(rhs_values) if linear_strategy == "iterative" else _solve_direct(rhs_values)
@@ -239,7 +234,7 @@ def _solve_iot_system(
         rhs,
         solver=options.linear_solver,
         cache=_resolver_linear_cache(resolver),
-        cache_key=("iot", id(z), bool(transpose), options.linear_solver),
+        cache_key=("iot", matrix_fingerprint(dense_values(z)), bool(transpose), options.linear_solver),
     )
 
 
@@ -0,0 +1,99 @@
+"""Batched linear-solve kernels shared by the IOT and SUT formula modules."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import os
+import threading
+
+import numpy as np
+
+# Columns handed to one worker by the chunked per-vector solvers. Large enough
+# to amortize thread dispatch, small enough to keep every core busy on blocks
+# with a few dozen right-hand sides.
+RHS_CHUNK_SIZE = 16
+
+_worker_budget = threading.local()
+
+
+def default_linear_workers() -> int:
+    """Return the default number of worker threads for chunked solves.
+
+    Inside :func:`limited_linear_workers` the count is capped for the calling
+    thread, so nested pools do not oversubscribe the cores.
+    """
+    workers = max(1, min(32, os.cpu_count() or 1))
+    limit = getattr(_worker_budget, "limit", None)
+    return workers if limit is None else max(1, min(workers, limit))
+
+
+@contextmanager
+def limited_linear_workers(limit: int):
+    """Cap :func:`default_linear_workers` at ``limit`` on the calling thread."""
+    previous = getattr(_worker_budget, "limit", None)
+    _worker_budget.limit = max(1, int(limit))
+    try:
+        yield
+    finally:
+        _worker_budget.limit = previous
+
+
+def solve_factor_block(factor, rhs_array: np.ndarray) -> np.ndarray:
+    """Apply one sparse factorization to a whole right-hand-side block.
+
+    SuperLU factors returned by :func:`scipy.sparse.linalg.factorized` accept a
+    2D block and solve every column in one native call. Backends that only
+    accept vectors (for example UMFPACK) are detected and served column by
+    column instead.
+    """
+    rhs_array = np.asarray(rhs_array, dtype=float)
+    if rhs_array.ndim == 1:
+        return np.asarray(factor(rhs_array), dtype=float)
+    if rhs_array.shape[1] == 0:
+        return rhs_array.copy()
+
+    try:
+        solved = np.asarray(factor(np.asfortranarray(rhs_array)), dtype=float)
+    except (TypeError, ValueError):
+        solved = None
+    if solved is not None and solved.shape == rhs_array.shape:
+        return solved
+    return np.column_stack([factor(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+
+
+def solve_columns(
+    solve_one,
+    rhs_array: np.ndarray,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = RHS_CHUNK_SIZE,
+) -> np.ndarray:
+    """Apply a per-vector solver to every column of one right-hand-side block.
+
+    Columns are split into contiguous chunks that run on a thread pool; the
+    sparse kernels behind SciPy's Krylov solvers release the GIL, so chunks
+    progress concurrently. Column order is preserved in the result.
+    """
+    rhs_array = np.asarray(rhs_array, dtype=float)
+    if rhs_array.ndim == 1:
+        return solve_one(rhs_array)
+
+    column_count = int(rhs_array.shape[1])
+    if column_count == 0:
+        return rhs_array.copy()
+
+    workers = default_linear_workers() if max_workers is None else max(1, int(max_workers))
+    chunk_size = max(1, int(chunk_size))
+    bounds = [(start, min(start + chunk_size, column_count)) for start in range(0, column_count, chunk_size)]
+
+    def _solve_chunk(bound):
+        start, stop = bound
+        return np.column_stack([solve_one(rhs_array[:, idx]) for idx in range(start, stop)])
+
+    if workers == 1 or len(bounds) == 1:
+        chunks = [_solve_chunk(bound) for bound in bounds]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(bounds))) as executor:
+            chunks = list(executor.map(_solve_chunk, bounds))
+    return np.hstack(chunks)
@@ -0,0 +1,232 @@
+"""Sherman-Morrison-Woodbury updates for low-rank changes of ``z``.
+
+When a scenario only modifies a few rows or columns of the technical
+coefficients, ``(I - z_new)`` differs from ``(I - z_base)`` by a low-rank
+term ``L @ R``. Systems on the shocked matrix can then be solved with the
+baseline factorization (or the baseline ``w``) plus a ``k x k`` correction,
+instead of factorizing the new matrix from scratch.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.factorization import cached_factorization, matrix_fingerprint
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values
+from mario.compute.linear import solve_factor_block
+from mario.compute.runtime import effective_compute_options
+from mario.log_exc.logger import log_time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_UPDATE_RANK = 64
+CAPACITANCE_CONDITION_LIMIT = 1e10
+RESIDUAL_TOLERANCE = 1e-8
+
+
+@dataclass(frozen=True)
+class LowRankUpdate:
+    """Factored difference ``z_new - z_base = left @ right`` of rank ``k``."""
+
+    left: np.ndarray
+    right: np.ndarray
+    rows: np.ndarray | None = None
+    columns: np.ndarray | None = None
+
+    @property
+    def rank(self) -> int:
+        """Return the number of columns of the update factors."""
+        return int(self.left.shape[1])
+
+
+def _sparse_or_dense(block: pd.DataFrame):
+    """Return the numeric payload of one block without densifying sparse frames."""
+    if _is_sparse_backed_dataframe(block):
+        return block.sparse.to_coo().tocsc()
+    return dense_values(block)
+
+
+def low_rank_difference(
+    z_base: pd.DataFrame,
+    z_new: pd.DataFrame,
+    *,
+    max_rank: int | None = None,
+) -> LowRankUpdate | None:
+    """Factor the change between two coefficient matrices when it is low-rank.
+
+    The change is expressed either through the touched columns
+    (``left = delta[:, cols]``, ``right`` a column selector) or the touched
+    rows, whichever is smaller. Returns ``None`` when the labels differ or the
+    rank exceeds ``max_rank``.
+    """
+    from scipy import sparse
+
+    if not (z_base.index.equals(z_new.index) and z_base.columns.equals(z_new.columns)):
+        return None
+
+    size = z_base.shape[0]
+    limit = DEFAULT_MAX_UPDATE_RANK if max_rank is None else int(max_rank)
+    limit = min(limit, max(size // 2, 1))
+
+    base_values = _sparse_or_dense(z_base)
+    new_values = _sparse_or_dense(z_new)
+    if sparse.issparse(base_values) or sparse.issparse(new_values):
+        delta = sparse.csc_matrix(new_values) - sparse.csc_matrix(base_values)
+        delta.eliminate_zeros()
+        touched_rows, touched_columns = delta.nonzero()
+        changed_rows = np.unique(touched_rows)
+        changed_columns = np.unique(touched_columns)
+    else:
+        delta = new_values - base_values
+        mask = delta != 0
+        changed_rows = np.flatnonzero(mask.any(axis=1))
+        changed_columns = np.flatnonzero(mask.any(axis=0))
+
+    rank = min(changed_rows.size, changed_columns.size)
+    if rank > limit:
+        return None
+
+    if changed_columns.size <= changed_rows.size:
+        left = np.asarray(delta[:, changed_columns].toarray() if sparse.issparse(delta) else delta[:, changed_columns])
+        right = np.zeros((changed_columns.size, size), dtype=float)
+        right[np.arange(changed_columns.size), changed_columns] = 1.0
+        return LowRankUpdate(left=left, right=right, columns=changed_columns)
+
+    right = np.asarray(delta[changed_rows, :].toarray() if sparse.issparse(delta) else delta[changed_rows, :])
+    left = np.zeros((size, changed_rows.size), dtype=float)
+    left[changed_rows, np.arange(changed_rows.size)] = 1.0
+    return LowRankUpdate(left=left, right=right, rows=changed_rows)
+
+
+class WoodburySolver:
+    """Solve systems on ``I - z_base - left @ right`` from baseline solves.
+
+    ``base_solve`` and ``base_solve_transposed`` apply ``(I - z_base)^-1`` and
+    its transpose to a vector or a block of right-hand sides. With the
+    capacitance matrix ``C = I_k - right @ A^-1 @ left`` the shocked inverse is
+    ``A^-1 + A^-1 left C^-1 right A^-1``.
+    """
+
+    def __init__(self, base_solve, base_solve_transposed, update: LowRankUpdate) -> None:
+        """Precompute ``A^-1 @ left`` and factor the capacitance matrix."""
+        from scipy.linalg import lu_factor
+
+        self.update = update
+        self._solve = base_solve
+        self._solve_transposed = base_solve_transposed
+        self._solved_left = np.asarray(base_solve(update.left), dtype=float).reshape(update.left.shape)
+        self._solved_right_t = None
+        capacitance = np.eye(update.rank) - update.right @ self._solved_left
+        if update.rank and np.linalg.cond(capacitance) > CAPACITANCE_CONDITION_LIMIT:
+            raise np.linalg.LinAlgError("Low-rank update makes the shocked Leontief system near-singular.")
+        self._capacitance = lu_factor(capacitance) if update.rank else None
+
+    @property
+    def rank(self) -> int:
+        """Return the rank of the applied update."""
+        return self.update.rank
+
+    def _correct(self, rhs_projection: np.ndarray, *, trans: int = 0) -> np.ndarray:
+        """Apply ``C^-1`` (or ``C^-T``) to the projected right-hand sides."""
+        from scipy.linalg import lu_solve
+
+        return lu_solve(self._capacitance, rhs_projection, trans=trans)
+
+    def solve(self, rhs) -> np.ndarray:
+        """Return ``(I - z_new)^-1 @ rhs``."""
+        base = np.asarray(self._solve(rhs), dtype=float)
+        if self._capacitance is None:
+            return base
+        return base + self._solved_left @ self._correct(self.update.right @ base)
+
+    def solve_transposed(self, rhs) -> np.ndarray:
+        """Return ``(I - z_new)^-T @ rhs``."""
+        base = np.asarray(self._solve_transposed(rhs), dtype=float)
+        if self._capacitance is None:
+            return base
+        if self._solved_right_t is None:
+            self._solved_right_t = np.asarray(self._solve_transposed(self.update.right.T), dtype=float).reshape(
+                self.update.right.T.shape
+            )
+        return base + self._solved_right_t @ self._correct(self.update.left.T @ base, trans=1)
+
+    def update_inverse(self, w_base: np.ndarray) -> np.ndarray:
+        """Return the shocked Leontief inverse from the baseline ``w``."""
+        if self._capacitance is None:
+            return np.array(w_base, dtype=float, copy=True)
+        return w_base + self._solved_left @ self._correct(self.update.right @ w_base)
+
+
+def build_woodbury_solver(
+    z_base: pd.DataFrame,
+    z_new: pd.DataFrame,
+    *,
+    w_base: pd.DataFrame | None = None,
+    cache=None,
+    max_rank: int | None = None,
+    context=None,
+) -> WoodburySolver | None:
+    """Return a Woodbury solver for ``z_new`` built on the baseline system.
+
+    The baseline is applied through ``w_base`` when it is already materialized
+    and otherwise through sparse factorizations of ``I - z_base`` taken from
+    (and stored in) ``cache`` under the same content-addressed keys used by the
+    IOT formulas. Returns ``None`` when the change is not low-rank enough or
+    the update is numerically unsafe, so callers can fall back to a full solve.
+    """
+    from scipy import sparse
+
+    update = low_rank_difference(z_base, z_new, max_rank=max_rank)
+    if update is None:
+        return None
+
+    if w_base is not None:
+        w_values = dense_values(w_base)
+
+        def base_solve(rhs):
+            return w_values @ np.asarray(rhs, dtype=float)
+
+        def base_solve_transposed(rhs):
+            return w_values.T @ np.asarray(rhs, dtype=float)
+
+    else:
+        options = effective_compute_options(context)
+        base_values = _sparse_or_dense(z_base)
+        system = base_values if sparse.issparse(base_values) else sparse.csc_matrix(base_values)
+        identity = sparse.identity(z_base.shape[0], format="csc")
+        factors = {}
+
+        def _factor(transpose: bool):
+            if transpose not in factors:
+                key = ("iot", matrix_fingerprint(system), transpose, options.linear_solver)
+                lhs = (identity - (system.T if transpose else system)).tocsc()
+                factors[transpose] = cached_factorization(cache, key, lhs)
+            return factors[transpose]
+
+        def base_solve(rhs):
+            return solve_factor_block(_factor(False), rhs)
+
+        def base_solve_transposed(rhs):
+            return solve_factor_block(_factor(True), rhs)
+
+    try:
+        solver = WoodburySolver(base_solve, base_solve_transposed, update)
+    except (np.linalg.LinAlgError, RuntimeError, ValueError) as exc:
+        log_time(logger, f"Compute: low-rank update rejected ({exc}); using a full solve.", "debug")
+        return None
+    return solver
+
+
+def residual_is_small(z: pd.DataFrame, solution: np.ndarray, rhs: np.ndarray) -> bool:
+    """Return whether ``solution`` solves ``(I - z) x = rhs`` to tolerance."""
+    from scipy import sparse
+
+    values = _sparse_or_dense(z)
+    product = values @ solution if not sparse.issparse(values) else values.dot(solution)
+    residual = solution - np.asarray(product).reshape(solution.shape) - rhs
+    scale = max(float(np.linalg.norm(rhs)), 1.0)
+    return float(np.linalg.norm(residual)) <= RESIDUAL_TOLERANCE * scale
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import threading
+import weakref
 
 import pandas as pd
 
@@ -52,6 +54,86 @@ def _first_multiindex(*candidates: pd.MultiIndex | None) -> pd.MultiIndex | None
     return None
 
 
+# Blocks and axes consulted for each ordering axis, in priority order.
+_UNIFIED_AXIS_SOURCES = (
+    ("Z", "index"),
+    ("z", "index"),
+    ("w", "index"),
+    ("b", "index"),
+    ("g", "index"),
+    ("X", "index"),
+    ("Y", "index"),
+    ("V", "columns"),
+    ("v", "columns"),
+    ("E", "columns"),
+    ("e", "columns"),
+)
+_ACTIVITY_AXIS_SOURCES = (
+    ("S", "index"),
+    ("U", "columns"),
+    ("s", "index"),
+    ("u", "columns"),
+    ("bs", "index"),
+    ("bu", "columns"),
+    ("gaa", "index"),
+    ("gac", "index"),
+    ("gca", "columns"),
+    ("Xa", "index"),
+    ("Ya", "index"),
+    ("Va", "columns"),
+    ("va", "columns"),
+    ("Ea", "columns"),
+    ("ea", "columns"),
+)
+_COMMODITY_AXIS_SOURCES = (
+    ("U", "index"),
+    ("S", "columns"),
+    ("u", "index"),
+    ("s", "columns"),
+    ("bu", "index"),
+    ("bs", "columns"),
+    ("gcc", "index"),
+    ("gca", "index"),
+    ("gac", "columns"),
+    ("Xc", "index"),
+    ("Yc", "index"),
+    ("Vc", "columns"),
+    ("vc", "columns"),
+    ("Ec", "columns"),
+    ("ec", "columns"),
+)
+_FINAL_DEMAND_AXIS_SOURCES = (
+    ("Y", "columns"),
+    ("Ya", "columns"),
+    ("Yc", "columns"),
+)
+
+
+def _first_axis(blocks: dict[str, object], sources) -> pd.MultiIndex | None:
+    """Return the first ``MultiIndex`` axis found along one priority list."""
+    return _first_multiindex(*(_take_axis(blocks.get(name), axis) for name, axis in sources))
+
+
+def ordering_sources(names) -> tuple[str, ...]:
+    """Return the blocks among ``names`` that decide the unified SUT ordering.
+
+    :meth:`SUTUnifiedOrderingPolicy.from_blocks` reads each axis from the first
+    available block of a fixed priority list, so only these few blocks (one
+    per axis at most) have to be loaded to build the policy. The unified axis
+    is only consulted when a split axis has no source of its own.
+    """
+    available = set(names)
+
+    def first(sources):
+        return next((name for name, _ in sources if name in available), None)
+
+    activity = first(_ACTIVITY_AXIS_SOURCES)
+    commodity = first(_COMMODITY_AXIS_SOURCES)
+    unified = first(_UNIFIED_AXIS_SOURCES) if activity is None or commodity is None else None
+    used = (unified, activity, commodity, first(_FINAL_DEMAND_AXIS_SOURCES))
+    return tuple(dict.fromkeys(name for name in used if name is not None))
+
+
 @dataclass(frozen=True)
 class SUTUnifiedOrderingPolicy:
     """Single source of truth for activity/commodity ordering in unified SUT blocks."""
@@ -118,54 +200,10 @@ class SUTUnifiedOrderingPolicy:
         ec: pd.DataFrame | None = None,
     ) -> "SUTUnifiedOrderingPolicy":
         """Infer canonical split and unified ordering from available SUT blocks."""
-        unified_axis = _first_multiindex(
-            _take_axis(Z, "index"),
-            _take_axis(z, "index"),
-            _take_axis(w, "index"),
-            _take_axis(b, "index"),
-            _take_axis(g, "index"),
-            _take_axis(X, "index"),
-            _take_axis(Y, "index"),
-            _take_axis(V, "columns"),
-            _take_axis(v, "columns"),
-            _take_axis(E, "columns"),
-            _take_axis(e, "columns"),
-        )
-
-        activity_index = _first_multiindex(
-            _take_axis(S, "index"),
-            _take_axis(U, "columns"),
-            _take_axis(s, "index"),
-            _take_axis(u, "columns"),
-            _take_axis(bs, "index"),
-            _take_axis(bu, "columns"),
-            _take_axis(gaa, "index"),
-            _take_axis(gac, "index"),
-            _take_axis(gca, "columns"),
-            _take_axis(Xa, "index"),
-            _take_axis(Ya, "index"),
-            _take_axis(Va, "columns"),
-            _take_axis(va, "columns"),
-            _take_axis(Ea, "columns"),
-            _take_axis(ea, "columns"),
-        )
-        commodity_index = _first_multiindex(
-            _take_axis(U, "index"),
-            _take_axis(S, "columns"),
-            _take_axis(u, "index"),
-            _take_axis(s, "columns"),
-            _take_axis(bu, "index"),
-            _take_axis(bs, "columns"),
-            _take_axis(gcc, "index"),
-            _take_axis(gca, "index"),
-            _take_axis(gac, "columns"),
-            _take_axis(Xc, "index"),
-            _take_axis(Yc, "index"),
-            _take_axis(Vc, "columns"),
-            _take_axis(vc, "columns"),
-            _take_axis(Ec, "columns"),
-            _take_axis(ec, "columns"),
-        )
+        blocks = {name: value for name, value in locals().items() if name != "cls"}
+        unified_axis = _first_axis(blocks, _UNIFIED_AXIS_SOURCES)
+        activity_index = _first_axis(blocks, _ACTIVITY_AXIS_SOURCES)
+        commodity_index = _first_axis(blocks, _COMMODITY_AXIS_SOURCES)
 
         if unified_axis is not None:
             unified_axis = _require_multiindex(unified_axis, "unified_axis")
@@ -179,11 +217,7 @@ class SUTUnifiedOrderingPolicy:
                 "Cannot build SUT ordering policy without enough activity and commodity indexes."
             )
 
-        final_demand_columns = _first_multiindex(
-            _take_axis(Y, "columns"),
-            _take_axis(Ya, "columns"),
-            _take_axis(Yc, "columns"),
-        )
+        final_demand_columns = _first_axis(blocks, _FINAL_DEMAND_AXIS_SOURCES)
 
         return cls(
             activity_index=activity_index,
@@ -206,3 +240,103 @@ class SUTUnifiedOrderingPolicy:
     def commodity_columns(self, block: pd.DataFrame) -> pd.DataFrame:
         """Return the commodity-column slice of a unified SUT block."""
         return block.loc[:, self.commodity_index]
+
+
+def _reference(token):
+    """Return a weak reference to ``token`` when possible, else the token itself."""
+    try:
+        return weakref.ref(token)
+    except TypeError:
+        return lambda: token
+
+
+@dataclass(frozen=True)
+class OrderingCacheStats:
+    """Counters describing how one ordering cache has been used."""
+
+    builds: int
+    hits: int
+    entries: int
+
+
+class OrderingCache:
+    """Per-model cache of SUT ordering policies, one entry per scenario.
+
+    An entry is keyed by the blocks returned by :func:`ordering_sources` and
+    by tokens identifying their stored versions (the stored object or its
+    storage record). Writing any of those blocks replaces its token, so the
+    next lookup rebuilds the policy from the new axes; writes to other blocks
+    keep the cached policy.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._entries: dict[str, tuple[dict[str, object], SUTUnifiedOrderingPolicy]] = {}
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._hits = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached scenario policies."""
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        """Return an empty cache; copies rebuild their policies lazily."""
+        return OrderingCache()
+
+    def __getstate__(self):
+        """Pickle nothing: cached tokens hold weak references."""
+        return {}
+
+    def __setstate__(self, state):
+        """Restore an empty cache."""
+        self.__init__()
+
+    def lookup(self, scenario: str, tokens: dict[str, object]) -> SUTUnifiedOrderingPolicy | None:
+        """Return the cached policy of ``scenario`` when its source tokens still match."""
+        with self._lock:
+            entry = self._entries.get(scenario)
+            if entry is not None:
+                references, policy = entry
+                if references.keys() == tokens.keys() and all(
+                    references[name]() is token for name, token in tokens.items()
+                ):
+                    self._hits += 1
+                    return policy
+            self._builds += 1
+            return None
+
+    def store(self, scenario: str, tokens: dict[str, object], policy: SUTUnifiedOrderingPolicy) -> None:
+        """Cache one freshly built policy for ``scenario``."""
+        with self._lock:
+            self._entries[scenario] = ({name: _reference(token) for name, token in tokens.items()}, policy)
+
+    def clear(self) -> None:
+        """Drop every cached policy."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> OrderingCacheStats:
+        """Return usage counters for diagnostics and tests."""
+        with self._lock:
+            return OrderingCacheStats(builds=self._builds, hits=self._hits, entries=len(self._entries))
+
+
+def model_ordering_cache(dataset) -> OrderingCache:
+    """Return the ordering cache attached to one dataset-like object.
+
+    Like the factorization cache, it is created lazily on the dataset so every
+    resolver bound to the same model shares it.
+    """
+    state = getattr(dataset, "__dict__", None)
+    if state is None:
+        return OrderingCache()
+    cache = state.get("_ordering_cache")
+    if isinstance(cache, OrderingCache):
+        return cache
+    cache = OrderingCache()
+    try:
+        state["_ordering_cache"] = cache
+    except TypeError:
+        pass
+    return cache
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, MutableMapping
+import inspect
 
 from mario.compute.catalog import get_matrix_spec
 from mario.compute.operators import get_registered_operator
@@ -66,6 +67,17 @@ _SUT_INVERSE_FORMULAS = {
 }
 
 
+def _accepts_keyword(function, keyword: str) -> bool:
+    """Return whether ``function`` accepts one keyword argument."""
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return keyword in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
 class ResolutionStore:
     """Minimal adapter over databases and in-memory mappings."""
 
@@ -110,11 +122,31 @@ class ResolutionStore:
             return dataset.get_block(name, scenario=self.scenario)
         return self._scenario_mapping()[name]
 
-    def set(self, name: str, value) -> None:
-        """Persist one materialized block back to the wrapped dataset."""
+    def token(self, name: str):
+        """Return an object identifying the stored version of ``name``.
+
+        Datasets that keep block records next to their payloads (such as the
+        internal ``ModelState``) return the record, so repository-backed
+        blocks are not loaded just to check whether they changed.
+        """
+        dataset = self.dataset
+        resolve_record = getattr(dataset, "_resolve_block_record", None)
+        if resolve_record is not None:
+            return resolve_record(name, scenario=self.scenario)
+        return self.get(name)
+
+    def set(self, name: str, value, inputs=None) -> None:
+        """Persist one materialized block back to the wrapped dataset.
+
+        ``inputs`` lists the blocks ``value`` was computed from; datasets whose
+        ``set_block`` accepts ``derived_from`` record it as block lineage.
+        """
         dataset = self.dataset
         if hasattr(dataset, "set_block"):
-            dataset.set_block(name, value, scenario=self.scenario)
+            if inputs is not None and _accepts_keyword(dataset.set_block, "derived_from"):
+                dataset.set_block(name, value, scenario=self.scenario, derived_from=tuple(inputs))
+            else:
+                dataset.set_block(name, value, scenario=self.scenario)
             return
         self._scenario_mapping()[name] = value
 
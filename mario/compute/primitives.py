@@ -7,7 +7,7 @@ import logging
 import numpy as np
 import pandas as pd
 
-from mario.compute.helpers import dense_values, inverse_vector
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values, inverse_vector
 from mario.compute.iot_formulas import (
     build_iot_b_from_X_Z,
     build_iot_E_from_e_X,
@@ -64,6 +64,7 @@ def calc_all_shock(
     method: str | None = None,
     solver: str | None = None,
     strategy: str | None = None,
+    X=None,
 ):
     """Recompute the main IOT blocks after shocking direct coefficients.
 
@@ -77,8 +78,13 @@ def calc_all_shock(
         Optional linear solver override passed to the direct ``X`` solve.
     strategy:
         Optional sparse linear strategy override passed to the direct ``X`` solve.
+    X:
+        Optional production vector already solved for the shocked system, for
+        example through a low-rank update of the baseline. When given, the
+        direct ``X`` solve is skipped.
     """
-    X = calc_X_from_z(z, Y, method=method, solver=solver, strategy=strategy)
+    if X is None:
+        X = calc_X_from_z(z, Y, method=method, solver=solver, strategy=strategy)
     E = calc_E(e, X)
     V = calc_V(v, X)
     Z = calc_Z(z, X)
@@ -691,74 +697,91 @@ def X_inverse(X):
     return dense_values(inverse_vector(X))
 
 
-def linkages_calculation(cut_diag, matrices, multi_mode, normalized):
-    """Return backward and forward linkage indicators."""
-    def _safe_ratio(numerator, denominator):
-        ratio = numerator.astype(float).div(denominator.astype(float))
-        return ratio.where(denominator.astype(float) != 0)
+def _linkage_values(block, cut_diag):
+    """Return the numeric payload of one linkage block, optionally without its diagonal.
 
-    def _safe_share(part, whole):
-        share = part.astype(float).div(whole.astype(float))
-        return share.where(whole.astype(float) != 0)
+    Sparse-backed frames stay sparse (CSR) so large tables are reduced
+    without densifying them.
+    """
+    from scipy import sparse
 
+    if _is_sparse_backed_dataframe(block):
+        values = block.sparse.to_coo().tocsr().astype(float)
+        if cut_diag:
+            values.setdiag(0.0)
+            values.eliminate_zeros()
+        return values
+
+    values = dense_values(block, copy=True)
     if cut_diag:
-        for value in matrices.values():
-            for position in range(min(value.shape)):
-                value.iat[position, position] = 0.0
+        np.fill_diagonal(values, 0.0)
+    return values
 
-    if multi_mode:
-        link_types = [
-            "Total Forward",
-            "Total Backward",
-            "Direct Forward",
-            "Direct Backward",
-        ]
-        geo_types = ["Local", "Foreign"]
-        links = pd.DataFrame(
-            0.0,
-            index=matrices[_ENUM.g].index,
-            columns=pd.MultiIndex.from_product([link_types, geo_types]),
-        )
 
-        for index, _ in links.iterrows():
-            links.loc[index, ("Total Forward", "Local")] = (
-                matrices[_ENUM.g].loc[index, index[0]].sum().sum()
-            )
-            links.loc[index, ("Total Forward", "Foreign")] = (
-                matrices[_ENUM.g].loc[index].sum().sum()
-                - matrices[_ENUM.g].loc[index, index[0]].sum().sum()
-            )
+def _region_indicator(labels, regions):
+    """Return the one-hot ``len(labels) x len(regions)`` region membership matrix."""
+    codes = regions.get_indexer(labels)
+    indicator = np.zeros((len(labels), len(regions)), dtype=float)
+    indicator[np.arange(len(labels)), codes] = 1.0
+    return indicator, codes
 
-            links.loc[index, ("Total Backward", "Local")] = (
-                matrices[_ENUM.w].T.loc[index, index[0]].sum().sum()
-            )
-            links.loc[index, ("Total Backward", "Foreign")] = (
-                matrices[_ENUM.w].T.loc[index].sum().sum()
-                - matrices[_ENUM.w].T.loc[index, index[0]].sum().sum()
-            )
 
-            links.loc[index, ("Direct Forward", "Local")] = (
-                matrices[_ENUM.b].loc[index, index[0]].sum().sum()
-            )
-            links.loc[index, ("Direct Forward", "Foreign")] = (
-                matrices[_ENUM.b].loc[index].sum().sum()
-                - matrices[_ENUM.b].loc[index, index[0]].sum().sum()
-            )
+def _local_and_total(values, row_regions, column_regions, *, axis):
+    """Split row (``axis=1``) or column (``axis=0``) sums by region membership.
 
-            links.loc[index, ("Direct Backward", "Local")] = (
-                matrices[_ENUM.z].T.loc[index, index[0]].sum().sum()
-            )
-            links.loc[index, ("Direct Backward", "Foreign")] = (
-                matrices[_ENUM.z].T.loc[index].sum().sum()
-                - matrices[_ENUM.z].T.loc[index, index[0]].sum().sum()
-            )
+    ``Local`` keeps the entries whose counterpart shares the region of the
+    row (forward) or column (backward); both are obtained with one product
+    against a region indicator instead of label slicing per sector.
+    """
+    regions = pd.Index(row_regions.append(column_regions).unique())
+    if axis == 1:
+        indicator, _ = _region_indicator(column_regions, regions)
+        _, own = _region_indicator(row_regions, regions)
+        by_region = np.asarray(values @ indicator)
+        local = by_region[np.arange(by_region.shape[0]), own]
+    else:
+        indicator, _ = _region_indicator(row_regions, regions)
+        _, own = _region_indicator(column_regions, regions)
+        by_region = np.asarray((values.T @ indicator))
+        local = by_region[np.arange(by_region.shape[0]), own]
+    total = np.asarray(values.sum(axis=axis)).ravel()
+    return local, total
+
+
+_LINKAGE_MEASURES = ("Total Forward", "Total Backward", "Direct Forward", "Direct Backward")
+
+# Identity columns solved per batch when the diagonal of an inverse is needed
+# without materializing it.
+LINKAGE_DIAGONAL_CHUNK_SIZE = 256
 
-        base_totals = {
-            "Total Forward": links[("Total Forward", "Local")] + links[("Total Forward", "Foreign")],
-            "Total Backward": links[("Total Backward", "Local")] + links[("Total Backward", "Foreign")],
-            "Direct Forward": links[("Direct Forward", "Local")] + links[("Direct Forward", "Foreign")],
-            "Direct Backward": links[("Direct Backward", "Local")] + links[("Direct Backward", "Foreign")],
-        }
+
+def _linkages_frame(measures, index, multi_mode, normalized):
+    """Assemble the linkage dataframe from per-measure local and total sums.
+
+    ``measures`` maps each linkage measure to ``(labels, local, total)``
+    arrays, where ``labels`` is the axis the sums refer to.
+    """
+    def _safe_ratio(numerator, denominator):
+        ratio = numerator.astype(float).div(denominator.astype(float))
+        return ratio.where(denominator.astype(float) != 0)
+
+    def _safe_share(part, whole):
+        share = part.astype(float).div(whole.astype(float))
+        return share.where(whole.astype(float) != 0)
+
+    if multi_mode:
+        columns = {}
+        base_totals = {}
+        for measure in _LINKAGE_MEASURES:
+            labels, local, total = measures[measure]
+            local = pd.Series(local, index=labels).reindex(index)
+            total = pd.Series(total, index=labels).reindex(index)
+            columns[(measure, "Local")] = local
+            columns[(measure, "Foreign")] = total - local
+            base_totals[measure] = columns[(measure, "Local")] + columns[(measure, "Foreign")]
+
+        links = pd.DataFrame(columns, index=index)
+        links.columns = pd.MultiIndex.from_tuples(links.columns)
 
         share_columns = {}
         for measure, total in base_totals.items():
@@ -776,48 +799,171 @@ def linkages_calculation(cut_diag, matrices, multi_mode, normalized):
                 "Normalization not available for multi-regional mode.",
                 "warning",
             )
+        return links
+
+    def _totals(measure):
+        labels, _, total = measures[measure]
+        return pd.DataFrame({measure: total}, index=labels)
+
+    forward_total = _totals("Total Forward")
+    backward_total = _totals("Total Backward")
+    forward_direct = _totals("Direct Forward")
+    backward_direct = _totals("Direct Backward")
+    forward_amplification = _safe_ratio(forward_total.iloc[:, 0], forward_direct.iloc[:, 0]).to_frame(
+        "Forward Amplification"
+    )
+    backward_amplification = _safe_ratio(
+        backward_total.iloc[:, 0], backward_direct.iloc[:, 0]
+    ).to_frame("Backward Amplification")
 
-    else:
-        forward_total = matrices[_ENUM.g].sum(axis=1).to_frame().astype(float)
-        backward_total = matrices[_ENUM.w].sum(axis=0).to_frame().astype(float)
-        forward_direct = matrices[_ENUM.b].sum(axis=1).to_frame().astype(float)
-        backward_direct = matrices[_ENUM.z].sum(axis=0).to_frame().astype(float)
-
-        forward_total.columns = ["Total Forward"]
-        backward_total.columns = ["Total Backward"]
-        forward_direct.columns = ["Direct Forward"]
-        backward_direct.columns = ["Direct Backward"]
-        forward_amplification = _safe_ratio(forward_total.iloc[:, 0], forward_direct.iloc[:, 0]).to_frame(
-            "Forward Amplification"
+    if normalized:
+        forward_total.iloc[:, 0] = forward_total.iloc[:, 0] / np.average(
+            dense_values(forward_total)
+        )
+        backward_total.iloc[:, 0] = backward_total.iloc[:, 0] / np.average(
+            dense_values(backward_total)
+        )
+        forward_direct.iloc[:, 0] = forward_direct.iloc[:, 0] / np.average(
+            dense_values(forward_direct)
+        )
+        backward_direct.iloc[:, 0] = backward_direct.iloc[:, 0] / np.average(
+            dense_values(backward_direct)
         )
-        backward_amplification = _safe_ratio(
-            backward_total.iloc[:, 0], backward_direct.iloc[:, 0]
-        ).to_frame("Backward Amplification")
 
-        if normalized:
-            forward_total.iloc[:, 0] = forward_total.iloc[:, 0] / np.average(
-                dense_values(forward_total)
-            )
-            backward_total.iloc[:, 0] = backward_total.iloc[:, 0] / np.average(
-                dense_values(backward_total)
-            )
-            forward_direct.iloc[:, 0] = forward_direct.iloc[:, 0] / np.average(
-                dense_values(forward_direct)
+    return pd.concat(
+        [
+            forward_total,
+            backward_total,
+            forward_direct,
+            backward_direct,
+            forward_amplification,
+            backward_amplification,
+        ],
+        axis=1,
+    )
+
+
+def _direct_linkage_measures(z, b, cut_diag, multi_mode):
+    """Return the direct forward (``b`` rows) and backward (``z`` columns) sums."""
+    measures = {}
+    for measure, block, axis in (("Direct Forward", b, 1), ("Direct Backward", z, 0)):
+        values = _linkage_values(block, cut_diag)
+        labels = block.index if axis == 1 else block.columns
+        if multi_mode:
+            local, total = _local_and_total(
+                values,
+                block.index.get_level_values(0),
+                block.columns.get_level_values(0),
+                axis=axis,
             )
-            backward_direct.iloc[:, 0] = backward_direct.iloc[:, 0] / np.average(
-                dense_values(backward_direct)
+        else:
+            local, total = None, np.asarray(values.sum(axis=axis)).ravel()
+        measures[measure] = (labels, local, total)
+    return measures
+
+
+def linkages_calculation(cut_diag, matrices, multi_mode, normalized):
+    """Return backward and forward linkage indicators."""
+    measures = _direct_linkage_measures(matrices[_ENUM.z], matrices[_ENUM.b], cut_diag, multi_mode)
+    # Forward measures split each row over the column regions; backward
+    # measures split each column over the row regions.
+    for measure, name, axis in (("Total Forward", _ENUM.g, 1), ("Total Backward", _ENUM.w, 0)):
+        block = matrices[name]
+        values = _linkage_values(block, cut_diag)
+        labels = block.index if axis == 1 else block.columns
+        if multi_mode:
+            local, total = _local_and_total(
+                values,
+                block.index.get_level_values(0),
+                block.columns.get_level_values(0),
+                axis=axis,
             )
+        else:
+            local, total = None, np.asarray(values.sum(axis=axis)).ravel()
+        measures[measure] = (labels, local, total)
+
+    return _linkages_frame(measures, matrices[_ENUM.g].index, multi_mode, normalized)
 
-        links = pd.concat(
-            [
-                forward_total,
-                backward_total,
-                forward_direct,
-                backward_direct,
-                forward_amplification,
-                backward_amplification,
-            ],
-            axis=1,
+
+def _inverse_diagonal(coefficients, *, transpose, context=None, resolver=None):
+    """Return the diagonal of ``(I - coefficients)^-1`` without storing the inverse.
+
+    Identity columns are solved in batches of
+    :data:`LINKAGE_DIAGONAL_CHUNK_SIZE`, so peak memory stays at
+    ``n x chunk`` values.
+    """
+    from mario.compute.iot_formulas import _solve_iot_system
+
+    size = coefficients.shape[0]
+    diagonal = np.empty(size, dtype=float)
+    for start in range(0, size, LINKAGE_DIAGONAL_CHUNK_SIZE):
+        stop = min(start + LINKAGE_DIAGONAL_CHUNK_SIZE, size)
+        identity = np.zeros((size, stop - start), dtype=float)
+        identity[np.arange(start, stop), np.arange(stop - start)] = 1.0
+        solved = _solve_iot_system(
+            coefficients,
+            pd.DataFrame(identity, index=coefficients.index),
+            transpose=transpose,
+            context=context,
+            resolver=resolver,
         )
+        diagonal[start:stop] = dense_values(solved)[np.arange(start, stop), np.arange(stop - start)]
+    return diagonal
+
 
-    return links
+def linkages_calculation_solve(
+    cut_diag,
+    z,
+    b,
+    multi_mode,
+    normalized,
+    *,
+    context=None,
+    resolver=None,
+):
+    """Return linkage indicators without materializing ``w`` or ``g``.
+
+    Column sums of ``w = (I - z)^-1`` come from one transposed solve and row
+    sums of ``g = (I - b)^-1`` from one direct solve, using region indicator
+    columns as right-hand sides so the local/foreign split costs one column
+    per region. With ``cut_diag`` the diagonals of ``w`` and ``g`` are
+    extracted by solving identity columns in chunks.
+    """
+    from mario.compute.iot_formulas import _solve_iot_system
+
+    measures = _direct_linkage_measures(z, b, cut_diag, multi_mode)
+    for measure, coefficients, transpose in (
+        ("Total Forward", b, False),
+        ("Total Backward", z, True),
+    ):
+        # Forward sums run over the columns of g, backward sums over the rows
+        # of w; both are the summed axis of the solved right-hand sides.
+        labels = coefficients.index if not transpose else coefficients.columns
+        summed_axis = coefficients.columns if not transpose else coefficients.index
+        if multi_mode:
+            regions = pd.Index(
+                labels.get_level_values(0).append(summed_axis.get_level_values(0)).unique()
+            )
+            indicator, _ = _region_indicator(summed_axis.get_level_values(0), regions)
+            _, own = _region_indicator(labels.get_level_values(0), regions)
+        else:
+            indicator, own = np.ones((len(summed_axis), 1), dtype=float), np.zeros(len(labels), dtype=int)
+
+        by_region = dense_values(
+            _solve_iot_system(
+                coefficients,
+                pd.DataFrame(indicator, index=coefficients.index),
+                transpose=transpose,
+                context=context,
+                resolver=resolver,
+            )
+        )
+        local = by_region[np.arange(by_region.shape[0]), own]
+        total = by_region.sum(axis=1)
+        if cut_diag:
+            diagonal = _inverse_diagonal(coefficients, transpose=transpose, context=context, resolver=resolver)
+            local = local - diagonal
+            total = total - diagonal
+        measures[measure] = (labels, local if multi_mode else None, total)
+
+    return _linkages_frame(measures, b.index, multi_mode, normalized)
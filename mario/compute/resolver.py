@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import inspect
 import logging
+import threading
 
 from mario.compute import iot_formulas, sut_formulas, views
+from mario.compute.factorization import model_factorization_cache
 from mario.compute.graph import build_dependency_graph, render_dependency_graph
+from mario.compute.linear import default_linear_workers, limited_linear_workers
 from mario.compute.operators import execute_registered_operator
-from mario.compute.ordering import SUTUnifiedOrderingPolicy
+from mario.compute.ordering import OrderingCache, SUTUnifiedOrderingPolicy, model_ordering_cache, ordering_sources
 from mario.compute.planner import (
     ResolutionStore,
     build_plan,
@@ -16,7 +20,8 @@ from mario.compute.planner import (
     classify_iot_formula_strategy,
     resolve_table_kind,
 )
-from mario.compute.runtime import effective_compute_options
+from mario.compute.rows import ROW_LINEAR_INPUTS, model_row_cache
+from mario.compute.runtime import effective_compute_options, resolver_max_workers
 from mario.compute.types import (
     ConcatStrategy,
     ExtractStrategy,
@@ -73,16 +78,43 @@ def _build_ordering(
     extra_blocks: dict[str, object] | None = None,
     *,
     visible_blocks: dict[str, object] | None = None,
+    cache: OrderingCache | None = None,
 ):
-    """Build the unified SUT ordering policy from visible blocks and overrides."""
-    blocks = _collect_blocks(store)
-    if visible_blocks:
-        blocks.update(visible_blocks)
+    """Return the unified SUT ordering policy from visible blocks and overrides.
+
+    Only the blocks that decide the ordering (see :func:`ordering_sources`)
+    are read. With a ``cache``, the policy is reused while those blocks keep
+    the same stored versions.
+    """
+    overrides = dict(visible_blocks or {})
     if extra_blocks:
-        blocks.update(extra_blocks)
+        overrides.update(extra_blocks)
+    sources = ordering_sources(set(store.names()).union(overrides))
+
+    tokens = None
+    if cache is not None:
+        tokens = {name: overrides[name] if name in overrides else store.token(name) for name in sources}
+        policy = cache.lookup(store.scenario, tokens)
+        if policy is not None:
+            return policy
+
+    try:
+        policy = SUTUnifiedOrderingPolicy.from_blocks(
+            **{name: overrides[name] if name in overrides else store.get(name) for name in sources}
+        )
+    except (TypeError, ValueError):
+        # A source block without a canonical axis: fall back to every visible
+        # block, as the priority lists then continue past it.
+        blocks = _collect_blocks(store)
+        blocks.update(overrides)
+        parameters = inspect.signature(SUTUnifiedOrderingPolicy.from_blocks).parameters
+        return SUTUnifiedOrderingPolicy.from_blocks(
+            **{name: block for name, block in blocks.items() if name in parameters}
+        )
 
-    kwargs = {name: block for name, block in blocks.items() if name in inspect.signature(SUTUnifiedOrderingPolicy.from_blocks).parameters}
-    return SUTUnifiedOrderingPolicy.from_blocks(**kwargs)
+    if cache is not None:
+        cache.store(store.scenario, tokens, policy)
+    return policy
 
 
 def _execute_strategy(
@@ -113,6 +145,7 @@ def _execute_strategy(
                 store,
                 {strategy.source: source},
                 visible_blocks=getattr(resolver, "_memo", None),
+                cache=getattr(resolver, "_ordering_cache", None),
             )
             return function(source, ordering)
         return function(source)
@@ -128,6 +161,7 @@ def _execute_strategy(
                 store,
                 {name: value for name, value in zip(strategy.sources, blocks)},
                 visible_blocks=getattr(resolver, "_memo", None),
+                cache=getattr(resolver, "_ordering_cache", None),
             )
             return function(*blocks, ordering)
         return function(*blocks)
@@ -214,11 +248,35 @@ class Resolver:
         self.store = ResolutionStore(dataset, scenario=scenario)
         self.table_kind = resolve_table_kind(dataset, self.context)
         self._memo: dict[str, object] = {}
-        self._active: list[str] = []
-        self._linear_solver_cache: dict[tuple[object, ...], object] = {}
+        # Blocks each target read while it was being resolved; persisted
+        # blocks record them as lineage for incremental invalidation.
+        self._reads: dict[str, set[str]] = {}
+        # Dependency stacks are per thread so concurrent plan steps keep
+        # independent cycle detection.
+        self._thread_state = threading.local()
+        # Guards memo, lineage and store writes, and the futures of targets
+        # being resolved, so concurrent steps never resolve one block twice.
+        self._lock = threading.RLock()
+        self._in_flight: dict[str, tuple[Future, int]] = {}
+        self._waiting: dict[int, str] = {}
+        self._linear_solver_cache = model_factorization_cache(dataset)
+        self._ordering_cache = model_ordering_cache(dataset)
         self._requested_targets: set[str] = set()
         self._materialization_mode = _normalize_materialization_mode(self.context)
 
+    def _local_state(self):
+        """Return the per-thread resolution state, creating it on first use."""
+        state = self._thread_state
+        if not hasattr(state, "active"):
+            state.active = []
+            state.log_root = True
+        return state
+
+    @property
+    def _active(self) -> list[str]:
+        """Return the dependency stack of the calling thread."""
+        return self._local_state().active
+
     def _visible_has(self, target: str) -> bool:
         """Return whether one block is visible through persisted or memoized state."""
         return target in self._memo or self.store.has(target)
@@ -229,6 +287,34 @@ class Resolver:
             return self._memo[target]
         return self.store.get(target)
 
+    def _record_read(self, target: str, dependency: str) -> None:
+        """Record that ``target`` was computed from ``dependency``."""
+        if dependency != target:
+            with self._lock:
+                self._reads.setdefault(target, set()).add(dependency)
+
+    def _inputs_of(self, target: str) -> set[str]:
+        """Return every block ``target`` was computed from, through memoized steps.
+
+        Inputs that were only kept in memory are followed transitively, so a
+        persisted block still depends on the stored blocks behind them.
+        """
+        inputs: set[str] = set()
+        with self._lock:
+            pending = list(self._reads.get(target, ()))
+            while pending:
+                name = pending.pop()
+                if name in inputs or name == target:
+                    continue
+                inputs.add(name)
+                pending.extend(self._reads.get(name, ()))
+        return inputs
+
+    def _persist(self, target: str, value) -> None:
+        """Store one resolved block together with the blocks it was computed from."""
+        with self._lock:
+            self.store.set(target, value, inputs=self._inputs_of(target))
+
     def _should_persist(self, target: str) -> bool:
         """Return whether one resolved block should remain materialized."""
         if self._materialization_mode == MaterializationMode.ALL.value:
@@ -239,28 +325,32 @@ class Resolver:
 
     def mark_requested_targets(self, targets: list[str] | tuple[str, ...] | set[str]) -> None:
         """Mark a set of user-requested targets as persistent outputs."""
-        self._requested_targets.update(targets)
-        for target in targets:
-            if target in self._memo and not self.store.has(target) and self._should_persist(target):
-                self.store.set(target, self._memo[target])
+        with self._lock:
+            self._requested_targets.update(targets)
+            for target in targets:
+                if target in self._memo and not self.store.has(target) and self._should_persist(target):
+                    self._persist(target, self._memo[target])
 
     def resolve_requested(self, target: str):
         """Resolve one user-requested target and persist it according to policy."""
         self.mark_requested_targets([target])
         value = self.resolve(target)
         if not self.store.has(target) and self._should_persist(target):
-            self.store.set(target, value)
+            self._persist(target, value)
         return value
 
     def resolve(self, target: str):
         """Materialize one target block and store it back into the dataset."""
-        root_request = not self._active
+        root_request = not self._active and self._local_state().log_root
+        if self._active:
+            self._record_read(self._active[-1], target)
         if target in self._memo:
             return self._memo[target]
 
         if self.store.has(target):
             value = self.store.get(target)
-            self._memo[target] = value
+            with self._lock:
+                self._memo.setdefault(target, value)
             if root_request:
                 log_time(logger, f"Resolver: {target} already materialized in {self.scenario}.", "debug")
             return value
@@ -268,6 +358,56 @@ class Resolver:
         if target in self._active:
             raise ResolutionError(f"Dependency cycle detected: {' -> '.join(self._active + [target])}")
 
+        future = self._claim(target)
+        if future is not None:
+            return future.result()
+        future = self._in_flight[target][0]
+        try:
+            value = self._resolve_claimed(target, root_request)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[target]
+
+    def _claim(self, target: str) -> Future | None:
+        """Claim ``target`` for the calling thread, or return the future to wait on.
+
+        Returns ``None`` once the calling thread owns the target. When another
+        thread is resolving it, the caller waits on that thread's future
+        unless the owner is itself waiting on the caller, which would be the
+        dependency cycle a sequential resolution reports.
+        """
+        thread = threading.get_ident()
+        with self._lock:
+            if target in self._memo:
+                done = Future()
+                done.set_result(self._memo[target])
+                return done
+            if target not in self._in_flight:
+                self._in_flight[target] = (Future(), thread)
+                return None
+            future, owner = self._in_flight[target]
+            chain = [target]
+            while owner != thread and self._waiting.get(owner) in self._in_flight:
+                chain.append(self._waiting[owner])
+                owner = self._in_flight[chain[-1]][1]
+            if owner == thread:
+                raise ResolutionError(f"Dependency cycle detected: {' -> '.join(self._active + chain)}")
+            self._waiting[thread] = target
+        try:
+            wait([future])
+        finally:
+            with self._lock:
+                del self._waiting[thread]
+        return future
+
+    def _resolve_claimed(self, target: str, root_request: bool):
+        """Resolve one target claimed by the calling thread through its strategies."""
         if root_request:
             log_time(logger, f"Resolver: resolving {target} for {self.scenario}.", "info")
         self._active.append(target)
@@ -295,6 +435,7 @@ class Resolver:
                         if not self._visible_has(strategy.source):
                             errors.append(f"{strategy.kind.value}: source {strategy.source} is not materialized")
                             continue
+                        self._record_read(target, strategy.source)
                         value = _execute_strategy(strategy, target, self.store, self.table_kind, {}, resolver=self)
                     elif isinstance(strategy, ConcatStrategy):
                         for dependency in strategy.sources:
@@ -325,9 +466,10 @@ class Resolver:
                             resolver=self,
                         )
 
-                    self._memo[target] = value
-                    if self._should_persist(target):
-                        self.store.set(target, value)
+                    with self._lock:
+                        self._memo[target] = value
+                        if self._should_persist(target):
+                            self._persist(target, value)
                     if _should_emit_info_resolution_log(root_request=root_request, strategy=strategy):
                         log_time(
                             logger,
@@ -351,11 +493,170 @@ class Resolver:
             log_time(logger, f"Resolver: failed to resolve {target}.", "warning")
         raise ResolutionError(f"Unable to resolve {target}.\n" + "\n".join(errors) + "\n" + explanation)
 
+    def _row_strategies(self, target: str) -> list:
+        """Return the formula strategies of ``target`` that can run on a row subset.
+
+        Strategies whose inputs are all visible come first, then transposed
+        solves, so a row subset never builds a full Leontief inverse.
+        """
+        row_inputs = set(ROW_LINEAR_INPUTS.get(target, ()))
+        strategies = [
+            strategy
+            for strategy in candidate_strategies(target, self.dataset, self.scenario, self.context)
+            if isinstance(strategy, FormulaStrategy) and row_inputs.intersection(strategy.inputs)
+        ]
+        return sorted(
+            strategies,
+            key=lambda strategy: (
+                not all(self._visible_has(name) for name in strategy.inputs),
+                classify_iot_formula_strategy(strategy) != "solve",
+            ),
+        )
+
+    def resolve_rows(self, target: str, rows):
+        """Return the rows ``rows`` of one target without materializing it.
+
+        Multiplier blocks (``f``, ``m``, ``fa``, ``fc``, ``ma``, ``mc``) are
+        computed from the same rows of their direct coefficients, so a
+        transposed solve only carries those rows as right-hand sides. Results
+        are cached on the model per scenario, target and rows until one of
+        the stored blocks they were computed from changes; callers get a
+        shallow copy, so editing it never alters the cached rows. Other
+        targets, and targets already visible, are resolved in full and
+        sliced.
+        """
+        rows = list(rows)
+        if self._visible_has(target) or target not in ROW_LINEAR_INPUTS:
+            return self.resolve(target).loc[rows]
+
+        cache = model_row_cache(self.dataset)
+        key = (self.scenario, target, tuple(rows))
+        cached = cache.lookup(key, self.store.token)
+        if cached is not None:
+            return cached.copy(deep=False)
+
+        # Reads are recorded under a private name so the lineage of the row
+        # subset can be traced back to stored blocks for invalidation.
+        reader = f"{target}[rows]"
+        errors: list[str] = []
+        for strategy in self._row_strategies(target):
+            self._active.append(reader)
+            try:
+                dependencies = {name: self.resolve(name) for name in strategy.inputs}
+                for name in ROW_LINEAR_INPUTS[target]:
+                    if name in dependencies:
+                        missing = [row for row in rows if row not in dependencies[name].index]
+                        if missing:
+                            raise KeyError(f"Rows {missing} are not in {name}.")
+                        dependencies[name] = dependencies[name].loc[rows]
+                value = _execute_strategy(
+                    strategy,
+                    target,
+                    self.store,
+                    self.table_kind,
+                    dependencies,
+                    resolver=self,
+                )
+            except (ResolutionError, NotImplementable) as exc:
+                errors.append(f"{strategy.kind.value}: {exc}")
+                continue
+            finally:
+                self._active.pop()
+
+            stored = [name for name in self._inputs_of(reader) if self.store.has(name)]
+            cache.store(key, {name: self.store.token(name) for name in stored}, value.copy(deep=False))
+            log_time(
+                logger,
+                f"Resolver: resolved {len(rows)} row(s) of {target} via formula {strategy.function}.",
+                "debug",
+            )
+            return value
+
+        if errors:
+            log_time(logger, f"Resolver: resolving all rows of {target}.\n" + "\n".join(errors), "debug")
+        return self.resolve(target).loc[rows]
+
     def resolve_many(self, targets: list[str] | tuple[str, ...]):
-        """Resolve several targets and return them as a name-to-block mapping."""
+        """Resolve several targets and return them as a name-to-block mapping.
+
+        With ``ComputeOptions.max_workers`` above one, the plans of all
+        targets are merged into one dependency graph whose independent steps
+        run concurrently on that many threads; by default every target is
+        resolved sequentially. Targets are then read back in order, which
+        also reports any step that failed with the usual sequential error
+        messages.
+        """
         self.mark_requested_targets(targets)
+        workers = resolver_max_workers(self.context)
+        if workers > 1:
+            self._execute_plan(targets, workers)
         return {target: self.resolve(target) for target in targets}
 
+    def _merged_plan(self, targets) -> dict[str, tuple[str, ...]]:
+        """Return ``step -> planned dependencies`` for every unresolved target."""
+        steps: dict[str, tuple[str, ...]] = {}
+        for target in targets:
+            if target in self._memo or target in steps:
+                continue
+            try:
+                plan = self.build_plan(target)
+            except (LookupError, RuntimeError, NotImplementable):
+                # Unplannable targets are left to the sequential pass, which
+                # tries every fallback strategy and reports the failure.
+                continue
+            for step in plan:
+                steps.setdefault(step.key.name, tuple(step.dependencies))
+        return {
+            name: tuple(dependency for dependency in dependencies if dependency in steps)
+            for name, dependencies in steps.items()
+            if name not in self._memo
+        }
+
+    def _execute_plan(self, targets, workers: int) -> None:
+        """Materialize the merged plan of ``targets`` on a thread pool.
+
+        A step is submitted once all its planned dependencies are memoized.
+        Steps whose dependencies failed are skipped; the sequential pass in
+        :meth:`resolve_many` retries them and raises the original error.
+        """
+        steps = self._merged_plan(targets)
+        if len(steps) < 2:
+            return
+
+        requested = set(targets)
+        # Chunked solves inside each step share the cores with the other steps.
+        step_workers = max(1, default_linear_workers() // min(workers, len(steps)))
+        remaining = {name: set(dependencies) for name, dependencies in steps.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in steps}
+        for name, dependencies in steps.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+
+        def run(name: str):
+            # Steps run as fresh roots on worker threads; only the requested
+            # targets keep the root-level info logs.
+            state = self._local_state()
+            state.log_root = name in requested
+            try:
+                with limited_linear_workers(step_workers):
+                    return self.resolve(name)
+            finally:
+                state.log_root = True
+
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        with ThreadPoolExecutor(max_workers=min(workers, len(steps))) as executor:
+            running = {executor.submit(run, name): name for name in ready}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        continue
+                    for dependent in dependents[name]:
+                        remaining[dependent].discard(name)
+                        if not remaining[dependent]:
+                            running[executor.submit(run, dependent)] = dependent
+
     def explain(self, target: str) -> str:
         """Return a human-readable dependency explanation for one target."""
         graph = build_dependency_graph(target, self.dataset, self.scenario, self.context)
@@ -366,9 +667,23 @@ class Resolver:
         return build_plan(target, self.dataset, self.scenario, self.context)
 
 
-def resolve(target: str, dataset, scenario: str = "baseline", context: ResolutionContext | None = None):
-    """Convenience wrapper that resolves one block with a temporary resolver."""
-    return Resolver(dataset, scenario=scenario, context=context).resolve_requested(target)
+def resolve(
+    target: str,
+    dataset,
+    scenario: str = "baseline",
+    context: ResolutionContext | None = None,
+    *,
+    rows=None,
+):
+    """Convenience wrapper that resolves one block with a temporary resolver.
+
+    With ``rows``, only those rows are returned and nothing is materialized
+    (see :meth:`Resolver.resolve_rows`).
+    """
+    resolver = Resolver(dataset, scenario=scenario, context=context)
+    if rows is not None:
+        return resolver.resolve_rows(target, rows)
+    return resolver.resolve_requested(target)
 
 
 def resolve_many(
@@ -0,0 +1,121 @@
+"""Row-selective resolution of multiplier blocks."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+
+from mario.compute.ordering import _reference
+
+# Multiplier blocks whose rows are linear in the rows of their direct
+# coefficient inputs: ``f = e (I - z)^-1`` and the split SUT variants. A row
+# subset of the target is computed from the same row subset of these inputs.
+ROW_LINEAR_INPUTS: dict[str, tuple[str, ...]] = {
+    "f": ("e",),
+    "m": ("v",),
+    "fa": ("ea", "ec"),
+    "fc": ("ea", "ec"),
+    "ma": ("va", "vc"),
+    "mc": ("va", "vc"),
+}
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class RowCacheStats:
+    """Counters describing how one row-selection cache has been used."""
+
+    hits: int
+    misses: int
+    entries: int
+
+
+class RowSelectionCache:
+    """Per-model LRU cache of row subsets resolved by :meth:`Resolver.resolve_rows`.
+
+    Entries are keyed by ``(scenario, target, rows)`` and remember tokens of
+    the stored blocks they were computed from, as in the ordering cache, so
+    writing any of those blocks invalidates the entry.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Create an empty cache holding at most ``max_entries`` row subsets."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[dict[str, object], object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached row subsets."""
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        """Return an empty cache; copies resolve their rows lazily."""
+        return RowSelectionCache(max_entries=self.max_entries)
+
+    def __getstate__(self):
+        """Pickle only the budget: cached tokens hold weak references."""
+        return {"max_entries": self.max_entries}
+
+    def __setstate__(self, state):
+        """Restore an empty cache with the pickled budget."""
+        self.__init__(**state)
+
+    def lookup(self, key: tuple, token_of):
+        """Return the cached block of ``key`` when its source tokens still match.
+
+        ``token_of`` maps a stored block name to its current token.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            references, value = entry
+            try:
+                current = all(reference() is token_of(name) for name, reference in references.items())
+            except KeyError:
+                current = False
+            if current:
+                with self._lock:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                return value
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def store(self, key: tuple, tokens: dict[str, object], value) -> None:
+        """Cache one freshly resolved row subset."""
+        with self._lock:
+            self._entries[key] = ({name: _reference(token) for name, token in tokens.items()}, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached row subset."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> RowCacheStats:
+        """Return usage counters for diagnostics and tests."""
+        with self._lock:
+            return RowCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+
+def model_row_cache(dataset) -> RowSelectionCache:
+    """Return the row-selection cache attached to one dataset-like object."""
+    state = getattr(dataset, "__dict__", None)
+    if state is None:
+        return RowSelectionCache()
+    cache = state.get("_row_selection_cache")
+    if isinstance(cache, RowSelectionCache):
+        return cache
+    cache = RowSelectionCache()
+    try:
+        state["_row_selection_cache"] = cache
+    except TypeError:
+        pass
+    return cache
@@ -156,6 +156,26 @@ def effective_compute_options(context=None) -> RuntimeComputeOptions:
     )
 
 
+def resolver_max_workers(context=None) -> int:
+    """Return the number of threads used to execute independent resolver steps.
+
+    The value comes from ``ComputeOptions.max_workers`` on the resolution
+    context. ``None`` (default) and ``1`` keep execution sequential;
+    concurrency is opt-in because concurrent steps hold their results in
+    memory at the same time.
+    """
+    value = getattr(getattr(context, "compute", None), "max_workers", None)
+    if value is None:
+        return 1
+    try:
+        workers = int(value)
+    except (TypeError, ValueError) as exc:
+        raise WrongInput(f"max_workers should be a positive integer or None, got {value!r}.") from exc
+    if workers < 1 or workers != value:
+        raise WrongInput(f"max_workers should be a positive integer or None, got {value!r}.")
+    return workers
+
+
 def _sysconf_physical_memory_bytes() -> int | None:
     """Return physical memory through POSIX sysconf when available."""
     try:
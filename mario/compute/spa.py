@@ -0,0 +1,200 @@
+"""Integer-indexed structural path analysis kernels.
+
+Paths are explored on the CSC layout of ``z`` with integer node ids. Every
+visited node is stored once in a compact parent-pointer arena, so a path is
+an index into that arena rather than a tuple of labels. Labels are only
+attached to the final top-N paths by the caller.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values
+
+
+@dataclass(frozen=True)
+class StructuralPath:
+    """One ranked supply-chain path.
+
+    ``nodes`` lists integer positions in the ``z`` index, from the most
+    upstream supplier to the node delivering to final demand, and
+    ``demand_column`` is the position of the final-demand column.
+    """
+
+    contribution: float
+    depth: int
+    nodes: np.ndarray
+    demand_column: int
+
+
+def csc_values(block: pd.DataFrame):
+    """Return one coefficient block as a SciPy CSC matrix without densifying sparse frames."""
+    from scipy import sparse
+
+    if _is_sparse_backed_dataframe(block):
+        return block.sparse.to_coo().tocsc()
+    return sparse.csc_matrix(dense_values(block))
+
+
+def _supplier_lists(z_csc, total: np.ndarray):
+    """Return a lazy per-column accessor of ``(rows, coefficients)`` lists.
+
+    Suppliers are ordered by ascending upper bound so that popping them from
+    a stack visits the most promising subtree first, which tightens the
+    top-N threshold early.
+    """
+    indptr = z_csc.indptr
+    indices = z_csc.indices
+    data = z_csc.data
+    cache = {}
+
+    def suppliers(node: int):
+        entry = cache.get(node)
+        if entry is None:
+            start, stop = indptr[node], indptr[node + 1]
+            rows = indices[start:stop]
+            coefficients = data[start:stop]
+            keep = coefficients != 0
+            rows = rows[keep]
+            coefficients = coefficients[keep]
+            order = np.argsort(np.abs(coefficients * total[rows]), kind="stable")
+            entry = (rows[order].tolist(), coefficients[order].tolist())
+            cache[node] = entry
+        return entry
+
+    return suppliers
+
+
+def structural_paths(
+    z_csc,
+    direct: np.ndarray,
+    total: np.ndarray,
+    demand: np.ndarray,
+    *,
+    max_depth: int,
+    cutoff: float = 0.0,
+    top_n: int | None = None,
+) -> list[StructuralPath]:
+    """Return the strongest structural paths of ``direct @ z^k @ demand``.
+
+    Parameters
+    ----------
+    z_csc:
+        Technical coefficients in CSC layout (``n x n``).
+    direct:
+        Direct intensity row (length ``n``).
+    total:
+        Total intensity row (length ``n``), used as an upper bound on what a
+        subtree can contribute when every input is non-negative.
+    demand:
+        Final-demand bundles (``n x k``), one column per final-demand column.
+    max_depth:
+        Maximum number of upstream ``z`` rounds.
+    cutoff:
+        Minimum absolute contribution of a reported path.
+    top_n:
+        Optional cap on the number of retained paths.
+
+    Returns
+    -------
+    list[StructuralPath]
+        Retained paths in no particular order.
+    """
+    direct_values = np.asarray(direct, dtype=float)
+    total_values = np.asarray(total, dtype=float)
+    demand = np.asarray(demand, dtype=float)
+    if demand.ndim == 1:
+        demand = demand[:, None]
+
+    use_bound = bool(
+        (z_csc.data >= 0).all() and (direct_values >= 0).all() and (total_values >= 0).all()
+    )
+    suppliers = _supplier_lists(z_csc, total_values)
+    direct_list = direct_values.tolist()
+    total_list = total_values.tolist()
+
+    # Parent-pointer arena: one entry per retained or expanded node.
+    arena_nodes = array("l")
+    arena_parents = array("l")
+    arena_columns = array("l")
+    heap = []
+    discovered = 0
+    full = top_n is not None
+
+    for column in range(demand.shape[1]):
+        values = demand[:, column]
+        stack = [(int(node), float(values[node]), -1, 0) for node in np.flatnonzero(values)[::-1]]
+
+        while stack:
+            node, weight, parent, depth = stack.pop()
+            contribution = direct_list[node] * weight
+            magnitude = abs(contribution)
+            floor = max(cutoff, heap[0][0]) if full and len(heap) >= top_n else cutoff
+            if use_bound:
+                if total_list[node] * abs(weight) < floor:
+                    continue
+            elif magnitude < cutoff:
+                continue
+
+            retained = magnitude >= cutoff and not (full and len(heap) >= top_n and magnitude <= heap[0][0])
+            expand = depth < max_depth
+            if not (retained or expand):
+                continue
+
+            slot = len(arena_nodes)
+            arena_nodes.append(node)
+            arena_parents.append(parent)
+            arena_columns.append(column)
+
+            if retained:
+                # Ties keep the earlier discovery: the heap orders by magnitude,
+                # then by the negated discovery counter.
+                entry = (magnitude, -discovered, contribution, depth, slot)
+                discovered += 1
+                if full and len(heap) >= top_n:
+                    heapq.heapreplace(heap, entry)
+                else:
+                    heapq.heappush(heap, entry)
+
+            if not expand:
+                continue
+
+            rows, coefficients = suppliers(node)
+            if use_bound:
+                # Suppliers are sorted by bound, so the first one below the
+                # floor (scanning from the strongest) ends the useful range.
+                floor = max(cutoff, heap[0][0]) if full and len(heap) >= top_n else cutoff
+                scale = abs(weight)
+                start = len(rows)
+                while start and total_list[rows[start - 1]] * coefficients[start - 1] * scale >= floor:
+                    start -= 1
+            else:
+                start = 0
+            for position in range(start, len(rows)):
+                stack.append((rows[position], coefficients[position] * weight, slot, depth + 1))
+
+    paths = []
+    for _, _, contribution, depth, slot in heap:
+        nodes = np.empty(depth + 1, dtype=np.int64)
+        cursor = slot
+        for position in range(depth + 1):
+            nodes[position] = arena_nodes[cursor]
+            cursor = arena_parents[cursor]
+        paths.append(
+            StructuralPath(
+                contribution=float(contribution),
+                depth=int(depth),
+                nodes=nodes,
+                demand_column=int(arena_columns[slot]),
+            )
+        )
+    return paths
+
+
+__all__ = ["StructuralPath", "csc_values", "structural_paths"]
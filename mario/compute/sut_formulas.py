@@ -25,6 +25,8 @@ from mario.compute.helpers import (
     transpose_matvec,
     validate_square,
 )
+from mario.compute.factorization import cached_factorization, matrix_fingerprint
+from mario.compute.linear import solve_columns, solve_factor_block
 from mario.compute.runtime import choose_linear_strategy, effective_compute_options
 from mario.log_exc.exceptions import NotImplementable
 from mario.log_exc.logger import log_time
@@ -104,7 +106,6 @@ def _solve_sut_system(
     rhs: pd.DataFrame | pd.Series,
     *,
     transpose: bool = False,
-    cache_key=None,
     context=None,
     resolver=None,
 ) -> pd.DataFrame | pd.Series:
@@ -142,17 +143,14 @@ def _solve_sut_system(
             "debug",
         )
         cache = _resolver_linear_cache(resolver)
-        solver_cache_key = (
-            ("sut", id(product)) if cache_key is None else tuple(cache_key)
-        ) + (bool(transpose), options.linear_solver)
 
         def _get_factor():
-            factor = cache.get(solver_cache_key) if cache is not None else None
-            if factor is None:
-                factor = factorized(lhs_sparse)
-                if cache is not None:
-                    cache[solver_cache_key] = factor
-            return factor
+            if cache is None:
+                return factorized(lhs_sparse)
+            # Keys are content-addressed so factorizations are shared across
+            # resolvers and scenarios holding identical coefficients.
+            solver_cache_key = ("sut", matrix_fingerprint(system), bool(transpose), options.linear_solver)
+            return cached_factorization(cache, solver_cache_key, lhs_sparse)
 
         def _solve_least_squares(rhs_array):
             def _solve_one(vector):
@@ -172,9 +170,7 @@ def _solve_sut_system(
                     )
                 return solved
 
-            if rhs_array.ndim == 1:
-                return _solve_one(rhs_array)
-            return np.column_stack([_solve_one(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_columns(_solve_one, rhs_array)
 
         def _solve_direct(
             rhs_array,
@@ -210,9 +206,7 @@ def _solve_sut_system(
                     )
                     return _solve_least_squares(rhs_array)
                 raise
-            if rhs_array.ndim == 1:
-                return factor(rhs_array)
-            return np.column_stack([factor(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_factor_block(factor, rhs_array)
 
         def _solve_iterative(
             rhs_array,
@@ -272,9 +266,7 @@ def _solve_sut_system(
                     )
                 return solved
 
-            if rhs_array.ndim == 1:
-                return _solve_one(rhs_array)
-            return np.column_stack([_solve_one(rhs_array[:, idx]) for idx in range(rhs_array.shape[1])])
+            return solve_columns(_solve_one, rhs_array)
 
         rhs_values = dense_values(rhs) if isinstance(rhs, (pd.DataFrame, pd.Series)) else np.asarray(rhs, dtype=float)
         solved = _solve_iterative(rhs_values) if linear_strategy == "iterative" else _solve_direct(rhs_values)
@@ -292,7 +284,7 @@ def _solve_sut_system(
         rhs,
         solver=options.linear_solver,
         cache=_resolver_linear_cache(resolver),
-        cache_key=("sut", id(product), bool(transpose), options.linear_solver),
+        cache_key=("sut", matrix_fingerprint(dense_values(product)), bool(transpose), options.linear_solver),
     )
 
 
@@ -320,7 +312,6 @@ def build_sut_wcc_from_u_s_solve(
     return _solve_sut_system(
         product,
         identity_like(product),
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -354,7 +345,6 @@ def build_sut_wca_from_u_s_solve(
     return _solve_sut_system(
         product,
         u,
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -388,7 +378,6 @@ def build_sut_wac_from_s_u_solve(
     return _solve_sut_system(
         product,
         s,
-        cache_key=("sut", "s@u", id(s), id(u)),
         context=context,
         resolver=resolver,
     )
@@ -418,7 +407,6 @@ def build_sut_waa_from_s_u_solve(
     return _solve_sut_system(
         product,
         identity_like(product),
-        cache_key=("sut", "s@u", id(s), id(u)),
         context=context,
         resolver=resolver,
     )
@@ -536,7 +524,6 @@ def build_sut_Xc_from_u_s_Yc(
     total = _solve_sut_system(
         product,
         y_total,
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -905,7 +892,6 @@ def build_sut_ma_from_va_s_u(
         product,
         direct.T,
         transpose=True,
-        cache_key=("sut", "s@u", id(s), id(u)),
         context=context,
         resolver=resolver,
     )
@@ -955,7 +941,6 @@ def build_sut_mc_from_va_s_u(
         product,
         direct.T,
         transpose=True,
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -1036,7 +1021,6 @@ def build_sut_fa_from_ea_s_u(
         product,
         direct.T,
         transpose=True,
-        cache_key=("sut", "s@u", id(s), id(u)),
         context=context,
         resolver=resolver,
     )
@@ -1086,7 +1070,6 @@ def build_sut_fc_from_ea_s_u(
         product,
         direct.T,
         transpose=True,
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -1129,7 +1112,6 @@ def build_sut_pc_from_v_s_u(
         product,
         rhs,
         transpose=True,
-        cache_key=("sut", "u@s", id(u), id(s)),
         context=context,
         resolver=resolver,
     )
@@ -1172,7 +1154,6 @@ def build_sut_pa_from_v_s_u(
         product,
         rhs,
         transpose=True,
-        cache_key=("sut", "s@u", id(s), id(u)),
         context=context,
         resolver=resolver,
     )
@@ -209,6 +209,7 @@ class ComputeOptions:
     auto_inverse_overhead_factor: float | None = None
     debug_explain_decisions: bool = False
     allow_fallbacks: bool = True
+    max_workers: int | None = None
 
 
 @dataclass(frozen=True)
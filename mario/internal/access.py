@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+
 import numpy as np
 import pandas as pd
 
@@ -11,15 +13,60 @@ def _is_sparse_dataframe(value) -> bool:
     return isinstance(value, pd.DataFrame) and any(isinstance(dtype, pd.SparseDtype) for dtype in value.dtypes)
 
 
+def share_block(value):
+    """Return a copy-on-write handle on one block value.
+
+    pandas objects are copied shallowly: with Copy-on-Write (always enabled
+    in pandas 3) the handle shares its buffers with ``value`` until either
+    side is written, at which point only the written block is materialized.
+    Other values are deep-copied.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return copy.deepcopy(value)
+
+
+def block_buffers(value) -> list[tuple[tuple[int, int], int]]:
+    """Return ``((address, nbytes), nbytes)`` for the arrays backing one block.
+
+    Two blocks sharing memory through :func:`share_block` report the same
+    keys, which lets memory reports count shared buffers only once.
+    """
+    if isinstance(value, pd.DataFrame):
+        arrays = list(value._mgr.arrays)
+    elif isinstance(value, pd.Series):
+        arrays = [value.array]
+    elif isinstance(value, np.ndarray):
+        arrays = [value]
+    else:
+        return []
+
+    buffers = []
+    for array in arrays:
+        if isinstance(array, pd.arrays.SparseArray):
+            data = array.sp_values
+            nbytes = int(array.nbytes)
+        else:
+            data = np.asarray(array)
+            nbytes = int(data.nbytes)
+        if data.size == 0:
+            continue
+        address = int(data.__array_interface__["data"][0])
+        buffers.append(((address, int(data.nbytes)), nbytes))
+    return buffers
+
+
 def block_to_pandas(value):
     """Return a pandas copy of one block value.
 
     The public MARIO API still exposes pandas objects. This adapter is the
     single place where future non-pandas backends should be converted when a
-    pandas result is explicitly required.
+    pandas result is explicitly required. pandas blocks are returned as
+    copy-on-write handles (see :func:`share_block`), so reads do not
+    duplicate the stored data.
     """
     if isinstance(value, (pd.DataFrame, pd.Series)):
-        return value.copy(deep=True)
+        return share_block(value)
 
     if hasattr(value, "to_pandas"):
         return value.to_pandas()
@@ -0,0 +1,87 @@
+"""Filter/aggregate queries over stored blocks of many scenarios."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.helpers import _is_sparse_backed_dataframe
+from mario.storage.base import COLUMN_LEVEL_PREFIX, ROW_LEVEL_PREFIX, axis_level_names, axis_mask
+
+
+def frame_cells(
+    block,
+    scenario: str,
+    *,
+    rows: dict[str, object] | None = None,
+    columns: dict[str, object] | None = None,
+    group_rows=None,
+    group_columns=None,
+) -> pd.DataFrame:
+    """Return the long cell frame of one pandas block, filtered and aggregated.
+
+    This is the in-process counterpart of ``query_cells`` on repositories
+    with pushdown, and returns the same layout.
+    """
+    if isinstance(block, pd.Series):
+        block = block.to_frame()
+        if columns or group_columns:
+            raise KeyError("Series blocks have no column levels to filter or group.")
+        group_columns = []
+    row_mask = axis_mask(block.index, dict(rows or {}))
+    column_mask = axis_mask(block.columns, dict(columns or {}))
+    block = block.iloc[row_mask, column_mask]
+
+    if _is_sparse_backed_dataframe(block):
+        matrix = block.sparse.to_coo()
+        row_positions, column_positions, values = matrix.row, matrix.col, matrix.data
+    else:
+        data = block.to_numpy(dtype=float)
+        row_positions, column_positions = np.nonzero(data)
+        values = data[row_positions, column_positions]
+
+    row_names = axis_level_names(block.index)
+    column_names = axis_level_names(block.columns)
+    group_rows = row_names if group_rows is None else [str(level) for level in group_rows]
+    group_columns = column_names if group_columns is None else [str(level) for level in group_columns]
+
+    cells = {"Scenario": np.full(len(values), str(scenario), dtype=object)}
+    for axis, names, levels, positions, prefix in (
+        (block.index, row_names, group_rows, row_positions, ROW_LEVEL_PREFIX),
+        (block.columns, column_names, group_columns, column_positions, COLUMN_LEVEL_PREFIX),
+    ):
+        for level in levels:
+            if level not in names:
+                raise KeyError(f"{level!r} is not a level of the queried axis; levels are {names}.")
+            cells[prefix + level] = axis.get_level_values(names.index(level)).astype(str).to_numpy()[positions]
+    cells["value"] = values
+    long = pd.DataFrame(cells)
+    keys = [name for name in long.columns if name != "value"]
+    return long.groupby(keys, sort=True, as_index=False)["value"].sum()
+
+
+def pivot_cells(long: pd.DataFrame) -> pd.DataFrame:
+    """Reshape a long cell frame to ``(Scenario, row levels) x column levels``.
+
+    Missing combinations are reported as zero. When no column level is kept,
+    the result has a single ``value`` column.
+    """
+    row_columns = [name for name in long.columns if name.startswith(ROW_LEVEL_PREFIX)]
+    column_columns = [name for name in long.columns if name.startswith(COLUMN_LEVEL_PREFIX)]
+    index = ["Scenario", *row_columns]
+
+    if long.empty:
+        result = pd.DataFrame(columns=["value"], dtype=float, index=pd.MultiIndex.from_tuples([], names=index))
+    elif not column_columns:
+        result = long.groupby(index, sort=True)[["value"]].sum()
+    else:
+        result = long.pivot_table(
+            index=index,
+            columns=column_columns,
+            values="value",
+            aggfunc="sum",
+            fill_value=0.0,
+        )
+        result.columns.names = [name[len(COLUMN_LEVEL_PREFIX):] for name in column_columns]
+    result.index.names = ["Scenario", *(name[len(ROW_LEVEL_PREFIX):] for name in row_columns)]
+    return result
@@ -12,6 +12,7 @@ from mario.compute.types import ResolutionContext
 from mario.internal.access import block_to_matrix, block_to_pandas, block_to_table
 from mario.internal.block import StoredBlock
 from mario.internal.metadata import ModelStateMetadata
+from mario.internal.query import frame_cells, pivot_cells
 from mario.internal.scenario import ScenarioState
 from mario.log_exc.logger import log_time
 from mario.model.enums import TableKind
@@ -231,6 +232,83 @@ class ModelState:
             return resolver.resolve_requested(name)
         return resolver.resolve_many(list(name))
 
+    def query(
+        self,
+        name: str,
+        scenarios: str | list[str] | tuple[str, ...] | None = None,
+        *,
+        rows: dict[str, object] | None = None,
+        columns: dict[str, object] | None = None,
+        group_rows=None,
+        group_columns=None,
+    ) -> pd.DataFrame:
+        """Slice and aggregate one stored block across scenarios.
+
+        Parameters
+        ----------
+        name:
+            Stored block to query, for example ``"F"``.
+        scenarios:
+            One or more scenarios; all scenarios when omitted. Inherited
+            blocks are read from the parent scenario.
+        rows, columns:
+            Optional ``level name -> label(s)`` filters, for example
+            ``rows={"Item": "CO2"}`` or ``columns={"Region": ["IT", "FR"]}``.
+            Labels are compared as strings.
+        group_rows, group_columns:
+            Levels kept on each axis; the other levels are summed. ``None``
+            keeps every level and an empty list sums the whole axis.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Results indexed by ``Scenario`` plus the kept row levels, with one
+            column per combination of kept column levels (a single ``value``
+            column when none is kept). Missing combinations are zero.
+
+        Notes
+        -----
+        Repositories that expose ``query_cells`` (such as
+        :class:`mario.storage.DuckDBBlockRepository`) run the filters and the
+        group-by inside the storage engine, so only the aggregated result is
+        loaded. Other repositories load each block and aggregate it in pandas.
+        """
+        if scenarios is None:
+            scenarios = self.list_scenarios()
+        elif isinstance(scenarios, str):
+            scenarios = [scenarios]
+        targets = [
+            (self._resolve_block_record(name, scenario=scenario).storage_key, scenario)
+            for scenario in scenarios
+        ]
+        log_time(logger, f"ModelState: query {name} over {len(targets)} scenario(s).", "debug")
+
+        if hasattr(self.repository, "query_cells"):
+            long = self.repository.query_cells(
+                targets,
+                rows=rows,
+                columns=columns,
+                group_rows=group_rows,
+                group_columns=group_columns,
+            )
+        else:
+            blocks = {key: self.repository.get(key) for key in dict.fromkeys(key for key, _ in targets)}
+            long = pd.concat(
+                [
+                    frame_cells(
+                        blocks[key],
+                        scenario,
+                        rows=rows,
+                        columns=columns,
+                        group_rows=group_rows,
+                        group_columns=group_columns,
+                    )
+                    for key, scenario in targets
+                ],
+                ignore_index=True,
+            )
+        return pivot_cells(long)
+
     def explain(self, name: str, scenario: str = "baseline", context: ResolutionContext | None = None) -> str:
         """Return a dependency explanation for one block."""
         log_time(logger, f"ModelState: explain {name} for {scenario}.", "debug")
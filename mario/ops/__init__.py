@@ -1,7 +1,7 @@
 """Operational modules for the parallel MARIO 2 architecture."""
 
 from mario.ops.aggregation import aggregate_database
-from mario.ops.balance import ras
+from mario.ops.balance import BalanceDiagnostics, ras
 from mario.ops.export import (
     export_database_matrices,
     export_database_to_excel,
@@ -22,6 +22,7 @@ from mario.ops.transforms import (
 )
 
 __all__ = [
+    "BalanceDiagnostics",
     "GHG_PROFILES",
     "aggregate_database",
     "build_new_instance_from_scenario",
@@ -7,9 +7,11 @@ import logging
 import warnings
 from copy import deepcopy
 
+import numpy as np
 import pandas as pd
 import pint
 
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values, sparse_frame_from_spmatrix
 from mario.log_exc.exceptions import LackOfInput, NotImplementable
 from mario.log_exc.logger import log_time
 from mario.model.conventions import IOT, SUT, _ENUM, _MASTER_INDEX as MI
@@ -40,6 +42,90 @@ _MATRIX_SLICES_MAP = {
 }
 
 
+def _sorted_union(*axes: pd.Index) -> pd.Index:
+    """Return the union of several axes in sorted label order, computed once."""
+    union = axes[0].append(list(axes[1:])) if len(axes) > 1 else axes[0]
+    union = union[~union.duplicated()]
+    return union if union.is_monotonic_increasing else union.sort_values()
+
+
+def _contiguous_runs(positions: np.ndarray) -> list[tuple[int, int]]:
+    """Split target positions into ``(start, stop)`` runs of consecutive positions."""
+    if len(positions) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [len(positions)]))
+    return list(zip(starts.tolist(), stops.tolist()))
+
+
+def _scatter_blocks(blocks: list[pd.DataFrame], index: pd.Index, columns: pd.Index) -> pd.DataFrame:
+    """Sum label-aligned blocks into one frame over precomputed axes.
+
+    Every block is written at the positions of its labels in ``index`` and
+    ``columns``; cells covered by no block are zero and missing values count
+    as zero. The result is sparse-backed when any block is.
+    """
+    positions = [(index.get_indexer(block.index), columns.get_indexer(block.columns)) for block in blocks]
+
+    if any(_is_sparse_backed_dataframe(block) for block in blocks):
+        from scipy import sparse
+
+        rows, cols, data = [], [], []
+        for block, (row_positions, column_positions) in zip(blocks, positions):
+            if _is_sparse_backed_dataframe(block):
+                matrix = block.sparse.to_coo()
+            else:
+                matrix = sparse.coo_matrix(np.nan_to_num(dense_values(block)))
+            rows.append(row_positions[matrix.row])
+            cols.append(column_positions[matrix.col])
+            data.append(np.nan_to_num(matrix.data))
+        matrix = sparse.coo_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(len(index), len(columns)),
+        ).tocsc()
+        matrix.sum_duplicates()
+        return sparse_frame_from_spmatrix(matrix, index=index, columns=columns)
+
+    values = np.zeros((len(index), len(columns)))
+    for number, (block, (row_positions, column_positions)) in enumerate(zip(blocks, positions)):
+        block_values = dense_values(block)
+        if np.isnan(block_values.sum()):
+            block_values = np.nan_to_num(block_values)
+        if number > 0:
+            values[np.ix_(row_positions, column_positions)] += block_values
+            continue
+
+        # The first block is the existing matrix: its labels keep their order
+        # in the enlarged axes, so it is copied as a few contiguous slices.
+        row_runs = _contiguous_runs(row_positions)
+        column_runs = _contiguous_runs(column_positions)
+        if len(row_runs) * len(column_runs) > max(values.shape):
+            values[np.ix_(row_positions, column_positions)] = block_values
+            continue
+        for row_start, row_stop in row_runs:
+            target_rows = slice(row_positions[row_start], row_positions[row_start] + row_stop - row_start)
+            for column_start, column_stop in column_runs:
+                target_columns = slice(
+                    column_positions[column_start],
+                    column_positions[column_start] + column_stop - column_start,
+                )
+                values[target_rows, target_columns] = block_values[row_start:row_stop, column_start:column_stop]
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def _insert_blocks(*blocks: pd.DataFrame) -> pd.DataFrame:
+    """Merge blocks on the sorted union of their labels, summing overlapping cells.
+
+    This is the positional equivalent of concatenating the blocks and
+    grouping both axes on every level: the final axes are computed once and
+    each block is scattered into one preallocated frame.
+    """
+    index = _sorted_union(*(block.index for block in blocks))
+    columns = _sorted_union(*(block.columns for block in blocks))
+    return _scatter_blocks(list(blocks), index, columns)
+
+
 class InventoryRowValidationError(ValueError):
     """Row-level inventory validation issue collected before failing one sheet."""
 
@@ -431,36 +517,22 @@ class AddSectorEngine:
             new_act_indices = self.matrices[_ENUM["s"]].loc[
                 (sn, MI["a"], self.new_activities), :
             ].index
-            self.matrices[_ENUM["Y"]] = pd.concat(
-                [
-                    self.matrices[_ENUM["Y"]],
-                    pd.DataFrame(0.0, index=new_act_indices, columns=self.matrices[_ENUM["Y"]].columns),
-                ],
-                axis=0,
+            self.matrices[_ENUM["Y"]] = _insert_blocks(
+                self.matrices[_ENUM["Y"]],
+                pd.DataFrame(0.0, index=new_act_indices, columns=self.matrices[_ENUM["Y"]].columns),
             )
 
         if self.new_commodities:
             new_com_indices = self.matrices[_ENUM["u"]].loc[
                 (sn, MI["c"], self.new_commodities), :
             ].index
-            self.matrices[_ENUM["v"]] = pd.concat(
-                [
-                    self.matrices[_ENUM["v"]],
-                    pd.DataFrame(0.0, index=self.matrices[_ENUM["v"]].index, columns=new_com_indices),
-                ],
-                axis=1,
-            )
-            self.matrices[_ENUM["e"]] = pd.concat(
-                [
-                    self.matrices[_ENUM["e"]],
-                    pd.DataFrame(0.0, index=self.matrices[_ENUM["e"]].index, columns=new_com_indices),
-                ],
-                axis=1,
-            )
+            for matrix in (_ENUM["v"], _ENUM["e"]):
+                self.matrices[matrix] = _insert_blocks(
+                    self.matrices[matrix],
+                    pd.DataFrame(0.0, index=self.matrices[matrix].index, columns=new_com_indices),
+                )
 
-        self.matrices[_ENUM["z"]] = pd.concat(
-            [self.matrices[_ENUM["u"]], self.matrices[_ENUM["s"]]], axis=1
-        ).fillna(0)
+        self.matrices[_ENUM["z"]] = _insert_blocks(self.matrices[_ENUM["u"]], self.matrices[_ENUM["s"]])
         self.reindex_matrices()
         self.get_mario_indices()
         return self.matrices, self.units, self.indeces
@@ -837,9 +909,11 @@ class AddSectorEngine:
         return pd.concat([augmented_inventory, pd.DataFrame(added_rows, columns=augmented_inventory.columns)], ignore_index=True), slices
 
     def reindex_matrices(self) -> None:
-        """Sort index and columns after concatenating the new slices."""
+        """Sort index and columns that are not already in label order."""
         for matrix in ("z", "e", "v", "Y"):
             for axis, labels in ((0, self.matrices[matrix].index), (1, self.matrices[matrix].columns)):
+                if labels.is_monotonic_increasing:
+                    continue
                 if isinstance(labels, pd.MultiIndex):
                     self.matrices[matrix].sort_index(
                         axis=axis,
@@ -850,8 +924,9 @@ class AddSectorEngine:
                     self.matrices[matrix].sort_index(axis=axis, inplace=True)
 
         if self.table == IOT:
-            for axis in [0, 1]:
-                self.uncertainty_matrix.sort_index(axis=axis, level=list(range(3)), inplace=True)
+            for axis, labels in ((0, self.uncertainty_matrix.index), (1, self.uncertainty_matrix.columns)):
+                if not labels.is_monotonic_increasing:
+                    self.uncertainty_matrix.sort_index(axis=axis, level=list(range(3)), inplace=True)
 
     def make_units_consistent_to_database(
         self,
@@ -1626,28 +1701,13 @@ class AddSectorEngine:
         )
 
     def add_slices(self) -> None:
-        """Concatenate the filled slices into the coefficient matrices."""
+        """Insert the filled slices into the coefficient matrices."""
 
         for matrix in _MATRIX_SLICES_MAP[self.table]:
-            concat = _MATRIX_SLICES_MAP[self.table][matrix]["concat"]
-            self.matrices[matrix] = pd.concat([self.matrices[matrix], self.filled_slices[matrix]], axis=concat)
-            self.matrices[matrix] = (
-                self.matrices[matrix].groupby(level=list(range(self.matrices[matrix].index.nlevels))).sum()
-            )
-            self.matrices[matrix] = (
-                self.matrices[matrix].T.groupby(level=list(range(self.matrices[matrix].columns.nlevels))).sum().T
-            )
+            self.matrices[matrix] = _insert_blocks(self.matrices[matrix], self.filled_slices[matrix])
 
         if self.table == IOT:
-            self.uncertainty_matrix = pd.concat(
-                [self.uncertainty_matrix, self.filled_uncertainty_slices], axis=1
-            )
-            self.uncertainty_matrix = (
-                self.uncertainty_matrix.groupby(level=list(range(self.uncertainty_matrix.index.nlevels))).sum()
-            )
-            self.uncertainty_matrix = (
-                self.uncertainty_matrix.T.groupby(level=list(range(self.uncertainty_matrix.columns.nlevels))).sum().T
-            )
+            self.uncertainty_matrix = _insert_blocks(self.uncertainty_matrix, self.filled_uncertainty_slices)
 
     def get_mario_indices(self) -> None:
         """Rebuild the database index mapping from the updated coefficient blocks."""
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import logging
+
 import numpy as np
 import pandas as pd
 
 from mario.log_exc.exceptions import WrongInput
+from mario.log_exc.logger import log_time
+
+logger = logging.getLogger(__name__)
 
 
 def _coerce_target_vector(values, *, size: int, axis_name: str, labels=None) -> np.ndarray:
@@ -46,13 +52,173 @@ def _coerce_target_vector(values, *, size: int, axis_name: str, labels=None) ->
     return array.astype(float, copy=False)
 
 
-def ras(matrix, target_rows, target_cols, tol: float = 1e-8, max_iter: int = 1000):
+BALANCE_METHODS = {"auto", "ras", "gras"}
+
+
+@dataclass(frozen=True)
+class BalanceDiagnostics:
+    """Convergence report of one RAS/GRAS balancing run.
+
+    ``row_residuals`` and ``col_residuals`` hold, for every iteration, the
+    largest absolute gap between the balanced margins and their targets.
+    """
+
+    method: str
+    converged: bool
+    iterations: int
+    row_residuals: tuple[float, ...]
+    col_residuals: tuple[float, ...]
+
+
+def _split_signs(values):
+    """Return the positive part and the absolute negative part of one matrix."""
+    from scipy import sparse
+
+    if sparse.issparse(values):
+        positive = values.copy()
+        positive.data = np.maximum(positive.data, 0.0)
+        positive.eliminate_zeros()
+        negative = values.copy()
+        negative.data = np.maximum(-negative.data, 0.0)
+        negative.eliminate_zeros()
+        return positive, negative
+    return np.maximum(values, 0.0), np.maximum(-values, 0.0)
+
+
+def _matvec(values, vector):
+    """Return ``values @ vector`` as a flat array for dense or sparse matrices."""
+    return np.asarray(values @ vector, dtype=float).reshape(-1)
+
+
+def _rmatvec(values, vector):
+    """Return ``values.T @ vector`` as a flat array for dense or sparse matrices."""
+    return np.asarray(values.T @ vector, dtype=float).reshape(-1)
+
+
+def _solve_scaling(target, positive_sums, negative_sums, previous):
+    """Return GRAS scaling factors ``x`` solving ``x p - n / x = target``.
+
+    Entries without positive mass fall back to ``-n / target`` when that is
+    feasible, and entries without any mass keep their previous factor.
+    """
+    factors = previous.copy()
+    has_positive = positive_sums > 0
+    discriminant = target[has_positive] ** 2 + 4.0 * positive_sums[has_positive] * negative_sums[has_positive]
+    factors[has_positive] = (target[has_positive] + np.sqrt(discriminant)) / (2.0 * positive_sums[has_positive])
+    only_negative = ~has_positive & (negative_sums > 0) & (target < 0)
+    factors[only_negative] = -negative_sums[only_negative] / target[only_negative]
+    return factors
+
+
+def _scale(values, row_factors, col_factors):
+    """Materialize ``diag(row_factors) @ values @ diag(col_factors)`` once."""
+    from scipy import sparse
+
+    if sparse.issparse(values):
+        scaled = sparse.csr_matrix(values, copy=True)
+        rows = np.repeat(np.arange(scaled.shape[0]), np.diff(scaled.indptr))
+        scaled.data *= row_factors[rows] * col_factors[scaled.indices]
+        return scaled
+    return values * row_factors[:, None] * col_factors[None, :]
+
+
+def _within_tolerance(sums, target, tol):
+    """Mirror ``numpy.allclose(sums, target, atol=tol, rtol=tol)`` and return the gap."""
+    gap = np.abs(sums - target)
+    return bool(np.all(gap <= tol + tol * np.abs(target))), float(gap.max(initial=0.0))
+
+
+def _balance(values, target_rows, target_cols, *, method, tol, max_iter):
+    """Run RAS or GRAS on scaling vectors and return the balanced matrix.
+
+    The prior matrix is never rewritten inside the loop: every iteration
+    costs two matrix-vector products per sign part, and the balanced matrix
+    is materialized once from the final scaling vectors.
+    """
+    if method == "gras":
+        positive, negative = _split_signs(values)
+    else:
+        positive, negative = values, None
+
+    row_factors = np.ones(values.shape[0], dtype=float)
+    col_factors = np.ones(values.shape[1], dtype=float)
+    row_residuals = []
+    col_residuals = []
+    converged = False
+
+    positive_rows = _matvec(positive, col_factors)
+    negative_rows = _matvec(negative, 1.0 / col_factors) if negative is not None else None
+    for _ in range(int(max_iter)):
+        if negative is None:
+            nonzero = positive_rows != 0
+            row_factors[nonzero] = target_rows[nonzero] / positive_rows[nonzero]
+        else:
+            row_factors = _solve_scaling(target_rows, positive_rows, negative_rows, row_factors)
+
+        positive_cols = _rmatvec(positive, row_factors)
+        if negative is None:
+            nonzero = positive_cols != 0
+            col_factors[nonzero] = target_cols[nonzero] / positive_cols[nonzero]
+            col_sums = col_factors * positive_cols
+        else:
+            negative_cols = _rmatvec(negative, 1.0 / row_factors)
+            col_factors = _solve_scaling(target_cols, positive_cols, negative_cols, col_factors)
+            col_sums = col_factors * positive_cols - negative_cols / col_factors
+
+        positive_rows = _matvec(positive, col_factors)
+        if negative is None:
+            row_sums = row_factors * positive_rows
+        else:
+            negative_rows = _matvec(negative, 1.0 / col_factors)
+            row_sums = row_factors * positive_rows - negative_rows / row_factors
+
+        rows_ok, row_gap = _within_tolerance(row_sums, target_rows, tol)
+        cols_ok, col_gap = _within_tolerance(col_sums, target_cols, tol)
+        row_residuals.append(row_gap)
+        col_residuals.append(col_gap)
+        log_time(
+            logger,
+            f"{method.upper()}: iteration {len(row_residuals)}, row residual {row_gap:.3e}, "
+            f"column residual {col_gap:.3e}.",
+            "debug",
+        )
+        if rows_ok and cols_ok:
+            converged = True
+            break
+
+    diagnostics = BalanceDiagnostics(
+        method=method,
+        converged=converged,
+        iterations=len(row_residuals),
+        row_residuals=tuple(row_residuals),
+        col_residuals=tuple(col_residuals),
+    )
+    if not converged:
+        return None, diagnostics
+
+    balanced = _scale(positive, row_factors, col_factors)
+    if negative is not None:
+        balanced = balanced - _scale(negative, 1.0 / row_factors, 1.0 / col_factors)
+    return balanced, diagnostics
+
+
+def ras(
+    matrix,
+    target_rows,
+    target_cols,
+    tol: float = 1e-8,
+    max_iter: int = 1000,
+    *,
+    method: str = "auto",
+    return_diagnostics: bool = False,
+):
     """Balance one matrix with the RAS biproportional fitting algorithm.
 
     Parameters
     ----------
     matrix:
-        Prior matrix to balance. Accepts a numpy array or pandas DataFrame.
+        Prior matrix to balance. Accepts a numpy array, a SciPy sparse matrix
+        or a pandas DataFrame (dense or sparse-backed).
     target_rows:
         Desired row sums. When ``matrix`` is a DataFrame, pandas targets are
         aligned by row labels.
@@ -63,34 +229,61 @@ def ras(matrix, target_rows, target_cols, tol: float = 1e-8, max_iter: int = 100
         Absolute convergence tolerance on row and column sums.
     max_iter:
         Maximum number of row/column scaling iterations.
+    method:
+        ``"ras"`` for the classic algorithm on non-negative matrices,
+        ``"gras"`` for the generalized RAS that also balances negative
+        entries, or ``"auto"`` (default) to use GRAS only when the prior
+        contains negative values.
+    return_diagnostics:
+        When ``True``, also return a :class:`BalanceDiagnostics` report with
+        the per-iteration residuals.
 
     Returns
     -------
-    numpy.ndarray | pandas.DataFrame
-        Balanced matrix with the same type and labels as the input matrix.
+    numpy.ndarray | scipy.sparse.csr_matrix | pandas.DataFrame
+        Balanced matrix with the same type and labels as the input matrix,
+        followed by the diagnostics when ``return_diagnostics=True``.
     """
+    from scipy import sparse
+
+    from mario.compute.helpers import _is_sparse_backed_dataframe, sparse_frame_from_spmatrix
+
     if tol <= 0:
         raise WrongInput("tol should be strictly positive.")
     if int(max_iter) < 1:
         raise WrongInput("max_iter should be a positive integer.")
+    method = str(method).strip().lower()
+    if method not in BALANCE_METHODS:
+        raise WrongInput(f"method should be one of {sorted(BALANCE_METHODS)}.")
 
     is_dataframe = isinstance(matrix, pd.DataFrame)
+    is_sparse_frame = is_dataframe and _is_sparse_backed_dataframe(matrix)
     if is_dataframe:
         row_labels = matrix.index
         col_labels = matrix.columns
-        values = matrix.to_numpy(dtype=float, copy=True)
+        if is_sparse_frame:
+            values = matrix.sparse.to_coo().tocsr().astype(float)
+        else:
+            values = matrix.to_numpy(dtype=float, copy=False)
+    elif sparse.issparse(matrix):
+        row_labels = None
+        col_labels = None
+        values = sparse.csr_matrix(matrix, dtype=float)
     else:
         row_labels = None
         col_labels = None
         values = np.asarray(matrix, dtype=float)
         if values.ndim != 2:
             raise WrongInput("matrix should be two-dimensional.")
-        values = values.copy()
 
-    if not np.isfinite(values).all():
+    entries = values.data if sparse.issparse(values) else values
+    if not np.isfinite(entries).all():
         raise WrongInput("matrix contains non-finite values.")
-    if np.any(values < 0):
-        raise WrongInput("matrix contains negative values.")
+    has_negative = bool(np.any(entries < 0))
+    if method == "auto":
+        method = "gras" if has_negative else "ras"
+    if method == "ras" and has_negative:
+        raise WrongInput("matrix contains negative values. Use method='gras' to balance it.")
 
     target_rows = _coerce_target_vector(
         target_rows,
@@ -105,43 +298,43 @@ def ras(matrix, target_rows, target_cols, tol: float = 1e-8, max_iter: int = 100
         labels=col_labels,
     )
 
-    if np.any(target_rows < 0) or np.any(target_cols < 0):
+    if method == "ras" and (np.any(target_rows < 0) or np.any(target_cols < 0)):
         raise WrongInput("RAS targets should be non-negative.")
 
     if not np.isclose(target_rows.sum(), target_cols.sum(), atol=tol, rtol=tol):
         raise WrongInput("target_rows and target_cols should have the same total.")
 
-    zero_rows = values.sum(axis=1) == 0
-    zero_cols = values.sum(axis=0) == 0
-    if np.any(zero_rows & (target_rows > tol)):
-        raise WrongInput("RAS cannot assign a positive target to an all-zero row.")
-    if np.any(zero_cols & (target_cols > tol)):
-        raise WrongInput("RAS cannot assign a positive target to an all-zero column.")
+    magnitude = abs(values) if sparse.issparse(values) else np.abs(values)
+    zero_rows = _matvec(magnitude, np.ones(values.shape[1])) == 0
+    zero_cols = _rmatvec(magnitude, np.ones(values.shape[0])) == 0
+    if np.any(zero_rows & (np.abs(target_rows) > tol)):
+        raise WrongInput("RAS cannot assign a nonzero target to an all-zero row.")
+    if np.any(zero_cols & (np.abs(target_cols) > tol)):
+        raise WrongInput("RAS cannot assign a nonzero target to an all-zero column.")
 
-    for _ in range(int(max_iter)):
-        row_sums = values.sum(axis=1)
-        row_factors = np.ones_like(target_rows)
-        nonzero_rows = row_sums != 0
-        row_factors[nonzero_rows] = target_rows[nonzero_rows] / row_sums[nonzero_rows]
-        values = (values.T * row_factors).T
-
-        col_sums = values.sum(axis=0)
-        col_factors = np.ones_like(target_cols)
-        nonzero_cols = col_sums != 0
-        col_factors[nonzero_cols] = target_cols[nonzero_cols] / col_sums[nonzero_cols]
-        values = values * col_factors
-
-        if np.allclose(values.sum(axis=1), target_rows, atol=tol, rtol=tol) and np.allclose(
-            values.sum(axis=0),
-            target_cols,
-            atol=tol,
-            rtol=tol,
-        ):
-            if is_dataframe:
-                return pd.DataFrame(values, index=row_labels, columns=col_labels)
-            return values
-
-    raise WrongInput("RAS did not converge within max_iter iterations.")
-
-
-__all__ = ["ras"]
+    balanced, diagnostics = _balance(
+        values,
+        target_rows,
+        target_cols,
+        method=method,
+        tol=tol,
+        max_iter=max_iter,
+    )
+    if balanced is None:
+        raise WrongInput(
+            f"{method.upper()} did not converge within max_iter iterations "
+            f"(row residual {diagnostics.row_residuals[-1]:.3e}, "
+            f"column residual {diagnostics.col_residuals[-1]:.3e})."
+        )
+
+    if is_sparse_frame:
+        balanced = sparse_frame_from_spmatrix(balanced, index=row_labels, columns=col_labels)
+    elif is_dataframe:
+        balanced = pd.DataFrame(balanced, index=row_labels, columns=col_labels)
+
+    if return_diagnostics:
+        return balanced, diagnostics
+    return balanced
+
+
+__all__ = ["BalanceDiagnostics", "ras"]
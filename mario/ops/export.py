@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import MutableMapping
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 import inspect
 from pathlib import Path
 
@@ -13,6 +13,7 @@ import pandas as pd
 import pymrio
 
 from mario._optional import require_pyarrow
+from mario.compute.helpers import dense_values
 from mario.log_exc.exceptions import NotImplementable, WrongInput
 from mario.log_exc.logger import log_time
 from mario.ops.export_specs import (
@@ -23,6 +24,7 @@ from mario.ops.export_specs import (
 )
 from mario.model.conventions import _ENUM, _MASTER_INDEX
 from mario.ops.excel import database_excel, database_txt
+from mario.storage.sparse_parquet import is_coo_frame, remove_coo_axes, write_coo_parquet
 from mario.utils import pymrio_styling
 
 logger = logging.getLogger(__name__)
@@ -266,12 +268,154 @@ def _write_parquet_frame(frame: pd.DataFrame, path: Path) -> None:
     _coerce_sparse_columns_to_dense(frame).to_parquet(path, index=False)
 
 
+def _write_parquet_matrix(frame: pd.DataFrame, path: Path) -> None:
+    """Write one matrix payload, keeping sparse-backed blocks in the COO layout."""
+    if is_coo_frame(frame):
+        write_coo_parquet(frame, path)
+        return
+    remove_coo_axes(path)
+    _coerce_sparse_columns_to_dense(frame).to_parquet(path)
+
+
 def _write_metadata_file(database, root: Path) -> None:
     """Write database metadata to one export directory."""
     root.mkdir(parents=True, exist_ok=True)
     database.save_meta(str(root / "metadata"), format="json")
 
 
+# Upper bound on the number of cells converted to long format at once by
+# the flat exporters; peak memory of a flat export is bounded by one chunk.
+_FLAT_EXPORT_CHUNK_CELLS = 1_000_000
+
+
+class _TextChunkWriter:
+    """Append flat chunks to one delimited text file."""
+
+    def __init__(self, path: Path, *, columns: list[str], sep: str) -> None:
+        self.path = path
+        self.columns = columns
+        self.sep = sep
+        self._started = False
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append one chunk, writing the header with the first one."""
+        frame.to_csv(
+            self.path,
+            index=False,
+            sep=self.sep,
+            mode="a" if self._started else "w",
+            header=not self._started,
+        )
+        self._started = True
+
+    def close(self) -> None:
+        """Write the header alone when no chunk was written."""
+        if not self._started:
+            self.write(pd.DataFrame(columns=self.columns))
+
+
+class _ParquetChunkWriter:
+    """Append flat chunks to one parquet file, one row group per chunk."""
+
+    def __init__(self, path: Path, *, columns: list[str]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.schema = pa.schema(
+            [(column, pa.float64() if column == "Value" else pa.string()) for column in columns]
+        )
+        self._writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append one chunk."""
+        import pyarrow as pa
+
+        self._writer.write_table(pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False))
+
+    def close(self) -> None:
+        """Finalize the parquet footer."""
+        self._writer.close()
+
+
+def _flat_axis_labels(index, *, side: str, matrix_name: str) -> dict[str, np.ndarray]:
+    """Return the flat set-specific label arrays of one matrix axis."""
+    axis = _flat_axis_index(index, side=side, matrix_name=matrix_name)
+    return {
+        name: np.asarray(axis.get_level_values(name).astype(str), dtype=object)
+        for name in axis.names
+    }
+
+
+def _flat_kept_columns(labels: list[dict[str, np.ndarray]]) -> list[str]:
+    """Return the flat columns that are non-empty for at least one axis in ``labels``."""
+    keep_columns = ["Scenario", "Matrix"]
+    for side in ("from", "to"):
+        for set_name in FLAT_AXIS_SETS:
+            column = f"{set_name}_{side}"
+            if any(column in axis and (axis[column] != "").any() for axis in labels):
+                keep_columns.append(column)
+    keep_columns.append("Value")
+    return keep_columns
+
+
+def _iter_flat_chunks(
+    matrix_name: str,
+    frame: pd.DataFrame,
+    *,
+    scenario: str,
+    rows: dict[str, np.ndarray],
+    columns: dict[str, np.ndarray],
+    skip_zeros: bool = False,
+    chunk_cells: int | None = None,
+):
+    """Yield one matrix in the canonical flat long format, a few rows at a time.
+
+    Cells are emitted row-major, in the same order as
+    :func:`_matrix_to_flat_frame`. Sparse-backed frames are sliced in CSR
+    layout, so only the rows of the current chunk are ever densified, and
+    not at all when ``skip_zeros`` is set.
+    """
+    n_rows, n_columns = frame.shape
+    if n_rows == 0 or n_columns == 0:
+        return
+
+    sparse_rows = frame.sparse.to_coo().tocsr() if is_coo_frame(frame) else None
+    if sparse_rows is not None:
+        sparse_rows.sum_duplicates()
+    step = max(1, (chunk_cells or _FLAT_EXPORT_CHUNK_CELLS) // n_columns)
+
+    for start in range(0, n_rows, step):
+        stop = min(start + step, n_rows)
+        if sparse_rows is not None and skip_zeros:
+            cells = sparse_rows[start:stop].tocoo()
+            keep = cells.data != 0
+            row_positions, column_positions, values = cells.row[keep], cells.col[keep], cells.data[keep]
+        else:
+            if sparse_rows is not None:
+                block = sparse_rows[start:stop].toarray()
+            else:
+                block = dense_values(frame.iloc[start:stop])
+            if skip_zeros:
+                row_positions, column_positions = np.nonzero(block)
+                values = block[row_positions, column_positions]
+            else:
+                row_positions = np.repeat(np.arange(stop - start), n_columns)
+                column_positions = np.tile(np.arange(n_columns), stop - start)
+                values = block.reshape(-1)
+        if not len(values):
+            continue
+
+        row_positions = row_positions + start
+        chunk = {
+            "Scenario": np.full(len(values), scenario, dtype=object),
+            "Matrix": np.full(len(values), matrix_name, dtype=object),
+        }
+        chunk.update({name: labels[row_positions] for name, labels in rows.items()})
+        chunk.update({name: labels[column_positions] for name, labels in columns.items()})
+        chunk["Value"] = np.asarray(values, dtype=float)
+        yield pd.DataFrame(chunk)
+
+
 def _export_flat_directory(
     database,
     *,
@@ -279,11 +423,20 @@ def _export_flat_directory(
     scenario: str,
     mode: str,
     writer,
+    chunk_writer,
     suffix: str,
     sep: str | None = None,
     separate_files: bool = False,
+    skip_zeros: bool = False,
 ) -> None:
-    """Export one scenario as a single flat data file plus units."""
+    """Export one scenario as a single flat data file plus units.
+
+    Matrices are streamed one at a time and converted to long format chunk
+    by chunk into ``chunk_writer``, so the long table of the whole database
+    is never held in memory. With ``separate_files=True`` every chunk is
+    written to the per-matrix file in the same pass. Empty set columns are
+    trimmed from the matrix axes before anything is written.
+    """
     root.mkdir(parents=True, exist_ok=True)
     export_matrices = _flat_export_names(database, mode)
     matrices = database.query(
@@ -294,41 +447,56 @@ def _export_flat_directory(
         matrix_name: _prepare_export_matrix(database, matrix_name, frame)
         for matrix_name, frame in matrices.items()
     }
-    flat_data = pd.concat(
-        [
-            _matrix_to_flat_frame(matrix_name, matrices[matrix_name], scenario=scenario)
-            for matrix_name in export_matrices
-        ],
-        ignore_index=True,
+    axes = {
+        matrix_name: (
+            _flat_axis_labels(matrices[matrix_name].index, side="from", matrix_name=matrix_name),
+            _flat_axis_labels(matrices[matrix_name].columns, side="to", matrix_name=matrix_name),
+        )
+        for matrix_name in export_matrices
+    }
+    matrix_columns = {
+        matrix_name: _flat_kept_columns(
+            list(axes[matrix_name]) if min(matrices[matrix_name].shape) else []
+        )
+        for matrix_name in export_matrices
+    }
+    data_columns = _flat_kept_columns(
+        [axis for matrix_name in export_matrices if min(matrices[matrix_name].shape) for axis in axes[matrix_name]]
     )
-    flat_data = _trim_flat_frame_columns(flat_data)
-    units = _flat_units_frame(database)
 
-    data_path = root / f"data.{suffix}"
+    options = {} if sep is None else {"sep": sep}
+    with ExitStack() as writers:
+        data_writer = chunk_writer(root / f"data.{suffix}", columns=data_columns, **options)
+        writers.callback(data_writer.close)
+        for matrix_name in export_matrices:
+            targets = [(data_writer, data_columns)]
+            if separate_files:
+                matrix_writer = chunk_writer(
+                    root / f"{matrix_name}.{suffix}",
+                    columns=matrix_columns[matrix_name],
+                    **options,
+                )
+                writers.callback(matrix_writer.close)
+                targets.append((matrix_writer, matrix_columns[matrix_name]))
+            rows, columns = axes[matrix_name]
+            for chunk in _iter_flat_chunks(
+                matrix_name,
+                matrices[matrix_name],
+                scenario=scenario,
+                rows=rows,
+                columns=columns,
+                skip_zeros=skip_zeros,
+            ):
+                for target, target_columns in targets:
+                    target.write(chunk.loc[:, target_columns])
+
+    units = _flat_units_frame(database)
     units_path = root / f"units.{suffix}"
     if sep is None:
-        writer(flat_data, data_path)
         writer(units, units_path)
     else:
-        writer(flat_data, data_path, sep=sep)
         writer(units, units_path, sep=sep)
 
-    if not separate_files:
-        return
-
-    for matrix_name in export_matrices:
-        flat_matrix = _matrix_to_flat_frame(
-            matrix_name,
-            matrices[matrix_name],
-            scenario=scenario,
-        )
-        flat_matrix = _trim_flat_frame_columns(flat_matrix)
-        matrix_path = root / f"{matrix_name}.{suffix}"
-        if sep is None:
-            writer(flat_matrix, matrix_path)
-        else:
-            writer(flat_matrix, matrix_path, sep=sep)
-
 
 def _export_matrix_directory(
     database,
@@ -353,7 +521,7 @@ def _export_matrix_directory(
     for key, value in matrices.items():
         target = root / f"{key}.{suffix}"
         if suffix == "parquet":
-            _coerce_sparse_columns_to_dense(value).to_parquet(target)
+            _write_parquet_matrix(value, target)
         else:
             value.to_csv(target, header=True, index=True, sep=sep)
 
@@ -891,13 +1059,16 @@ def export_database_to_txt(
     sep: str = ",",
     flat: bool = False,
     separate_files: bool = False,
+    skip_zeros: bool = False,
 ):
     """Export a database as multiple txt/csv files.
 
     When ``flat=False`` the historical matrix-per-file layout is used.
     When ``flat=True`` each mode is exported as one long-format ``data`` file
     plus a ``units`` file. When ``separate_files=True``, the same flat payload
-    is also written as one trimmed long-format file per matrix.
+    is also written as one trimmed long-format file per matrix. Flat files
+    are streamed matrix by matrix in bounded chunks; ``skip_zeros=True``
+    leaves out zero cells.
     """
 
     if scenario not in database.scenarios:
@@ -924,9 +1095,11 @@ def export_database_to_txt(
                 scenario=scenario,
                 mode="flows",
                 writer=_write_text_frame,
+                chunk_writer=_TextChunkWriter,
                 suffix=_format,
                 sep=sep,
                 separate_files=separate_files,
+                skip_zeros=skip_zeros,
             )
         if coefficients:
             _export_flat_directory(
@@ -935,9 +1108,11 @@ def export_database_to_txt(
                 scenario=scenario,
                 mode="coefficients",
                 writer=_write_text_frame,
+                chunk_writer=_TextChunkWriter,
                 suffix=_format,
                 sep=sep,
                 separate_files=separate_files,
+                skip_zeros=skip_zeros,
             )
     else:
         if flows:
@@ -974,13 +1149,18 @@ def export_database_to_parquet(
     include_meta: bool = False,
     flat: bool = False,
     separate_files: bool = False,
+    skip_zeros: bool = False,
 ):
     """Export a database as parquet files.
 
-    When ``flat=False`` each matrix is written to its own parquet file.
+    When ``flat=False`` each matrix is written to its own parquet file;
+    sparse-backed matrices are written as COO triplets with separate axis
+    dictionaries (see :mod:`mario.storage.sparse_parquet`), never densified.
     When ``flat=True`` each mode is written as one long-format ``data.parquet``
     file plus a ``units.parquet`` companion. When ``separate_files=True``, the
     same flat payload is also written as one trimmed parquet file per matrix.
+    Flat files are streamed matrix by matrix, one row group per bounded
+    chunk; ``skip_zeros=True`` leaves out zero cells.
     """
 
     if scenario not in database.scenarios:
@@ -1010,8 +1190,10 @@ def export_database_to_parquet(
                 scenario=scenario,
                 mode="flows",
                 writer=_write_parquet_frame,
+                chunk_writer=_ParquetChunkWriter,
                 suffix="parquet",
                 separate_files=separate_files,
+                skip_zeros=skip_zeros,
             )
         if coefficients:
             _export_flat_directory(
@@ -1020,8 +1202,10 @@ def export_database_to_parquet(
                 scenario=scenario,
                 mode="coefficients",
                 writer=_write_parquet_frame,
+                chunk_writer=_ParquetChunkWriter,
                 suffix="parquet",
                 separate_files=separate_files,
+                skip_zeros=skip_zeros,
             )
     else:
         if flows:
@@ -4,10 +4,13 @@ module contains the shock functions
 """
 
 import copy
+import itertools
 import logging
 import os
 
+import numpy as np
 import pandas as pd
+from mario.compute.helpers import _is_sparse_backed_dataframe, dense_values
 from mario.log_exc.logger import log_time
 from mario.log_exc.exceptions import WrongInput
 from mario.model.conventions import _MASTER_INDEX, _ENUM
@@ -569,6 +572,213 @@ def nan_check(dataframe, row, shock_type):
     return dataframe.loc[row].isnull().values.any()
 
 
+_SHOCK_OPERATIONS = ("Absolute", "Percentage", "Update")
+
+
+def _shock_label_resolver(instance, clusters):
+    """Return a memoized ``check_replace_clusters`` bound to one database.
+
+    Index labels of every set are loaded once and membership is tested on a
+    set, so resolving tens of thousands of shock rows only pays one lookup per
+    distinct ``(set, label)`` pair.
+    """
+    labels = {}
+    resolved = {}
+
+    def resolve(user_value, set_name):
+        key = (set_name, user_value)
+        if key not in resolved:
+            if set_name not in labels:
+                labels[set_name] = set(instance.get_index(set_name))
+            resolved[key] = check_replace_clusters(
+                userValue=user_value,
+                dataValues=labels[set_name],
+                clusters=clusters.get(set_name),
+            )
+        return resolved[key]
+
+    return resolve
+
+
+def _as_label_list(value):
+    """Return one resolved shock label (or cluster) as a list of labels."""
+    if isinstance(value, (list, tuple, set, pd.Index)):
+        return list(value)
+    return [value]
+
+
+def _label_product(build_key, *parts):
+    """Expand resolved labels and clusters into de-duplicated axis keys."""
+    keys = (build_key(*combo) for combo in itertools.product(*map(_as_label_list, parts)))
+    return list(dict.fromkeys(keys))
+
+
+def _incomplete_shock_rows(info, _type):
+    """Vectorized :func:`nan_check` over every row of one shock sheet."""
+    with_switch = info.isnull().to_numpy().any(axis=1)
+    without_switch = (
+        info.drop(columns=SHOCK_COLUMNS["s_sec"], errors="ignore").isnull().to_numpy().any(axis=1)
+    )
+    is_switch = np.asarray([shock_type == "Switch" for shock_type in _type], dtype=bool)
+    return np.where(is_switch, with_switch, without_switch)
+
+
+def _compile_shock_rows(
+    info,
+    _type,
+    value,
+    resolve_row,
+    *,
+    sheet_name,
+    type_error,
+    skip_mix=True,
+    stop_at_nan=True,
+):
+    """Resolve every shock row of one sheet before touching the target block.
+
+    ``resolve_row(shock)`` returns the row keys, column keys and provenance
+    note of one row. Mix rows are skipped when ``skip_mix`` is set and, with
+    ``stop_at_nan``, compilation stops at the first incomplete row exactly as
+    the former row-by-row loop did. Returns the compiled rows and their notes.
+    """
+    compiled = []
+    notes = []
+    incomplete = _incomplete_shock_rows(info, _type) if stop_at_nan else None
+    for shock in range(len(info)):
+        if skip_mix and _is_mix_type(_type[shock]):
+            # Mix rows are collected and applied by the dedicated spec readers.
+            continue
+        if stop_at_nan and incomplete[shock]:
+            log_time(
+                logger,
+                "nan values found on row {} of {} shock sheet. No more shock is imported after row {}".format(
+                    shock, sheet_name, shock
+                ),
+                "warning",
+            )
+            break
+
+        row_keys, column_keys, note = resolve_row(shock)
+        if _type[shock] not in _SHOCK_OPERATIONS:
+            raise WrongInput(type_error)
+
+        compiled.append((row_keys, column_keys, _type[shock], value[shock]))
+        notes.append(note)
+
+    return compiled, notes
+
+
+def _axis_positions(axis, keys):
+    """Return the positions of ``keys`` on one axis, raising on missing labels."""
+    positions = axis.get_indexer(keys)
+    if (positions < 0).any():
+        missing = [key for key, position in zip(keys, positions) if position < 0]
+        raise KeyError(missing)
+    return positions
+
+
+def _frame_cells(frame, rows, columns):
+    """Return ``frame`` values at positional ``(rows, columns)`` pairs."""
+    touched, inverse = np.unique(columns, return_inverse=True)
+    return dense_values(frame.iloc[:, touched])[rows, inverse]
+
+
+def _apply_compiled_shocks(target, compiled, *, absolute="add", flow=None, output=None):
+    """Apply compiled shock rows to ``target`` as vectorized scatter operations.
+
+    Every row is expanded to positional ``(row, column)`` cells. Cells touched
+    by several rows are split into layers by occurrence so each layer scatters
+    unique cells, which reproduces the sequential row-by-row semantics.
+    ``absolute="add"`` adds the value to the current cell (flow blocks), while
+    ``absolute="flow"`` rebuilds a coefficient from the baseline ``flow`` plus
+    the value, divided by the production column of ``output``.
+    """
+    if not compiled:
+        return target
+
+    row_keys = [key for row_keys, _, _, _ in compiled for key in row_keys]
+    column_keys = [key for _, column_keys, _, _ in compiled for key in column_keys]
+    row_positions = _axis_positions(target.index, row_keys)
+    column_positions = _axis_positions(target.columns, column_keys)
+
+    rows, columns, kinds, values = [], [], [], []
+    row_start = column_start = 0
+    for code, (shock_rows, shock_columns, _type, _value) in enumerate(compiled):
+        row_stop = row_start + len(shock_rows)
+        column_stop = column_start + len(shock_columns)
+        selected_rows = row_positions[row_start:row_stop]
+        selected_columns = column_positions[column_start:column_stop]
+        size = selected_rows.size * selected_columns.size
+        rows.append(np.repeat(selected_rows, selected_columns.size))
+        columns.append(np.tile(selected_columns, selected_rows.size))
+        kinds.append(np.full(size, _SHOCK_OPERATIONS.index(_type), dtype=np.int8))
+        values.append(np.full(size, float(_value)))
+        row_start, column_start = row_stop, column_stop
+
+    rows = np.concatenate(rows)
+    columns = np.concatenate(columns)
+    kinds = np.concatenate(kinds)
+    values = np.concatenate(values)
+
+    absolute_code = _SHOCK_OPERATIONS.index("Absolute")
+    percentage_code = _SHOCK_OPERATIONS.index("Percentage")
+    if absolute == "flow":
+        # Coefficients rebuilt from the baseline flows do not depend on the
+        # current cell, so they behave like updates.
+        selected = kinds == absolute_code
+        if selected.any():
+            flow_rows = rows[selected]
+            flow_columns = columns[selected]
+            if not flow.index.equals(target.index):
+                flow_rows = _axis_positions(flow.index, list(target.index[flow_rows]))
+            if not flow.columns.equals(target.columns):
+                flow_columns = _axis_positions(flow.columns, list(target.columns[flow_columns]))
+            output_rows = _axis_positions(output.index, list(target.columns[columns[selected]]))
+            production = dense_values(output.loc[:, "production"])[output_rows]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values[selected] = (_frame_cells(flow, flow_rows, flow_columns) + values[selected]) / production
+            kinds[selected] = _SHOCK_OPERATIONS.index("Update")
+
+    touched, block_columns = np.unique(columns, return_inverse=True)
+    sparse_backed = _is_sparse_backed_dataframe(target)
+    if sparse_backed:
+        block = dense_values(target.iloc[:, touched], copy=True)
+    else:
+        full = target.to_numpy(dtype=float, copy=True)
+        block = full[:, touched]
+
+    cells = rows.astype(np.int64) * touched.size + block_columns
+    order = np.argsort(cells, kind="stable")
+    sorted_cells = cells[order]
+    first = np.ones(sorted_cells.size, dtype=bool)
+    first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+    group_start = np.maximum.accumulate(np.where(first, np.arange(sorted_cells.size), 0))
+    layer = np.empty_like(order)
+    layer[order] = np.arange(sorted_cells.size) - group_start
+
+    for depth in range(int(layer.max()) + 1):
+        in_layer = layer == depth
+        for code in np.unique(kinds[in_layer]):
+            selected = in_layer & (kinds == code)
+            cell_rows, cell_columns = rows[selected], block_columns[selected]
+            if code == percentage_code:
+                block[cell_rows, cell_columns] *= 1 + values[selected]
+            elif code == absolute_code:
+                block[cell_rows, cell_columns] += values[selected]
+            else:
+                block[cell_rows, cell_columns] = values[selected]
+
+    if sparse_backed:
+        result = target.copy()
+        for offset, position in enumerate(touched):
+            fill_value = target.dtypes.iloc[position].fill_value
+            result.isetitem(int(position), pd.arrays.SparseArray(block[:, offset], fill_value=fill_value))
+        return result
+
+    full[:, touched] = block
+    return pd.DataFrame(full, index=target.index, columns=target.columns)
+
+
 def Y_shock(instance, path, boolean, clusters, to_baseline):
     """Apply final-demand shocks and return the updated block plus notes."""
     Y = _baseline_block(instance, _ENUM.Y)
@@ -615,71 +825,35 @@ def Y_shock(instance, path, boolean, clusters, to_baseline):
             f"nans(empty cells) found in the shock file for '{_ENUM.Y}'."
         )
 
-    for shock in range(len(info)):
-        if _is_mix_type(_type[shock]):
-            # Mix rows are collected and applied by the dedicated spec readers.
-            continue
-        if nan_check(info, shock, _type[shock]):
-            log_time(
-                logger,
-                "nan values found on row {} of {} shock sheet. No more shock is imported after row {}".format(
-                    shock, _ENUM.Y, shock
-                ),
-                "warning",
-            )
-            break
-
-        # Performing a full shock on the inputs
-        row_region_ = check_replace_clusters(
-            userValue=row_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
+    resolve = _shock_label_resolver(instance, clusters)
+    levels = (
+        [_MASTER_INDEX["s"]]
+        if instance.meta.table == "IOT"
+        else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]]
+    )
 
+    def resolve_row(shock):
+        row_region_ = resolve(row_region[shock], _MASTER_INDEX["r"])
         row_level_ = check_replace_clusters(
             userValue=row_level[shock],
-            dataValues=[_MASTER_INDEX["s"]]
-            if instance.meta.table == "IOT"
-            else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]],
+            dataValues=levels,
             clusters=None,
         )
-
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(row_level_),
-            clusters=clusters.get(row_level_),
-        )
-
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
+        row_sector_ = resolve(row_sector[shock], row_level_)
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
+        demand_category_ = resolve(demand_category[shock], _MASTER_INDEX["n"])
+
+        row_keys = _label_product(
+            lambda region, sector: _io_axis_key(Y.index, region, row_level_, sector),
+            row_region_,
+            row_sector_,
         )
-
-        demand_category_ = check_replace_clusters(
-            userValue=demand_category[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["n"]),
-            clusters=clusters.get(_MASTER_INDEX["n"]),
+        column_keys = _label_product(
+            lambda region, category: _fd_axis_key(Y.columns, region, category),
+            column_region_,
+            demand_category_,
         )
-
-        row_key = _io_axis_key(Y.index, row_region_, row_level_, row_sector_)
-        col_key = _fd_axis_key(Y.columns, column_region_, demand_category_)
-
-        if _type[shock] == "Absolute":
-            Y.loc[row_key, col_key] = Y.loc[row_key, col_key] + value[shock]
-
-        elif _type[shock] == "Percentage":
-            Y.loc[row_key, col_key] = Y.loc[row_key, col_key] * (1 + value[shock])
-
-        elif _type[shock] == "Update":
-            Y.loc[row_key, col_key] = value[shock]
-
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage, and Update."
-            )
-
-        notes.append(
+        note = (
             "Shock on Y implemented: row_region:{}, row_level:{}, "
             "row_sector:{}, column_region:{}, demand_category: {}, "
             "type: {}, value: {}.".format(
@@ -692,6 +866,17 @@ def Y_shock(instance, path, boolean, clusters, to_baseline):
                 value[shock],
             )
         )
+        return row_keys, column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=_ENUM.Y,
+        type_error="Acceptable values for type are Absolute, Percentage, and Update.",
+    )
+    Y = _apply_compiled_shocks(Y, compiled, absolute="add")
 
     return Y, notes
 
@@ -751,78 +936,29 @@ def V_shock(instance, path, matrix, boolean, clusters, to_baseline):
     _type = _shock_column(info, SHOCK_FLAT_COLUMNS["type"], SHOCK_COLUMNS["type"])
     value = _shock_column(info, SHOCK_FLAT_COLUMNS["value"], SHOCK_COLUMNS["value"])
 
-    for shock in range(len(info)):
-        if nan_check(info, shock, _type[shock]):
-            log_time(
-                logger,
-                "nan values found on row {} of {} shock sheet. No more shock is imported after row {}".format(
-                    shock, matrix, shock
-                ),
-                "warning",
-            )
-            break
-
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(_MASTER_INDEX[_id]),
-            clusters=clusters.get(_MASTER_INDEX[_id]),
-        )
-
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
+    resolve = _shock_label_resolver(instance, clusters)
+    levels = (
+        [_MASTER_INDEX["s"]]
+        if instance.meta.table == "IOT"
+        else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]]
+    )
 
+    def resolve_row(shock):
+        row_sector_ = resolve(row_sector[shock], _MASTER_INDEX[_id])
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
         column_level_ = check_replace_clusters(
             userValue=column_level[shock],
-            dataValues=[_MASTER_INDEX["s"]]
-            if instance.meta.table == "IOT"
-            else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]],
+            dataValues=levels,
             clusters=None,
         )
+        column_sector_ = resolve(column_sector[shock], column_level_)
 
-        column_sector_ = check_replace_clusters(
-            userValue=column_sector[shock],
-            dataValues=instance.get_index(column_level_),
-            clusters=clusters.get(column_level_),
-        )
-
-        column_key = _io_axis_key(
-            coeff.columns,
-            column_region_,
-            column_level_,
-            column_sector_,
-        )
-        output_key = _io_axis_key(
-            X.index,
+        column_keys = _label_product(
+            lambda region, sector: _io_axis_key(coeff.columns, region, column_level_, sector),
             column_region_,
-            column_level_,
             column_sector_,
         )
-
-        if _type[shock] == "Percentage":
-            coeff.loc[row_sector_, column_key] = get_value(
-                coeff.loc[row_sector_, column_key]
-            ) * (
-                1 + value[shock]
-            )
-
-        elif _type[shock] == "Absolute":
-            coeff.loc[row_sector_, column_key] = (
-                get_value(flow.loc[row_sector_, column_key])
-                + value[shock]
-            ) / get_value(X.loc[output_key, "production"])
-
-        elif _type[shock] == "Update":
-            coeff.loc[row_sector_, column_key] = value[shock]
-
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage and Update"
-            )
-
-        notes.append(
+        note = (
             "Shock on {} implemented: row_sector:{}, column_region:{}, "
             "column_level:{}, column_sector:{}, "
             "type: {}, value: {}.".format(
@@ -835,6 +971,18 @@ def V_shock(instance, path, matrix, boolean, clusters, to_baseline):
                 value[shock],
             )
         )
+        return _as_label_list(row_sector_), column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=matrix,
+        type_error="Acceptable values for type are Absolute, Percentage and Update",
+        skip_mix=False,
+    )
+    coeff = _apply_compiled_shocks(coeff, compiled, absolute="flow", flow=flow, output=X)
 
     return coeff, notes
 
@@ -897,60 +1045,25 @@ def _split_intermediate_shock(
     _type = _shock_column(info, SHOCK_FLAT_COLUMNS["type"], SHOCK_COLUMNS["type"])
     value = _shock_column(info, SHOCK_FLAT_COLUMNS["value"], SHOCK_COLUMNS["value"])
 
-    for shock in range(len(info)):
-        if _is_mix_type(_type[shock]):
-            # Mix rows are collected and applied by the dedicated spec readers.
-            continue
-        if nan_check(info, shock, _type[shock]):
-            log_time(
-                logger,
-                "nan values found on row {} of {} shock sheet. No more shock is imported after row {}".format(
-                    shock, sheet_name, shock
-                ),
-                "warning",
-            )
-            break
+    resolve = _shock_label_resolver(instance, clusters)
 
-        row_region_ = check_replace_clusters(
-            userValue=row_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(row_level),
-            clusters=clusters.get(row_level),
-        )
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
+    def resolve_row(shock):
+        row_region_ = resolve(row_region[shock], _MASTER_INDEX["r"])
+        row_sector_ = resolve(row_sector[shock], row_level)
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
+        column_sector_ = resolve(column_sector[shock], column_level)
+
+        row_keys = _label_product(
+            lambda region, sector: (region, row_level, sector),
+            row_region_,
+            row_sector_,
         )
-        column_sector_ = check_replace_clusters(
-            userValue=column_sector[shock],
-            dataValues=instance.get_index(column_level),
-            clusters=clusters.get(column_level),
+        column_keys = _label_product(
+            lambda region, sector: (region, column_level, sector),
+            column_region_,
+            column_sector_,
         )
-
-        row_key = (row_region_, row_level, row_sector_)
-        col_key = (column_region_, column_level, column_sector_)
-
-        if _type[shock] == "Percentage":
-            coeff.loc[row_key, col_key] = get_value(coeff.loc[row_key, col_key]) * (
-                1 + value[shock]
-            )
-        elif _type[shock] == "Absolute":
-            coeff.loc[row_key, col_key] = (
-                get_value(flow.loc[row_key, col_key]) + value[shock]
-            ) / get_value(output.loc[col_key, "production"])
-        elif _type[shock] == "Update":
-            coeff.loc[row_key, col_key] = value[shock]
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage and Update"
-            )
-
-        notes.append(
+        note = (
             "Shock on {} implemented: row_region:{}, row_level:{}, "
             "row_sector:{}, column_region:{}, column_level:{}, "
             "column_sector:{}, type: {}, value: {}.".format(
@@ -965,6 +1078,17 @@ def _split_intermediate_shock(
                 value[shock],
             )
         )
+        return row_keys, column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=sheet_name,
+        type_error="Acceptable values for type are Absolute, Percentage and Update",
+    )
+    coeff = _apply_compiled_shocks(coeff, compiled, absolute="flow", flow=flow, output=output)
 
     return coeff, notes
 
@@ -1042,46 +1166,25 @@ def _split_final_demand_shock(
     _type = _shock_column(info, SHOCK_FLAT_COLUMNS["type"], SHOCK_COLUMNS["type"])
     value = _shock_column(info, SHOCK_FLAT_COLUMNS["value"], SHOCK_COLUMNS["value"])
 
-    for shock in range(len(info)):
-        if _is_mix_type(_type[shock]):
-            # Mix rows are collected and applied by the dedicated spec readers.
-            continue
-        row_region_ = check_replace_clusters(
-            userValue=row_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(row_level),
-            clusters=clusters.get(row_level),
-        )
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
-        demand_category_ = check_replace_clusters(
-            userValue=demand_category[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["n"]),
-            clusters=clusters.get(_MASTER_INDEX["n"]),
-        )
-
-        row_key = (row_region_, row_level, row_sector_)
-        col_key = (column_region_, _MASTER_INDEX["n"], demand_category_)
+    resolve = _shock_label_resolver(instance, clusters)
 
-        if _type[shock] == "Absolute":
-            flow.loc[row_key, col_key] = get_value(flow.loc[row_key, col_key]) + value[shock]
-        elif _type[shock] == "Percentage":
-            flow.loc[row_key, col_key] = get_value(flow.loc[row_key, col_key]) * (1 + value[shock])
-        elif _type[shock] == "Update":
-            flow.loc[row_key, col_key] = value[shock]
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage, and Update."
-            )
+    def resolve_row(shock):
+        row_region_ = resolve(row_region[shock], _MASTER_INDEX["r"])
+        row_sector_ = resolve(row_sector[shock], row_level)
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
+        demand_category_ = resolve(demand_category[shock], _MASTER_INDEX["n"])
 
-        notes.append(
+        row_keys = _label_product(
+            lambda region, sector: (region, row_level, sector),
+            row_region_,
+            row_sector_,
+        )
+        column_keys = _label_product(
+            lambda region, category: (region, _MASTER_INDEX["n"], category),
+            column_region_,
+            demand_category_,
+        )
+        note = (
             "Shock on {} implemented: row_region:{}, row_level:{}, row_sector:{}, "
             "column_region:{}, demand_category:{}, type:{}, value:{}.".format(
                 note_label,
@@ -1094,6 +1197,18 @@ def _split_final_demand_shock(
                 value[shock],
             )
         )
+        return row_keys, column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=sheet_name,
+        type_error="Acceptable values for type are Absolute, Percentage, and Update.",
+        stop_at_nan=False,
+    )
+    flow = _apply_compiled_shocks(flow, compiled, absolute="add")
 
     return flow, notes
 
@@ -1175,39 +1290,19 @@ def _split_factor_extension_shock(
     _type = _shock_column(info, SHOCK_FLAT_COLUMNS["type"], SHOCK_COLUMNS["type"])
     value = _shock_column(info, SHOCK_FLAT_COLUMNS["value"], SHOCK_COLUMNS["value"])
 
-    for shock in range(len(info)):
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(row_code),
-            clusters=clusters.get(row_code),
-        )
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
-        column_sector_ = check_replace_clusters(
-            userValue=column_sector[shock],
-            dataValues=instance.get_index(column_level),
-            clusters=clusters.get(column_level),
-        )
+    resolve = _shock_label_resolver(instance, clusters)
 
-        col_key = (column_region_, column_level, column_sector_)
+    def resolve_row(shock):
+        row_sector_ = resolve(row_sector[shock], row_code)
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
+        column_sector_ = resolve(column_sector[shock], column_level)
 
-        if _type[shock] == "Percentage":
-            coeff.loc[row_sector_, col_key] = get_value(coeff.loc[row_sector_, col_key]) * (1 + value[shock])
-        elif _type[shock] == "Absolute":
-            coeff.loc[row_sector_, col_key] = (
-                get_value(flow.loc[row_sector_, col_key]) + value[shock]
-            ) / get_value(output.loc[col_key, "production"])
-        elif _type[shock] == "Update":
-            coeff.loc[row_sector_, col_key] = value[shock]
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage and Update"
-            )
-
-        notes.append(
+        column_keys = _label_product(
+            lambda region, sector: (region, column_level, sector),
+            column_region_,
+            column_sector_,
+        )
+        note = (
             "Shock on {} implemented: row_sector:{}, column_region:{}, "
             "column_level:{}, column_sector:{}, type:{}, value:{}.".format(
                 note_label,
@@ -1219,6 +1314,19 @@ def _split_factor_extension_shock(
                 value[shock],
             )
         )
+        return _as_label_list(row_sector_), column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=sheet_name,
+        type_error="Acceptable values for type are Absolute, Percentage and Update",
+        skip_mix=False,
+        stop_at_nan=False,
+    )
+    coeff = _apply_compiled_shocks(coeff, compiled, absolute="flow", flow=flow, output=output)
 
     return coeff, notes
 
@@ -1325,83 +1433,40 @@ def Z_shock(instance, path, boolean, clusters, to_baseline):
             f"nans(empty cells) found in the shock file for '{_ENUM.Z}'."
         )
 
-    for shock in range(len(info)):
-        if _is_mix_type(_type[shock]):
-            # Mix rows are collected and applied by the dedicated spec readers.
-            continue
-        if nan_check(info, shock, _type[shock]):
-            log_time(
-                logger,
-                "nan values found on row {} of {} shock sheet. No more shock is imported after row {}".format(
-                    shock, _ENUM.Z, shock
-                ),
-                "warning",
-            )
-            break
-
-        # Performing a full shock on the inputs
-        row_region_ = check_replace_clusters(
-            userValue=row_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
+    resolve = _shock_label_resolver(instance, clusters)
+    levels = (
+        [_MASTER_INDEX["s"]]
+        if instance.meta.table == "IOT"
+        else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]]
+    )
 
+    def resolve_row(shock):
+        row_region_ = resolve(row_region[shock], _MASTER_INDEX["r"])
         row_level_ = check_replace_clusters(
             userValue=row_level[shock],
-            dataValues=[_MASTER_INDEX["s"]]
-            if instance.meta.table == "IOT"
-            else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]],
+            dataValues=levels,
             clusters=None,
         )
-
-        row_sector_ = check_replace_clusters(
-            userValue=row_sector[shock],
-            dataValues=instance.get_index(row_level_),
-            clusters=clusters.get(row_level_),
-        )
-
-        column_region_ = check_replace_clusters(
-            userValue=column_region[shock],
-            dataValues=instance.get_index(_MASTER_INDEX["r"]),
-            clusters=clusters.get(_MASTER_INDEX["r"]),
-        )
-
+        row_sector_ = resolve(row_sector[shock], row_level_)
+        column_region_ = resolve(column_region[shock], _MASTER_INDEX["r"])
         column_level_ = check_replace_clusters(
             userValue=column_level[shock],
-            dataValues=[_MASTER_INDEX["s"]]
-            if instance.meta.table == "IOT"
-            else [_MASTER_INDEX["a"], _MASTER_INDEX["c"]],
+            dataValues=levels,
             clusters=None,
         )
+        column_sector_ = resolve(column_sector[shock], column_level_)
 
-        column_sector_ = check_replace_clusters(
-            userValue=column_sector[shock],
-            dataValues=instance.get_index(column_level_),
-            clusters=clusters.get(column_level_),
+        row_keys = _label_product(
+            lambda region, sector: _io_axis_key(z.index, region, row_level_, sector),
+            row_region_,
+            row_sector_,
         )
-
-        row_key = _io_axis_key(Z.index, row_region_, row_level_, row_sector_)
-        column_key = _io_axis_key(Z.columns, column_region_, column_level_, column_sector_)
-        output_key = _io_axis_key(X.index, column_region_, column_level_, column_sector_)
-
-        if _type[shock] == "Percentage":
-            z.loc[row_key, column_key] = z.loc[row_key, column_key] * (1 + value[shock])
-
-        elif _type[shock] == "Absolute":
-            z.loc[row_key, column_key] = (
-                get_value(Z.loc[row_key, column_key])
-                + value[shock]
-            ) / get_value(X.loc[output_key, "production"])
-
-        elif _type[shock] == "Update":
-            z.loc[row_key, column_key] = value[shock]
-
-        else:
-            raise WrongInput(
-                "Acceptable values for type are Absolute, Percentage, and Update."
-            )
-
-        notes.append(
+        column_keys = _label_product(
+            lambda region, sector: _io_axis_key(z.columns, region, column_level_, sector),
+            column_region_,
+            column_sector_,
+        )
+        note = (
             "Shock on z implemented: row_region_:{}, row_level_:{}, "
             "row_sector_:{}, column_region_:{}, column_level_:{} "
             "column_sector_:{}, type: {}, value: {}.".format(
@@ -1415,5 +1480,16 @@ def Z_shock(instance, path, boolean, clusters, to_baseline):
                 value[shock],
             )
         )
+        return row_keys, column_keys, note
+
+    compiled, notes = _compile_shock_rows(
+        info,
+        _type,
+        value,
+        resolve_row,
+        sheet_name=_ENUM.Z,
+        type_error="Acceptable values for type are Absolute, Percentage, and Update.",
+    )
+    z = _apply_compiled_shocks(z, compiled, absolute="flow", flow=Z, output=X)
 
     return z, notes
@@ -17,6 +17,12 @@ from mario.log_exc.logger import log_time
 import pandas as pd
 import numpy as np
 import copy
+from mario.compute.helpers import (
+    _is_sparse_backed_dataframe,
+    dense_values,
+    inverse_vector,
+    sparse_frame_from_spmatrix,
+)
 from mario.compute.primitives import calc_X
 from mario.model.conventions import _ENUM, _MASTER_INDEX
 from mario.utils import rename_index
@@ -39,8 +45,75 @@ def _restore_public_axis_names(axis, original):
     return axis
 
 
+def _sparse_operator(frame: pd.DataFrame, *, transpose: bool = False):
+    """Return one dataframe as a SciPy CSC matrix without densifying sparse blocks."""
+    from scipy import sparse
+
+    if _is_sparse_backed_dataframe(frame):
+        matrix = frame.sparse.to_coo()
+    else:
+        matrix = sparse.coo_matrix(dense_values(frame))
+    return (matrix.T if transpose else matrix).tocsc()
+
+
+def _solve_supply(supply: pd.DataFrame, rhs: np.ndarray, *, transpose: bool = False) -> np.ndarray:
+    """Solve ``S x = rhs`` (or ``S.T x = rhs``) with one sparse LU factorization.
+
+    When the supply matrix is singular the (Moore-Penrose) pseudo-inverse is
+    used instead, as the explicit inverse used to fall back to.
+    """
+    from scipy.sparse.linalg import factorized
+
+    from mario.compute.linear import solve_factor_block
+
+    lhs = _sparse_operator(supply, transpose=transpose)
+    try:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            solved = solve_factor_block(factorized(lhs), rhs)
+        if np.isfinite(solved).all():
+            return solved
+    except RuntimeError:
+        pass
+
+    _log_pseudo_inverse()
+    return np.linalg.pinv(lhs.toarray()) @ rhs
+
+
+def _log_pseudo_inverse() -> None:
+    """Warn that a singular matrix is inverted through its pseudo-inverse."""
+    log_time(
+        logger,
+        "Singular matrix issue. The (Moore-Penrose) "
+        "pseudo-inverse of a matrix will be used. This "
+        "may raise some inconsistency in the data",
+        "critical",
+    )
+
+
+def _inverse_output(output: np.ndarray) -> np.ndarray:
+    """Return ``1 / output`` with zeros kept at zero, as ``pinv(diag(output))`` does."""
+    if (output == 0).any():
+        _log_pseudo_inverse()
+    return inverse_vector(output).to_numpy()
+
+
+def _as_frame(values, *, index, columns) -> pd.DataFrame:
+    """Wrap a dense array or SciPy matrix product as a dataframe."""
+    from scipy import sparse
+
+    if sparse.issparse(values):
+        return sparse_frame_from_spmatrix(values, index=index, columns=columns)
+    return pd.DataFrame(np.asarray(values, dtype=float), index=index, columns=columns)
+
+
 def SUT_to_IOT(instance, method):
-    """Convert a SUT database to an IOT using Eurostat methods ``A`` to ``D``."""
+    """Convert a SUT database to an IOT using Eurostat methods ``A`` to ``D``.
+
+    The transformation matrices are never built: methods ``A`` and ``C``
+    solve against one sparse LU factorization of the supply matrix and
+    methods ``B`` and ``D`` scale it by the inverse output vectors, so
+    pandas sparse inputs stay sparse where the result allows it.
+    """
     if method not in SUT_TO_IOT_METHODS:
         raise WrongInput(
             "'{}' is not an accpetable input for 'method'. "
@@ -72,83 +145,47 @@ def SUT_to_IOT(instance, method):
     data[_ENUM.V] = data[_ENUM.V].loc[:, (slice(None), _MASTER_INDEX["a"], slice(None))]
     data[_ENUM.E] = data[_ENUM.E].loc[:, (slice(None), _MASTER_INDEX["a"], slice(None))]
 
-    q = data[_ENUM.X].loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :].values
-    g = data[_ENUM.X].loc[(slice(None), _MASTER_INDEX["a"], slice(None)), :].values
+    q = dense_values(data[_ENUM.X].loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]).reshape(-1)
+    g = dense_values(data[_ENUM.X].loc[(slice(None), _MASTER_INDEX["a"], slice(None)), :]).reshape(-1)
 
-    if method == "A":
+    if method in ("A", "C") and data[_ENUM.S].shape[0] != data[_ENUM.S].shape[1]:
         "Check number of commodities and industries"
-        if data[_ENUM.S].shape[0] != data[_ENUM.S].shape[1]:
-            raise NotImplementable(
-                "Method "
-                + str(method)
-                + " is not an acceptable for this table: commodities number must match activities number"
-            )
-
-        "Transformation matrix"
-        try:
-            T = np.linalg.inv(data[_ENUM.S].T) @ np.diagflat(q)
-        except np.linalg.LinAlgError:
-            log_time(
-                logger,
-                "Singular matrix issue. The (Moore-Penrose) "
-                "pseudo-inverse of a matrix will be used. This "
-                "may raise some inconsistency in the data",
-                "critical",
-            )
-            T = np.linalg.pinv(data[_ENUM.S].T) @ np.diagflat(q)
-
-        "Product by Product IOT"
-        Z_index = [
-            data[_ENUM.U].index.get_level_values(0),
-            [_MASTER_INDEX["s"]] * data[_ENUM.U].shape[0],
-            data[_ENUM.U].index.get_level_values(2),
-        ]
-
-        Z = pd.DataFrame(data[_ENUM.U].values @ T, index=Z_index, columns=Z_index)
-        V = pd.DataFrame(
-            data[_ENUM.V].values @ T, index=data[_ENUM.V].index, columns=Z_index
+        raise NotImplementable(
+            "Method "
+            + str(method)
+            + " is not an acceptable for this table: commodities number must match activities number"
         )
-        E = pd.DataFrame(
-            data[_ENUM.E].values @ T, index=data[_ENUM.E].index, columns=Z_index
-        )
-
-        Y = data[_ENUM.Y].loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]
-        Y.index = Z_index
-
-        "Fixing units"
-        units = copy.deepcopy(instance.units)
-        units[_MASTER_INDEX["s"]] = units[_MASTER_INDEX["c"]]
-
-        _indeces = copy.deepcopy(instance._indeces)
-        _indeces["s"] = _indeces["c"]
-
-    if method == "B":
-        "Transformation matrix"
-        try:
-            T = np.linalg.inv(np.diagflat(g)) @ data[_ENUM.S].values
-        except np.linalg.LinAlgError:
-            log_time(
-                logger,
-                "Singular matrix issue. The (Moore-Penrose) "
-                "pseudo-inverse of a matrix will be used. This "
-                "may raise some inconsistency in the data",
-                "critical",
-            )
-            T = np.linalg.pinv(np.diagflat(g)) @ data[_ENUM.S].values
 
+    if method in ("A", "B"):
         "Product by Product IOT"
-        Z_index = [
-            data[_ENUM.U].index.get_level_values(0),
-            [_MASTER_INDEX["s"]] * data[_ENUM.U].shape[0],
-            data[_ENUM.U].index.get_level_values(2),
-        ]
-
-        Z = pd.DataFrame(data[_ENUM.U].values @ T, index=Z_index, columns=Z_index)
-        V = pd.DataFrame(
-            data[_ENUM.V].values @ T, index=data[_ENUM.V].index, columns=Z_index
+        Z_index = pd.MultiIndex.from_arrays(
+            [
+                data[_ENUM.U].index.get_level_values(0),
+                [_MASTER_INDEX["s"]] * data[_ENUM.U].shape[0],
+                data[_ENUM.U].index.get_level_values(2),
+            ]
         )
-        E = pd.DataFrame(
-            data[_ENUM.E].values @ T, index=data[_ENUM.E].index, columns=Z_index
+        blocks = [(_ENUM.Z, data[_ENUM.U], Z_index), (_ENUM.V, data[_ENUM.V], None), (_ENUM.E, data[_ENUM.E], None)]
+
+        if method == "A":
+            "U inv(S') diag(q), solved as (inv(S) U')' scaled by q"
+            rhs = np.hstack([dense_values(block).T for _, block, _ in blocks])
+            solved = _solve_supply(data[_ENUM.S], rhs).T * q
+            offsets = np.cumsum([0, *(block.shape[0] for _, block, _ in blocks)])
+            transformed = [solved[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+        else:
+            "U inv(diag(g)) S, with inv(diag(g)) applied as a row scaling of S"
+            T = _sparse_operator(data[_ENUM.S]).multiply(_inverse_output(g)[:, None]).tocsc()
+            transformed = []
+            for _, block, _ in blocks:
+                if _is_sparse_backed_dataframe(block):
+                    transformed.append(block.sparse.to_coo().tocsr() @ T)
+                else:
+                    transformed.append(np.asarray((T.T @ dense_values(block).T).T))
+
+        Z, V, E = (
+            _as_frame(values, index=index if index is not None else block.index, columns=Z_index)
+            for (_, block, index), values in zip(blocks, transformed)
         )
 
         Y = data[_ENUM.Y].loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]
@@ -161,50 +198,36 @@ def SUT_to_IOT(instance, method):
         _indeces = copy.deepcopy(instance._indeces)
         _indeces["s"] = _indeces["c"]
 
-    if method == "C":
-        "Check number of commodities and industries"
-        if data[_ENUM.S].shape[0] != data[_ENUM.S].shape[1]:
-            raise NotImplementable(
-                "Method "
-                + str(method)
-                + " is not an acceptable for this table: commodities number must match activities number"
-            )
-
-        "Transformation matrix"
-        try:
-            T = np.diagflat(g) @ np.linalg.inv(data[_ENUM.S].T)
-        except np.linalg.LinAlgError:
-            log_time(
-                logger,
-                "Singular matrix issue. The (Moore-Penrose) "
-                "pseudo-inverse of a matrix will be used. This "
-                "may raise some inconsistency in the data",
-                "critical",
-            )
-            T = np.diagflat(g) @ np.linalg.pinv(data[_ENUM.S].T)
-
+    if method in ("C", "D"):
         "Industry by Industry IOT"
-        Z_index = [
-            data[_ENUM.S].index.get_level_values(0),
-            [_MASTER_INDEX["s"]] * data[_ENUM.S].shape[0],
-            data[_ENUM.S].index.get_level_values(2),
-        ]
-
-        Z = pd.DataFrame(T @ data[_ENUM.U].values, index=Z_index, columns=Z_index)
-        V = pd.DataFrame(
-            data[_ENUM.V].values, index=data[_ENUM.V].index, columns=Z_index
-        )
-        E = pd.DataFrame(
-            data[_ENUM.E].values, index=data[_ENUM.E].index, columns=Z_index
-        )
-        Y = pd.DataFrame(
-            T
-            @ data[_ENUM.Y]
-            .loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]
-            .values,
-            index=Z_index,
-            columns=data[_ENUM.Y].columns,
+        Z_index = pd.MultiIndex.from_arrays(
+            [
+                data[_ENUM.S].index.get_level_values(0),
+                [_MASTER_INDEX["s"]] * data[_ENUM.S].shape[0],
+                data[_ENUM.S].index.get_level_values(2),
+            ]
         )
+        Yc = data[_ENUM.Y].loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]
+
+        if method == "C":
+            "diag(g) inv(S') [U, Y], solved against S' and scaled by g"
+            rhs = np.hstack([dense_values(data[_ENUM.U]), dense_values(Yc)])
+            solved = _solve_supply(data[_ENUM.S], rhs, transpose=True) * g[:, None]
+            transformed = [solved[:, : data[_ENUM.U].shape[1]], solved[:, data[_ENUM.U].shape[1] :]]
+        else:
+            "S inv(diag(q)) [U, Y], with inv(diag(q)) applied as a column scaling of S"
+            T = _sparse_operator(data[_ENUM.S]).multiply(_inverse_output(q)[None, :]).tocsr()
+            transformed = []
+            for block in (data[_ENUM.U], Yc):
+                if _is_sparse_backed_dataframe(block):
+                    transformed.append(T @ block.sparse.to_coo().tocsc())
+                else:
+                    transformed.append(T @ dense_values(block))
+
+        Z = _as_frame(transformed[0], index=Z_index, columns=Z_index)
+        V = data[_ENUM.V].set_axis(Z_index, axis=1)
+        E = data[_ENUM.E].set_axis(Z_index, axis=1)
+        Y = _as_frame(transformed[1], index=Z_index, columns=data[_ENUM.Y].columns)
 
         "Fixing units"
         units = copy.deepcopy(instance.units)
@@ -213,49 +236,6 @@ def SUT_to_IOT(instance, method):
         _indeces = copy.deepcopy(instance._indeces)
         _indeces["s"] = _indeces["a"]
 
-    if method == "D":
-        "Transformation matrix"
-        try:
-            T = data[_ENUM.S].values @ np.linalg.inv(np.diagflat(q))
-        except np.linalg.LinAlgError:
-            log_time(
-                logger,
-                "Singular matrix issue. The (Moore-Penrose) "
-                "pseudo-inverse of a matrix will be used. This "
-                "may raise some inconsistency in the data",
-                "critical",
-            )
-            T = data[_ENUM.S].values @ np.linalg.pinv(np.diagflat(q))
-
-        "Industry by Industry IOT"
-        Z_index = [
-            data[_ENUM.S].index.get_level_values(0),
-            [_MASTER_INDEX["s"]] * data[_ENUM.S].shape[0],
-            data[_ENUM.S].index.get_level_values(2),
-        ]
-
-        Z = pd.DataFrame(T @ data[_ENUM.U].values, index=Z_index, columns=Z_index)
-        V = pd.DataFrame(
-            data[_ENUM.V].values, index=data[_ENUM.V].index, columns=Z_index
-        )
-        E = pd.DataFrame(
-            data[_ENUM.E].values, index=data[_ENUM.E].index, columns=Z_index
-        )
-        Y = pd.DataFrame(
-            T
-            @ data[_ENUM.Y]
-            .loc[(slice(None), _MASTER_INDEX["c"], slice(None)), :]
-            .values,
-            index=Z_index,
-            columns=data[_ENUM.Y].columns,
-        )
-
-        "Fixing units"
-        units = copy.deepcopy(instance.units)
-        units[_MASTER_INDEX["s"]] = units[_MASTER_INDEX["a"]]
-        _indeces = copy.deepcopy(instance._indeces)
-        _indeces["s"] = _indeces["a"]
-
     del units[_MASTER_INDEX["c"]]
     del units[_MASTER_INDEX["a"]]
 
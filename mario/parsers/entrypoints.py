@@ -53,6 +53,7 @@ from mario.parsers.gloria import (
     detect_gloria_layout,
     gloria_resource_signature,
     parse_gloria_sut,
+    _gloria_workers,
     _normalize_satellite_request as _normalize_gloria_satellites,
     _select_gloria_satellites,
 )
@@ -94,6 +95,7 @@ from mario.parsers.specs import (
     STATCAN_OPENIO_CANADA_SOURCE,
     STATCAN_VALUATIONS,
 )
+from mario.storage import MemmapBlockRepository
 import pandas as pd
 
 
@@ -138,7 +140,7 @@ def _legacy_model_state_builder(
 
 models = {"Database": Database, "ModelState": _legacy_model_state_builder}
 logger = logging.getLogger(__name__)
-_GLORIA_CACHE_VERSION = "2026-03-25"
+_GLORIA_CACHE_VERSION = "2026-10-18"
 
 
 def _normalize_gloria_regions(regions):
@@ -213,6 +215,42 @@ def _write_json_file(path: Path, payload: dict) -> None:
         json.dump(payload, stream, indent=2, sort_keys=True)
 
 
+def _write_gloria_cache(cache_dir: Path, matrices, indeces, units) -> dict:
+    """Persist parsed GLORIA blocks as memory-mappable binary arrays.
+
+    Blocks go to a :class:`~mario.storage.MemmapBlockRepository` under
+    ``cache_dir / "blocks"``; sets and units are returned as a json payload
+    for the cache info file.
+    """
+    repository = MemmapBlockRepository(cache_dir / "blocks")
+    for matrix_name, frame in matrices["baseline"].items():
+        repository.put(f"baseline/{matrix_name}", frame)
+    return {
+        "matrices": list(matrices["baseline"]),
+        "indeces": indeces,
+        "units": {
+            level: {"items": frame.index.tolist(), "units": frame.iloc[:, 0].tolist()}
+            for level, frame in units.items()
+        },
+    }
+
+
+def _read_gloria_cache(cache_dir: Path, cache_info: dict):
+    """Load the blocks, sets and units written by :func:`_write_gloria_cache`."""
+    repository = MemmapBlockRepository(cache_dir / "blocks")
+    matrices = {
+        "baseline": {
+            matrix_name: repository.get(f"baseline/{matrix_name}")
+            for matrix_name in cache_info["matrices"]
+        }
+    }
+    units = {
+        level: pd.DataFrame({"unit": payload["units"]}, index=payload["items"])
+        for level, payload in cache_info["units"].items()
+    }
+    return matrices, cache_info["indeces"], units
+
+
 def _build_gloria_database(
     *,
     matrices,
@@ -2585,6 +2623,7 @@ def parse_gloria(
     satellites: str | list[str] | tuple[str, ...] | None = "all",
     dtype: str = "float32",
     cache: bool | str | Path = False,
+    workers: int = 1,
     model: str = "Database",
     name: str | None = None,
     calc_all: bool = False,
@@ -2620,9 +2659,15 @@ def parse_gloria(
         numeric dtype used for dense GLORIA blocks. ``float32`` is the default
         because GLORIA use matrices are large.
     cache : bool or path-like, optional
-        if ``True``, cache the parsed result as parquet under the GLORIA root
-        and reuse it on subsequent calls when the raw file signature matches.
-        A custom directory can also be provided.
+        if ``True``, cache the parsed blocks as binary ``.npy`` arrays under
+        the GLORIA root and memory-map them on subsequent calls when the raw
+        file signature matches. A custom directory can also be provided.
+    workers : int, optional
+        number of processes reading the independent raw GLORIA files
+        concurrently. The default ``1`` reads them sequentially in the
+        current process; more workers trade memory for speed, since every
+        dense block is copied back from its worker process. ``None`` is
+        rejected rather than picking a process count.
     """
     if model not in models:
         raise WrongInput("Available models are {}".format([*models]))
@@ -2630,6 +2675,7 @@ def parse_gloria(
     validate_parse_request(table=table, model=model)
     if table != "SUT":
         raise NotImplementable("GLORIA parsing currently supports only SUT tables.")
+    _gloria_workers(workers, 1)
 
     layout, metadata = detect_gloria_layout(
         path=path,
@@ -2653,32 +2699,24 @@ def parse_gloria(
             dtype=dtype,
         )
         cache_info_path = cache_dir / "gloria_cache.json"
-        flows_dir = cache_dir / "flows"
 
-        if cache_info_path.exists() and flows_dir.exists():
+        if cache_info_path.exists():
             cache_info = _read_json_file(cache_info_path)
             if cache_info.get("signature") == cache_signature:
-                log_time(logger, f"Parser: loading GLORIA parquet cache from {cache_dir}.", "info")
-                state = parse_state_from_parquet(
-                    path=str(flows_dir),
-                    table="SUT",
-                    mode="flows",
-                    flat=True,
-                    name=name or cache_info.get("name") or layout.dataset_name,
-                    source=cache_info.get("source") or layout.source,
-                    year=cache_info.get("year", layout.year),
-                    price=cache_info.get("price", layout.price),
-                )
-                return build_database_from_state(
-                    state,
+                log_time(logger, f"Parser: loading GLORIA binary cache from {cache_dir}.", "info")
+                matrices, indeces, units = _read_gloria_cache(cache_dir, cache_info)
+                database = _build_gloria_database(
+                    matrices=matrices,
+                    indeces=indeces,
+                    units=units,
+                    layout=layout,
                     model=model,
+                    name=name or cache_info.get("name"),
                     calc_all=calc_all,
-                    name=name or cache_info.get("name") or layout.dataset_name,
-                    source=cache_info.get("source") or layout.source,
-                    year=cache_info.get("year", layout.year),
-                    price=cache_info.get("price", layout.price),
-                    **kwargs,
+                    notes=cache_info.get("notes", layout.notes),
+                    kwargs=kwargs,
                 )
+                return database
 
     matrices, indeces, units, layout = parse_gloria_sut(
         path=path,
@@ -2689,7 +2727,9 @@ def parse_gloria(
         dtype=dtype,
         layout=layout,
         metadata=metadata,
+        workers=workers,
     )
+    cached_blocks = _write_gloria_cache(cache_dir, matrices, indeces, units) if cache_dir is not None else None
     database = _build_gloria_database(
         matrices=matrices,
         indeces=indeces,
@@ -2703,8 +2743,7 @@ def parse_gloria(
     )
 
     if cache_dir is not None:
-        log_time(logger, f"Parser: writing GLORIA parquet cache to {cache_dir}.", "info")
-        database.to_parquet(path=str(cache_dir), flows=True, coefficients=False, flat=True, include_meta=True)
+        log_time(logger, f"Parser: writing GLORIA binary cache to {cache_dir}.", "info")
         _write_json_file(
             cache_info_path,
             {
@@ -2714,6 +2753,7 @@ def parse_gloria(
                 "year": database.meta.year,
                 "price": database.meta.price,
                 "notes": list(layout.notes),
+                **cached_blocks,
             },
         )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import lru_cache
@@ -14,6 +15,7 @@ import numpy as np
 import pandas as pd
 from scipy import sparse
 
+from mario.compute.helpers import sparse_frame_from_spmatrix
 from mario.log_exc.exceptions import WrongInput
 from mario.log_exc.logger import log_time
 from mario.model.conventions import _MASTER_INDEX
@@ -702,18 +704,56 @@ def _final_demand_positions(region_positions: list[int], fd_count: int) -> np.nd
     ).astype(np.int32)
 
 
-def _row_maps(region_positions: list[int], sector_count: int) -> tuple[dict[int, int], dict[int, int]]:
-    """Return raw-row to canonical-row maps for activity and commodity rows."""
-    activity_rows: dict[int, int] = {}
-    commodity_rows: dict[int, int] = {}
+def _row_maps(region_positions: list[int], sector_count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return raw-row to canonical-row lookups for activity and commodity rows.
+
+    Both lookups are integer arrays indexed by raw row number; rows that do
+    not belong to the selection map to ``-1``.
+    """
+    size = (max(region_positions, default=-1) + 1) * sector_count * 2
+    activity_rows = np.full(size, -1, dtype=np.int64)
+    commodity_rows = np.full(size, -1, dtype=np.int64)
     for local_region, absolute_region in enumerate(region_positions):
         base = absolute_region * sector_count * 2
-        for sector in range(sector_count):
-            activity_rows[base + sector] = local_region * sector_count + sector
-            commodity_rows[base + sector_count + sector] = local_region * sector_count + sector
+        local = np.arange(local_region * sector_count, (local_region + 1) * sector_count)
+        activity_rows[base : base + sector_count] = local
+        commodity_rows[base + sector_count : base + sector_count * 2] = local
     return activity_rows, commodity_rows
 
 
+def _region_rows(region_positions: list[int], block_size: int) -> np.ndarray:
+    """Return the sorted raw row numbers of the per-region row blocks of ``region_positions``."""
+    return np.concatenate(
+        [np.arange(position * block_size, (position + 1) * block_size) for position in sorted(region_positions)]
+        or [np.empty(0, dtype=np.int64)]
+    ).astype(np.int64)
+
+
+def _positions_lookup(positions: list[int]) -> np.ndarray:
+    """Return a raw-row lookup mapping ``positions[i]`` to ``i`` and other rows to ``-1``."""
+    lookup = np.full(max(positions, default=-1) + 1, -1, dtype=np.int64)
+    lookup[np.asarray(positions, dtype=np.int64)] = np.arange(len(positions))
+    return lookup
+
+
+def _lookup_rows(lookup: np.ndarray, row_numbers: np.ndarray) -> np.ndarray:
+    """Map one batch of raw row numbers through a lookup, with ``-1`` for unknown rows."""
+    local = np.full(len(row_numbers), -1, dtype=np.int64)
+    inside = row_numbers < len(lookup)
+    local[inside] = lookup[row_numbers[inside]]
+    return local
+
+
+def _batch_triplets(local_rows: np.ndarray, block: np.ndarray, dtype: np.dtype):
+    """Return the non-zero ``(rows, cols, values)`` of one batch with one ``nonzero`` call."""
+    positions, columns = np.nonzero(block)
+    return (
+        local_rows[positions].astype(np.int32, copy=False),
+        columns.astype(np.int32, copy=False),
+        block[positions, columns].astype(dtype, copy=False),
+    )
+
+
 def _build_axes(
     region_codes: list[str],
     sector_names: tuple[str, ...],
@@ -738,12 +778,32 @@ def _iter_csv_batches(
     columns: np.ndarray | list[int] | tuple[int, ...],
     dtype: np.dtype,
     batch_size: int,
+    rows: np.ndarray | None = None,
 ):
-    """Yield ``(row_numbers, values)`` batches from one wide GLORIA csv file."""
+    """Yield ``(row_numbers, values)`` batches from one wide GLORIA csv file.
+
+    When ``rows`` (sorted raw row numbers) is given, the csv tokenizer skips
+    every other line before its fields are split or converted, and parsing
+    ends after the last requested row (``nrows``), so the rest of the file
+    is not tokenized. A contiguous selection skips its leading lines by count;
+    gaps inside the selection are passed as a set of line numbers, which the
+    C tokenizer checks without calling back into Python.
+    """
     column_numbers = [int(value) for value in columns]
     if not column_numbers:
         raise ValueError("At least one column should be selected.")
     contiguous_full_width = column_numbers == list(range(column_numbers[-1] + 1))
+    skiprows = None
+    nrows = None
+    if rows is not None:
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if not len(rows):
+            return
+        nrows = len(rows)
+        if rows[-1] - rows[0] + 1 == nrows:
+            skiprows = int(rows[0])
+        else:
+            skiprows = np.setdiff1d(np.arange(rows[-1], dtype=np.int64), rows, assume_unique=True)
     offset = 0
     with _open_gloria_resource(path) as stream:
         for chunk in pd.read_csv(
@@ -754,9 +814,14 @@ def _iter_csv_batches(
             chunksize=batch_size,
             engine="c",
             na_filter=False,
+            skiprows=skiprows,
+            nrows=nrows,
         ):
             values = chunk.to_numpy(copy=False)
-            row_numbers = np.arange(offset, offset + len(chunk), dtype=np.int64)
+            if rows is None:
+                row_numbers = np.arange(offset, offset + len(chunk), dtype=np.int64)
+            else:
+                row_numbers = rows[offset : offset + len(chunk)]
             offset += len(chunk)
             yield row_numbers, values
 
@@ -794,11 +859,12 @@ def _read_transaction_blocks(
     *,
     activity_columns: np.ndarray,
     commodity_columns: np.ndarray,
-    activity_row_map: dict[int, int],
-    commodity_row_map: dict[int, int],
+    activity_row_map: np.ndarray,
+    commodity_row_map: np.ndarray,
     s_shape: tuple[int, int],
     u_shape: tuple[int, int],
     dtype: np.dtype,
+    raw_rows: np.ndarray | None = None,
 ) -> tuple[sparse.csr_matrix, np.ndarray]:
     """Read one GLORIA ``T`` file once and derive both ``S`` and ``U`` blocks."""
     combined_columns = np.sort(np.concatenate([activity_columns, commodity_columns]).astype(np.int32, copy=False))
@@ -811,23 +877,29 @@ def _read_transaction_blocks(
     s_values: list[np.ndarray] = []
     u_data = np.zeros(u_shape, dtype=dtype)
 
-    for row_numbers, block in _iter_csv_batches(path, columns=combined_columns, dtype=dtype, batch_size=batch_size):
-        activity_block = block[:, activity_take]
-        commodity_block = block[:, commodity_take]
-        for raw_row, activity_values, commodity_values in zip(row_numbers.tolist(), activity_block, commodity_block):
-            raw_row = int(raw_row)
-            activity_row = activity_row_map.get(raw_row)
-            if activity_row is not None:
-                nonzero = np.flatnonzero(commodity_values)
-                if len(nonzero) > 0:
-                    s_rows.append(np.full(len(nonzero), activity_row, dtype=np.int32))
-                    s_cols.append(nonzero.astype(np.int32, copy=False))
-                    s_values.append(commodity_values[nonzero].astype(dtype, copy=False))
-                continue
+    for row_numbers, block in _iter_csv_batches(
+        path,
+        columns=combined_columns,
+        dtype=dtype,
+        batch_size=batch_size,
+        rows=raw_rows,
+    ):
+        activity_rows = _lookup_rows(activity_row_map, row_numbers)
+        selected = activity_rows >= 0
+        if selected.any():
+            rows, cols, values = _batch_triplets(
+                activity_rows[selected],
+                block[np.ix_(selected, commodity_take)],
+                dtype,
+            )
+            s_rows.append(rows)
+            s_cols.append(cols)
+            s_values.append(values)
 
-            commodity_row = commodity_row_map.get(raw_row)
-            if commodity_row is not None:
-                u_data[commodity_row, :] = activity_values
+        commodity_rows = _lookup_rows(commodity_row_map, row_numbers)
+        selected = commodity_rows >= 0
+        if selected.any():
+            u_data[commodity_rows[selected], :] = block[np.ix_(selected, activity_take)]
 
     return _coo_from_triplets(s_rows, s_cols, s_values, shape=s_shape, dtype=dtype), u_data
 
@@ -836,11 +908,12 @@ def _read_final_demand_blocks(
     path: Path,
     *,
     final_demand_columns: np.ndarray,
-    activity_row_map: dict[int, int],
-    commodity_row_map: dict[int, int],
+    activity_row_map: np.ndarray,
+    commodity_row_map: np.ndarray,
     ya_shape: tuple[int, int],
     yc_shape: tuple[int, int],
     dtype: np.dtype,
+    raw_rows: np.ndarray | None = None,
 ) -> tuple[sparse.csr_matrix, np.ndarray]:
     """Read one GLORIA ``Y`` file once and derive both ``Ya`` and ``Yc`` blocks."""
     batch_size = _recommended_batch_size(len(final_demand_columns), dtype)
@@ -854,21 +927,20 @@ def _read_final_demand_blocks(
         columns=final_demand_columns,
         dtype=dtype,
         batch_size=batch_size,
+        rows=raw_rows,
     ):
-        for raw_row, raw_values in zip(row_numbers.tolist(), block):
-            raw_row = int(raw_row)
-            activity_row = activity_row_map.get(raw_row)
-            if activity_row is not None:
-                nonzero = np.flatnonzero(raw_values)
-                if len(nonzero) > 0:
-                    ya_rows.append(np.full(len(nonzero), activity_row, dtype=np.int32))
-                    ya_cols.append(nonzero.astype(np.int32, copy=False))
-                    ya_values.append(raw_values[nonzero].astype(dtype, copy=False))
-                continue
-
-            commodity_row = commodity_row_map.get(raw_row)
-            if commodity_row is not None:
-                yc_data[commodity_row, :] = raw_values
+        activity_rows = _lookup_rows(activity_row_map, row_numbers)
+        selected = activity_rows >= 0
+        if selected.any():
+            rows, cols, values = _batch_triplets(activity_rows[selected], block[selected], dtype)
+            ya_rows.append(rows)
+            ya_cols.append(cols)
+            ya_values.append(values)
+
+        commodity_rows = _lookup_rows(commodity_row_map, row_numbers)
+        selected = commodity_rows >= 0
+        if selected.any():
+            yc_data[commodity_rows[selected], :] = block[selected]
 
     return _coo_from_triplets(ya_rows, ya_cols, ya_values, shape=ya_shape, dtype=dtype), yc_data
 
@@ -883,35 +955,37 @@ def _read_value_added_blocks(
     va_shape: tuple[int, int],
     vc_shape: tuple[int, int],
     dtype: np.dtype,
+    raw_rows: np.ndarray | None = None,
 ) -> tuple[np.ndarray, sparse.csr_matrix]:
     """Read one GLORIA ``V`` file once and derive both ``Va`` and ``Vc`` blocks."""
     combined_columns = np.sort(np.concatenate([activity_columns, commodity_columns]).astype(np.int32, copy=False))
     activity_take = np.searchsorted(combined_columns, activity_columns)
     commodity_take = np.searchsorted(combined_columns, commodity_columns)
     batch_size = _recommended_batch_size(len(combined_columns), dtype)
-    selected = set(selected_positions)
+    selected_regions = np.asarray(selected_positions, dtype=np.int64)
 
     va_data = np.zeros(va_shape, dtype=dtype)
     vc_rows: list[np.ndarray] = []
     vc_cols: list[np.ndarray] = []
     vc_values: list[np.ndarray] = []
 
-    for row_numbers, block in _iter_csv_batches(path, columns=combined_columns, dtype=dtype, batch_size=batch_size):
-        activity_block = block[:, activity_take]
-        commodity_block = block[:, commodity_take]
-        for raw_row, activity_values, commodity_values in zip(row_numbers.tolist(), activity_block, commodity_block):
-            raw_row = int(raw_row)
-            region_position = raw_row // factor_count
-            if region_position not in selected:
-                continue
-            factor_position = raw_row % factor_count
-            va_data[factor_position, :] += activity_values
-            nonzero = np.flatnonzero(commodity_values)
-            if len(nonzero) == 0:
-                continue
-            vc_rows.append(np.full(len(nonzero), factor_position, dtype=np.int32))
-            vc_cols.append(nonzero.astype(np.int32, copy=False))
-            vc_values.append(commodity_values[nonzero].astype(dtype, copy=False))
+    for row_numbers, block in _iter_csv_batches(
+        path,
+        columns=combined_columns,
+        dtype=dtype,
+        batch_size=batch_size,
+        rows=raw_rows,
+    ):
+        selected = np.isin(row_numbers // factor_count, selected_regions)
+        if not selected.any():
+            continue
+        factor_rows = row_numbers[selected] % factor_count
+        # ``add.at`` accumulates repeated factor rows in file order.
+        np.add.at(va_data, factor_rows, block[np.ix_(selected, activity_take)])
+        rows, cols, values = _batch_triplets(factor_rows, block[np.ix_(selected, commodity_take)], dtype)
+        vc_rows.append(rows)
+        vc_cols.append(cols)
+        vc_values.append(values)
 
     return va_data, _coo_from_triplets(vc_rows, vc_cols, vc_values, shape=vc_shape, dtype=dtype)
 
@@ -921,8 +995,10 @@ def _read_satellite_transaction_blocks(
     *,
     activity_columns: np.ndarray,
     commodity_columns: np.ndarray,
-    row_map: dict[int, int],
+    row_map: np.ndarray,
+    row_count: int,
     dtype: np.dtype,
+    raw_rows: np.ndarray | None = None,
 ) -> tuple[sparse.csr_matrix, sparse.csr_matrix]:
     """Read one GLORIA ``TQ`` file once and derive both ``Ea`` and ``Ec`` blocks."""
     combined_columns = np.sort(np.concatenate([activity_columns, commodity_columns]).astype(np.int32, copy=False))
@@ -937,29 +1013,31 @@ def _read_satellite_transaction_blocks(
     ec_cols: list[np.ndarray] = []
     ec_values: list[np.ndarray] = []
 
-    for row_numbers, block in _iter_csv_batches(path, columns=combined_columns, dtype=dtype, batch_size=batch_size):
-        activity_block = block[:, activity_take]
-        commodity_block = block[:, commodity_take]
-        for raw_row, activity_values, commodity_values in zip(row_numbers.tolist(), activity_block, commodity_block):
-            raw_row = int(raw_row)
-            local_row = row_map.get(raw_row)
-            if local_row is None:
-                continue
+    for row_numbers, block in _iter_csv_batches(
+        path,
+        columns=combined_columns,
+        dtype=dtype,
+        batch_size=batch_size,
+        rows=raw_rows,
+    ):
+        local_rows = _lookup_rows(row_map, row_numbers)
+        selected = local_rows >= 0
+        if not selected.any():
+            continue
+        local_rows = local_rows[selected]
 
-            activity_nonzero = np.flatnonzero(activity_values)
-            if len(activity_nonzero) > 0:
-                ea_rows.append(np.full(len(activity_nonzero), local_row, dtype=np.int32))
-                ea_cols.append(activity_nonzero.astype(np.int32, copy=False))
-                ea_values.append(activity_values[activity_nonzero].astype(dtype, copy=False))
+        rows, cols, values = _batch_triplets(local_rows, block[np.ix_(selected, activity_take)], dtype)
+        ea_rows.append(rows)
+        ea_cols.append(cols)
+        ea_values.append(values)
 
-            commodity_nonzero = np.flatnonzero(commodity_values)
-            if len(commodity_nonzero) > 0:
-                ec_rows.append(np.full(len(commodity_nonzero), local_row, dtype=np.int32))
-                ec_cols.append(commodity_nonzero.astype(np.int32, copy=False))
-                ec_values.append(commodity_values[commodity_nonzero].astype(dtype, copy=False))
+        rows, cols, values = _batch_triplets(local_rows, block[np.ix_(selected, commodity_take)], dtype)
+        ec_rows.append(rows)
+        ec_cols.append(cols)
+        ec_values.append(values)
 
-    ea = _coo_from_triplets(ea_rows, ea_cols, ea_values, shape=(len(row_map), len(activity_columns)), dtype=dtype)
-    ec = _coo_from_triplets(ec_rows, ec_cols, ec_values, shape=(len(row_map), len(commodity_columns)), dtype=dtype)
+    ea = _coo_from_triplets(ea_rows, ea_cols, ea_values, shape=(row_count, len(activity_columns)), dtype=dtype)
+    ec = _coo_from_triplets(ec_rows, ec_cols, ec_values, shape=(row_count, len(commodity_columns)), dtype=dtype)
     return ea, ec
 
 
@@ -967,8 +1045,10 @@ def _read_sparse_all_rows(
     path: Path,
     *,
     columns: np.ndarray,
-    row_map: dict[int, int],
+    row_map: np.ndarray,
+    row_count: int,
     dtype: np.dtype,
+    raw_rows: np.ndarray | None = None,
 ) -> sparse.csr_matrix:
     """Read all rows from one GLORIA file into a sparse block."""
     columns = np.sort(np.asarray(columns, dtype=np.int32))
@@ -977,25 +1057,28 @@ def _read_sparse_all_rows(
     values: list[np.ndarray] = []
     batch_size = _recommended_batch_size(len(columns), dtype)
 
-    for row_numbers, block in _iter_csv_batches(path, columns=columns, dtype=dtype, batch_size=batch_size):
-        for raw_row, raw_values in zip(row_numbers.tolist(), block):
-            raw_row = int(raw_row)
-            local_row = row_map.get(raw_row)
-            if local_row is None:
-                continue
-            nonzero = np.flatnonzero(raw_values)
-            if len(nonzero) == 0:
-                continue
-            rows.append(np.full(len(nonzero), local_row, dtype=np.int32))
-            cols.append(nonzero.astype(np.int32, copy=False))
-            values.append(raw_values[nonzero].astype(dtype, copy=False))
+    for row_numbers, block in _iter_csv_batches(
+        path,
+        columns=columns,
+        dtype=dtype,
+        batch_size=batch_size,
+        rows=raw_rows,
+    ):
+        local_rows = _lookup_rows(row_map, row_numbers)
+        selected = local_rows >= 0
+        if not selected.any():
+            continue
+        batch_rows, batch_cols, batch_values = _batch_triplets(local_rows[selected], block[selected], dtype)
+        rows.append(batch_rows)
+        cols.append(batch_cols)
+        values.append(batch_values)
 
-    return _coo_from_triplets(rows, cols, values, shape=(len(row_map), len(columns)), dtype=dtype)
+    return _coo_from_triplets(rows, cols, values, shape=(row_count, len(columns)), dtype=dtype)
 
 
 def _sparse_dataframe(matrix: sparse.csr_matrix, index, columns) -> pd.DataFrame:
     """Wrap a SciPy sparse matrix in a pandas sparse dataframe."""
-    return pd.DataFrame.sparse.from_spmatrix(matrix, index=index, columns=columns).fillna(0.0)
+    return sparse_frame_from_spmatrix(matrix, index=index, columns=columns)
 
 
 def _dense_frame(data: np.ndarray, index, columns) -> pd.DataFrame:
@@ -1030,6 +1113,33 @@ def _empty_satellite_payload(
     return satellite_axis, units, zero_ea, zero_ec, zero_ey
 
 
+def _gloria_workers(workers: int, task_count: int) -> int:
+    """Return the number of processes used to read independent GLORIA files."""
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise WrongInput(f"workers should be a positive integer, got {workers!r}.")
+    return min(workers, task_count)
+
+
+def _read_gloria_files(tasks: dict[str, tuple[object, dict]], *, workers: int) -> dict[str, object]:
+    """Run the independent per-file GLORIA readers, on a process pool when allowed.
+
+    Each reader parses one raw csv file (``T``, ``Y``, ``V``, ``TQ`` or
+    ``YQ``) and returns plain NumPy/SciPy blocks, so the files can be read
+    by separate processes without sharing state. Worker processes pickle
+    their blocks back to this process, which briefly holds each dense block
+    twice, so the pool is only used when ``workers`` asks for it.
+    """
+    workers = _gloria_workers(workers, len(tasks))
+    names = ", ".join(kwargs["path"].name for _, kwargs in tasks.values())
+    log_time(logger, f"Parser: reading GLORIA files {names} in CSV chunks with {workers} worker(s).", "info")
+    if workers == 1:
+        return {key: reader(**kwargs) for key, (reader, kwargs) in tasks.items()}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {key: executor.submit(reader, **kwargs) for key, (reader, kwargs) in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
 def parse_gloria_sut(
     path: str | Path,
     *,
@@ -1040,12 +1150,19 @@ def parse_gloria_sut(
     dtype: str | np.dtype = np.float32,
     layout: GloriaLayout | None = None,
     metadata: GloriaMetadata | None = None,
+    workers: int = 1,
 ) -> tuple[dict[str, dict[str, pd.DataFrame]], dict[str, dict[str, list[str]]], dict[str, pd.DataFrame], GloriaLayout]:
     """Parse one GLORIA SUT release into split-native MARIO blocks.
 
     The GLORIA backend streams the very wide raw csv files in chunks and
     constructs split-native MARIO blocks without materializing the full raw
-    matrices in memory.
+    matrices in memory. Each chunk is mapped to MARIO rows with array
+    lookups and one ``nonzero`` call. The independent raw files are read in
+    this process by default; ``workers`` (a positive integer) above one
+    reads them concurrently on that many processes, at the cost of copying
+    every dense block back through a pipe. Region and satellite subsets are pushed down to the csv
+    tokenizer, which skips the lines of unselected rows without converting
+    them and stops parsing after the last selected row.
     """
     if layout is None or metadata is None:
         layout, metadata = detect_gloria_layout(path, valuation=valuation, year=year)
@@ -1065,12 +1182,22 @@ def parse_gloria_sut(
     sector_count = len(metadata.sector_names)
     factor_count = len(metadata.factor_names)
     final_demand_count = len(metadata.final_demand_names)
-    satellite_row_map = {raw_row: local_row for local_row, raw_row in enumerate(satellite_positions)}
+    satellite_row_map = _positions_lookup(satellite_positions)
 
     activity_positions = _activity_positions(selected_positions, sector_count)
     commodity_positions = _commodity_positions(selected_positions, sector_count)
     final_demand_positions = _final_demand_positions(selected_positions, final_demand_count)
     activity_row_map, commodity_row_map = _row_maps(selected_positions, sector_count)
+    # Raw rows are region-major, so a region subset is a set of row ranges
+    # whose lines the readers skip without parsing.
+    region_subset = selected_codes != list(metadata.region_codes)
+    product_rows = _region_rows(selected_positions, sector_count * 2) if region_subset else None
+    factor_rows = _region_rows(selected_positions, factor_count) if region_subset else None
+    satellite_rows = (
+        np.unique(np.asarray(satellite_positions, dtype=np.int64))
+        if len(satellite_positions) != len(metadata.satellite_names)
+        else None
+    )
 
     activity_axis, commodity_axis, final_demand_axis, factor_axis, satellite_axis = _build_axes(
         selected_codes,
@@ -1090,66 +1217,85 @@ def parse_gloria_sut(
             "warning",
         )
 
-    log_time(logger, f"Parser: reading GLORIA transactions from {layout.T_path.name} in CSV chunks.", "info")
-    S_matrix, U_data = _read_transaction_blocks(
-        layout.T_path,
-        activity_columns=activity_positions,
-        commodity_columns=commodity_positions,
-        activity_row_map=activity_row_map,
-        commodity_row_map=commodity_row_map,
-        s_shape=(len(activity_axis), len(commodity_axis)),
-        u_shape=(len(commodity_axis), len(activity_axis)),
-        dtype=dtype,
-    )
-
-    log_time(logger, f"Parser: reading GLORIA final demand from {layout.Y_path.name} in CSV chunks.", "info")
-    Ya_matrix, Yc_data = _read_final_demand_blocks(
-        layout.Y_path,
-        final_demand_columns=final_demand_positions,
-        activity_row_map=activity_row_map,
-        commodity_row_map=commodity_row_map,
-        ya_shape=(len(activity_axis), len(final_demand_axis)),
-        yc_shape=(len(commodity_axis), len(final_demand_axis)),
-        dtype=dtype,
-    )
-
-    log_time(logger, f"Parser: reading GLORIA value added from {layout.V_path.name} in CSV chunks.", "info")
-    Va_data, Vc_matrix = _read_value_added_blocks(
-        layout.V_path,
-        activity_columns=activity_positions,
-        commodity_columns=commodity_positions,
-        factor_count=factor_count,
-        selected_positions=selected_positions,
-        va_shape=(len(factor_axis), len(activity_axis)),
-        vc_shape=(len(factor_axis), len(commodity_axis)),
-        dtype=dtype,
-    )
-
-    if layout.TQ_path is not None and layout.YQ_path is not None:
-        log_time(
-            logger,
-            (
-                "Parser: reading GLORIA satellite accounts from "
-                f"{layout.TQ_path.name} and {layout.YQ_path.name} in CSV chunks."
-            ),
-            "info",
-        )
-        Ea_matrix, Ec_matrix = _read_satellite_transaction_blocks(
-            layout.TQ_path,
-            activity_columns=activity_positions,
-            commodity_columns=commodity_positions,
-            row_map=satellite_row_map,
-            dtype=dtype,
+    tasks = {
+        "T": (
+            _read_transaction_blocks,
+            {
+                "path": layout.T_path,
+                "activity_columns": activity_positions,
+                "commodity_columns": commodity_positions,
+                "activity_row_map": activity_row_map,
+                "commodity_row_map": commodity_row_map,
+                "s_shape": (len(activity_axis), len(commodity_axis)),
+                "u_shape": (len(commodity_axis), len(activity_axis)),
+                "dtype": dtype,
+                "raw_rows": product_rows,
+            },
+        ),
+        "Y": (
+            _read_final_demand_blocks,
+            {
+                "path": layout.Y_path,
+                "final_demand_columns": final_demand_positions,
+                "activity_row_map": activity_row_map,
+                "commodity_row_map": commodity_row_map,
+                "ya_shape": (len(activity_axis), len(final_demand_axis)),
+                "yc_shape": (len(commodity_axis), len(final_demand_axis)),
+                "dtype": dtype,
+                "raw_rows": product_rows,
+            },
+        ),
+        "V": (
+            _read_value_added_blocks,
+            {
+                "path": layout.V_path,
+                "activity_columns": activity_positions,
+                "commodity_columns": commodity_positions,
+                "factor_count": factor_count,
+                "selected_positions": selected_positions,
+                "va_shape": (len(factor_axis), len(activity_axis)),
+                "vc_shape": (len(factor_axis), len(commodity_axis)),
+                "dtype": dtype,
+                "raw_rows": factor_rows,
+            },
+        ),
+    }
+    has_satellites = layout.TQ_path is not None and layout.YQ_path is not None
+    if has_satellites:
+        tasks["TQ"] = (
+            _read_satellite_transaction_blocks,
+            {
+                "path": layout.TQ_path,
+                "activity_columns": activity_positions,
+                "commodity_columns": commodity_positions,
+                "row_map": satellite_row_map,
+                "row_count": len(satellite_positions),
+                "dtype": dtype,
+                "raw_rows": satellite_rows,
+            },
         )
-        EY_matrix = _read_sparse_all_rows(
-            layout.YQ_path,
-            columns=final_demand_positions,
-            row_map=satellite_row_map,
-            dtype=dtype,
+        tasks["YQ"] = (
+            _read_sparse_all_rows,
+            {
+                "path": layout.YQ_path,
+                "columns": final_demand_positions,
+                "row_map": satellite_row_map,
+                "row_count": len(satellite_positions),
+                "dtype": dtype,
+                "raw_rows": satellite_rows,
+            },
         )
+
+    results = _read_gloria_files(tasks, workers=workers)
+    S_matrix, U_data = results["T"]
+    Ya_matrix, Yc_data = results["Y"]
+    Va_data, Vc_matrix = results["V"]
+
+    if has_satellites:
+        Ea_matrix, Ec_matrix = results["TQ"]
         Ea = _sparse_dataframe(Ea_matrix, satellite_axis, activity_axis)
         Ec = _sparse_dataframe(Ec_matrix, satellite_axis, commodity_axis)
-        EY = _sparse_dataframe(EY_matrix, satellite_axis, final_demand_axis)
+        EY = _sparse_dataframe(results["YQ"], satellite_axis, final_demand_axis)
     else:
         if layout.satellite_root is None:
             log_time(logger, "Parser: no GLORIA satellite-account directory found; using empty extensions.", "info")
@@ -36,6 +36,7 @@ from mario.parsers.txt import (
     parse_flat_frames,
 )
 from mario.storage.base import BlockRepository
+from mario.storage.sparse_parquet import read_parquet_block
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,7 @@ def matrix_parquet_parser(path: str, table: str, mode: str):
                         continue
                     raise FileNotFoundError(target)
                 matrices[matrix_name], current_fd_axis_names = _normalize_sut_native_matrix(
-                    pd.read_parquet(target),
+                    read_parquet_block(target),
                     matrix_name,
                     {},
                 )
@@ -130,7 +131,7 @@ def matrix_parquet_parser(path: str, table: str, mode: str):
             if matrix_name not in required:
                 continue
             raise FileNotFoundError(target)
-        matrices[matrix_name] = pd.read_parquet(target)
+        matrices[matrix_name] = read_parquet_block(target)
 
     units_path = root / "units.parquet"
     if not units_path.exists():
@@ -172,7 +173,7 @@ def matrix_parquet_parser_with_layouts(
                         continue
                     raise FileNotFoundError(target)
                 matrices[matrix_name], current_fd_axis_names = _normalize_sut_native_matrix(
-                    pd.read_parquet(target),
+                    read_parquet_block(target),
                     matrix_name,
                     matrix_layouts,
                 )
@@ -228,7 +229,7 @@ def matrix_parquet_parser_with_layouts(
             raise FileNotFoundError(target)
         normalizer = _normalize_iot_matrix if table == "IOT" else _normalize_sut_matrix
         matrices[matrix_name], current_fd_axis_names = normalizer(
-            pd.read_parquet(target),
+            read_parquet_block(target),
             matrix_name,
             matrix_layouts,
         )
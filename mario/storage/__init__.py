@@ -1,11 +1,15 @@
 """Storage layer for the parallel MARIO 2 core."""
 
 from mario.storage.base import BlockRepository
+from mario.storage.duckdb import DuckDBBlockRepository
+from mario.storage.memmap import MemmapBlockRepository
 from mario.storage.parquet import ParquetBlockRepository
 from mario.storage.repository import InMemoryBlockRepository
 
 __all__ = [
     "BlockRepository",
+    "DuckDBBlockRepository",
     "InMemoryBlockRepository",
+    "MemmapBlockRepository",
     "ParquetBlockRepository",
 ]
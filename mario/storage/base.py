@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class BlockRepository(ABC):
     """Minimal repository interface used by the internal block-state model."""
@@ -27,3 +29,30 @@ class BlockRepository(ABC):
     def list_keys(self) -> tuple[str, ...]:
         """List all stored keys visible through the repository."""
         raise NotImplementedError
+
+
+# Column naming of the long cell frames returned by repositories that support
+# query pushdown (``query_cells``): one ``row:<level>`` column per kept row
+# level, one ``col:<level>`` column per kept column level, plus ``Scenario``
+# and ``value``.
+ROW_LEVEL_PREFIX = "row:"
+COLUMN_LEVEL_PREFIX = "col:"
+
+
+def axis_level_names(axis) -> list[str]:
+    """Return the level names of one axis, naming anonymous levels by position."""
+    return [str(name) if name is not None else f"level_{position}" for position, name in enumerate(axis.names)]
+
+
+def axis_mask(axis, filters: dict[str, object]) -> np.ndarray:
+    """Return the boolean positions of ``axis`` selected by ``level -> label(s)`` filters."""
+    names = axis_level_names(axis)
+    mask = np.ones(len(axis), dtype=bool)
+    for level, value in filters.items():
+        if str(level) not in names:
+            raise KeyError(f"{level!r} is not a level of the queried axis; levels are {names}.")
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = [value]
+        labels = axis.get_level_values(names.index(str(level))).astype(str)
+        mask &= labels.isin([str(item) for item in value])
+    return mask
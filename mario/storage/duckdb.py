@@ -1,7 +1,58 @@
-"""Optional DuckDB helpers for the future storage/query layer."""
+"""DuckDB-backed block repository with filter and aggregation pushdown."""
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.helpers import _is_sparse_backed_dataframe, sparse_frame_from_spmatrix
+from mario.storage.base import COLUMN_LEVEL_PREFIX, ROW_LEVEL_PREFIX, BlockRepository, axis_level_names
+from mario.storage.memmap import _axis_digest
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS axes (
+        axis_id VARCHAR PRIMARY KEY,
+        length BIGINT,
+        payload BLOB
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS axis_labels (
+        axis_id VARCHAR,
+        level_position INTEGER,
+        level_name VARCHAR,
+        position BIGINT,
+        label VARCHAR
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS blocks (
+        key VARCHAR PRIMARY KEY,
+        kind VARCHAR,
+        layout VARCHAR,
+        name VARCHAR,
+        n_rows BIGINT,
+        n_cols BIGINT,
+        row_axis VARCHAR,
+        col_axis VARCHAR
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cells (
+        key VARCHAR,
+        "row" BIGINT,
+        "col" BIGINT,
+        value DOUBLE
+    )
+    """,
+)
+
 
 def require_duckdb():
     """Import and return ``duckdb`` or raise a focused missing-dependency error."""
@@ -13,3 +64,297 @@ def require_duckdb():
         ) from exc
 
     return duckdb
+
+
+def _labels(value) -> list[str]:
+    """Normalize one filter value to the list of string labels it selects."""
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        value = [value]
+    return [str(item) for item in value]
+
+
+def _quote(identifier: str) -> str:
+    """Quote one SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class DuckDBBlockRepository(BlockRepository):
+    """Persist blocks in DuckDB as long ``(row, col, value)`` cells.
+
+    Only non-zero cells are stored. Axes are dictionary-encoded once: the
+    ``axis_labels`` table maps ``(axis_id, level, position)`` to a label and
+    the exact pandas axis is kept next to it for lossless reads. Values are
+    stored as ``DOUBLE``. Besides the :class:`BlockRepository` interface,
+    :meth:`query_cells` filters and aggregates stored blocks inside DuckDB, so
+    slices of many scenarios never materialize as full pandas frames.
+    """
+
+    def __init__(self, database: str | Path = ":memory:") -> None:
+        """Open (or create) a DuckDB database file, in memory by default."""
+        duckdb = require_duckdb()
+        self.database = str(database)
+        self.connection = duckdb.connect(self.database)
+        self._lock = threading.RLock()
+        self._axes: dict[str, pd.Index] = {}
+        with self._lock:
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+
+    def _execute(self, query: str, parameters=None):
+        """Run one statement on the shared connection."""
+        return self.connection.execute(query, parameters or [])
+
+    def _put_axis(self, axis: pd.Index) -> str:
+        """Store one axis and its label dictionary unless already present."""
+        axis_id = _axis_digest(axis)
+        if self._execute("SELECT 1 FROM axes WHERE axis_id = ?", [axis_id]).fetchone() is not None:
+            return axis_id
+
+        self._execute(
+            "INSERT INTO axes VALUES (?, ?, ?)",
+            [axis_id, len(axis), pickle.dumps(axis, protocol=pickle.HIGHEST_PROTOCOL)],
+        )
+        positions = np.arange(len(axis), dtype=np.int64)
+        labels = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "axis_id": axis_id,
+                        "level_position": level_position,
+                        "level_name": level_name,
+                        "position": positions,
+                        "label": axis.get_level_values(level_position).astype(str).to_numpy(dtype=object),
+                    }
+                )
+                for level_position, level_name in enumerate(axis_level_names(axis))
+            ],
+            ignore_index=True,
+        )
+        self.connection.register("_incoming_labels", labels)
+        try:
+            self._execute(
+                "INSERT INTO axis_labels SELECT axis_id, level_position, level_name, position, label FROM _incoming_labels"
+            )
+        finally:
+            self.connection.unregister("_incoming_labels")
+        self._axes[axis_id] = axis
+        return axis_id
+
+    def _get_axis(self, axis_id: str) -> pd.Index:
+        """Load one stored axis, reusing axes already opened by this repository."""
+        axis = self._axes.get(axis_id)
+        if axis is None:
+            payload = self._execute("SELECT payload FROM axes WHERE axis_id = ?", [axis_id]).fetchone()[0]
+            axis = pickle.loads(payload)
+            self._axes[axis_id] = axis
+        return axis
+
+    def has(self, key: str) -> bool:
+        """Return whether a block is stored for the key."""
+        with self._lock:
+            return self._execute("SELECT 1 FROM blocks WHERE key = ?", [key]).fetchone() is not None
+
+    def get(self, key: str):
+        """Rebuild one block as a pandas object from its stored cells."""
+        with self._lock:
+            record = self._execute(
+                "SELECT kind, layout, name, n_rows, n_cols, row_axis, col_axis FROM blocks WHERE key = ?",
+                [key],
+            ).fetchone()
+            if record is None:
+                raise KeyError(key)
+            kind, layout, name, n_rows, n_cols, row_axis, col_axis = record
+            cells = self._execute('SELECT "row", "col", value FROM cells WHERE key = ?', [key]).fetchnumpy()
+            index = self._get_axis(row_axis)
+            columns = self._get_axis(col_axis) if col_axis is not None else None
+
+        rows = np.asarray(cells["row"], dtype=np.int64)
+        cols = np.asarray(cells["col"], dtype=np.int64)
+        values = np.asarray(cells["value"], dtype=float)
+
+        if kind == "series":
+            data = np.zeros(n_rows, dtype=float)
+            data[rows] = values
+            return pd.Series(data, index=index, name=json.loads(name))
+
+        if layout == "sparse":
+            from scipy import sparse
+
+            matrix = sparse.coo_matrix((values, (rows, cols)), shape=(n_rows, n_cols))
+            return sparse_frame_from_spmatrix(matrix.tocsc(), index=index, columns=columns)
+
+        data = np.zeros((n_rows, n_cols), dtype=float)
+        data[rows, cols] = values
+        return pd.DataFrame(data, index=index, columns=columns, copy=False)
+
+    def put(self, key: str, value) -> None:
+        """Persist one dataframe or series block as non-zero long cells."""
+        if isinstance(value, pd.Series):
+            data = value.to_numpy(dtype=float)
+            (rows,) = np.nonzero(data)
+            cols = np.zeros_like(rows)
+            values = data[rows]
+            kind, layout, columns = "series", "dense", None
+        elif isinstance(value, pd.DataFrame):
+            if _is_sparse_backed_dataframe(value):
+                matrix = value.sparse.to_coo()
+                matrix.sum_duplicates()
+                keep = matrix.data != 0
+                rows, cols, values = matrix.row[keep], matrix.col[keep], matrix.data[keep]
+                layout = "sparse"
+            else:
+                data = value.to_numpy(dtype=float)
+                rows, cols = np.nonzero(data)
+                values = data[rows, cols]
+                layout = "dense"
+            kind, columns = "dataframe", value.columns
+        else:
+            raise TypeError("DuckDBBlockRepository supports only pandas DataFrame or Series values.")
+
+        incoming = pd.DataFrame(
+            {
+                "row": np.asarray(rows, dtype=np.int64),
+                "col": np.asarray(cols, dtype=np.int64),
+                "value": np.asarray(values, dtype=float),
+            }
+        )
+        with self._lock:
+            self._execute("BEGIN TRANSACTION")
+            try:
+                row_axis = self._put_axis(value.index)
+                col_axis = self._put_axis(columns) if columns is not None else None
+                self._execute("DELETE FROM cells WHERE key = ?", [key])
+                self._execute("DELETE FROM blocks WHERE key = ?", [key])
+                self._execute(
+                    "INSERT INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        key,
+                        kind,
+                        layout,
+                        json.dumps(value.name) if kind == "series" else None,
+                        value.shape[0],
+                        value.shape[1] if kind == "dataframe" else 1,
+                        row_axis,
+                        col_axis,
+                    ],
+                )
+                self.connection.register("_incoming_cells", incoming)
+                try:
+                    self._execute('INSERT INTO cells SELECT ?, "row", "col", value FROM _incoming_cells', [key])
+                finally:
+                    self.connection.unregister("_incoming_cells")
+            except Exception:
+                self._execute("ROLLBACK")
+                raise
+            self._execute("COMMIT")
+
+    def list_keys(self) -> tuple[str, ...]:
+        """List all stored block keys."""
+        with self._lock:
+            return tuple(row[0] for row in self._execute("SELECT key FROM blocks ORDER BY key").fetchall())
+
+    def level_names(self, key: str) -> tuple[list[str], list[str]]:
+        """Return the row and column level names of one stored block."""
+        with self._lock:
+            record = self._execute("SELECT row_axis, col_axis FROM blocks WHERE key = ?", [key]).fetchone()
+            if record is None:
+                raise KeyError(key)
+            row_axis, col_axis = record
+            rows = axis_level_names(self._get_axis(row_axis))
+            columns = axis_level_names(self._get_axis(col_axis)) if col_axis is not None else []
+        return rows, columns
+
+    def _check_levels(self, key: str, rows: dict, columns: dict, group_rows: list, group_columns: list) -> None:
+        """Raise ``KeyError`` for filter or group levels missing from one block, as ``frame_cells`` does."""
+        row_levels, column_levels = self.level_names(key)
+        if not column_levels and (columns or group_columns):
+            raise KeyError("Series blocks have no column levels to filter or group.")
+        for names, levels in ((row_levels, [*rows, *group_rows]), (column_levels, [*columns, *group_columns])):
+            for level in levels:
+                if str(level) not in names:
+                    raise KeyError(f"{level!r} is not a level of the queried axis; levels are {names}.")
+
+    def query_cells(
+        self,
+        targets: list[tuple[str, str]],
+        *,
+        rows: dict[str, object] | None = None,
+        columns: dict[str, object] | None = None,
+        group_rows=None,
+        group_columns=None,
+    ) -> pd.DataFrame:
+        """Filter and aggregate stored blocks inside DuckDB.
+
+        Parameters
+        ----------
+        targets:
+            ``(storage key, scenario)`` pairs of the blocks to query. One key
+            may be listed for several scenarios that inherit it.
+        rows, columns:
+            Optional ``level name -> label(s)`` filters on each axis. Labels
+            are compared as strings.
+        group_rows, group_columns:
+            Levels kept on each axis; the others are summed. ``None`` keeps
+            every level of the first queried block.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Long frame with ``Scenario``, one ``row:<level>`` and
+            ``col:<level>`` column per kept level, and the summed ``value``.
+            Only non-zero cells contribute, so all-zero groups are absent.
+        """
+        rows = dict(rows or {})
+        columns = dict(columns or {})
+        if not targets:
+            raise KeyError("No blocks to query.")
+        if group_rows is None or group_columns is None:
+            row_levels, column_levels = self.level_names(targets[0][0])
+            group_rows = row_levels if group_rows is None else group_rows
+            group_columns = column_levels if group_columns is None else group_columns
+        group_rows = list(group_rows)
+        group_columns = list(group_columns)
+        for key in dict.fromkeys(key for key, _ in targets):
+            self._check_levels(key, rows, columns, group_rows, group_columns)
+
+        joins = []
+        selected = []
+        conditions = []
+        join_parameters: list[object] = []
+        condition_parameters: list[object] = []
+        for axis, column, levels, filters, prefix in (
+            ("row_axis", "row", group_rows, rows, ROW_LEVEL_PREFIX),
+            ("col_axis", "col", group_columns, columns, COLUMN_LEVEL_PREFIX),
+        ):
+            for level in dict.fromkeys([*levels, *filters]):
+                alias = f"{column[0]}{len(joins)}"
+                joins.append(
+                    f"JOIN axis_labels {alias} ON {alias}.axis_id = b.{axis} "
+                    f'AND {alias}.position = c."{column}" AND {alias}.level_name = ?'
+                )
+                join_parameters.append(str(level))
+                if level in levels:
+                    selected.append((f"{alias}.label", prefix + str(level)))
+                if level in filters:
+                    labels = _labels(filters[level])
+                    conditions.append(f"{alias}.label IN ({', '.join('?' for _ in labels)})")
+                    condition_parameters.extend(labels)
+
+        target_frame = pd.DataFrame(
+            {"key": [key for key, _ in targets], "Scenario": [str(scenario) for _, scenario in targets]}
+        )
+        projection = ", ".join(["t.Scenario", *(f"{expression} AS {_quote(name)}" for expression, name in selected)])
+        grouping = ", ".join(["t.Scenario", *(expression for expression, _ in selected)])
+        query = (
+            f"SELECT {projection}, SUM(c.value) AS value "
+            "FROM cells c JOIN _query_targets t ON t.key = c.key JOIN blocks b ON b.key = c.key "
+            + " ".join(joins)
+            + (" WHERE " + " AND ".join(conditions) if conditions else "")
+            + f" GROUP BY {grouping} ORDER BY {grouping}"
+        )
+        with self._lock:
+            self.connection.register("_query_targets", target_frame)
+            try:
+                return self._execute(query, join_parameters + condition_parameters).df()
+            finally:
+                self.connection.unregister("_query_targets")
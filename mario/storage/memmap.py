@@ -0,0 +1,173 @@
+"""Memory-mapped binary repository for pandas blocks."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.helpers import _is_sparse_backed_dataframe, sparse_frame_from_spmatrix
+from mario.storage.base import BlockRepository
+
+_BLOCK_FILE = "block.json"
+_AXES_DIRECTORY = "_axes"
+_CSR_COMPONENTS = ("data", "indices", "indptr")
+
+
+def _axis_digest(axis: pd.Index) -> str:
+    """Return a digest of the labels, names and dtypes of one axis.
+
+    Equal axes get the same digest even when their pickled forms differ
+    (for example because of cached engine state), so they are stored once.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(type(axis).__name__.encode())
+    digest.update(repr((list(axis.names), [str(dtype) for dtype in _axis_dtypes(axis)])).encode())
+    digest.update(pd.util.hash_pandas_object(axis, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _axis_dtypes(axis: pd.Index) -> list:
+    """Return the dtype of every level of one axis."""
+    if isinstance(axis, pd.MultiIndex):
+        return list(axis.dtypes)
+    return [axis.dtype]
+
+
+def _save_array(path: Path, values: np.ndarray) -> None:
+    """Write one ``.npy`` array atomically, so open memory maps stay valid."""
+    temporary = path.with_name(f".{path.name}.tmp")
+    with open(temporary, "wb") as handle:
+        np.save(handle, values, allow_pickle=False)
+    os.replace(temporary, path)
+
+
+class MemmapBlockRepository(BlockRepository):
+    """Persist blocks as raw ``.npy`` arrays opened lazily with ``np.memmap``.
+
+    Dense blocks are stored as one C-ordered array and come back as frames
+    backed by a copy-on-write memory map, so opening a block only reads its
+    header and pages are loaded when touched. Sparse-backed frames are stored
+    as CSR ``data``/``indices``/``indptr`` arrays; those are memory-mapped on
+    read too, but pandas sparse columns cannot wrap them, so :meth:`get`
+    copies every stored value into the returned frame and sparse blocks only
+    save parsing time, not memory. Axes are stored once per
+    scenario (the first segment of the storage key) under a content digest,
+    so blocks sharing labels share one axis file.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize a memory-mapped repository rooted on disk."""
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._axes: dict[Path, pd.Index] = {}
+        self._lock = threading.Lock()
+
+    def _block_path(self, key: str) -> Path:
+        """Map a storage key to the directory holding its arrays."""
+        return self.root.joinpath(*key.split("/"))
+
+    def _axes_path(self, key: str) -> Path:
+        """Return the axis directory shared by every block of the key's scenario."""
+        scenario = key.split("/")[0] if "/" in key else ""
+        return self.root / scenario / _AXES_DIRECTORY if scenario else self.root / _AXES_DIRECTORY
+
+    def _put_axis(self, key: str, axis: pd.Index) -> str:
+        """Store one axis unless the scenario already holds it; return its digest."""
+        digest = _axis_digest(axis)
+        path = self._axes_path(key) / f"{digest}.pkl"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f".{path.name}.tmp")
+            temporary.write_bytes(pickle.dumps(axis, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(temporary, path)
+        return digest
+
+    def _get_axis(self, key: str, digest: str) -> pd.Index:
+        """Load one stored axis, reusing axes already opened by this repository."""
+        path = self._axes_path(key) / f"{digest}.pkl"
+        with self._lock:
+            axis = self._axes.get(path)
+        if axis is None:
+            axis = pickle.loads(path.read_bytes())
+            with self._lock:
+                self._axes[path] = axis
+        return axis
+
+    def has(self, key: str) -> bool:
+        """Return whether a block is stored for the key."""
+        return (self._block_path(key) / _BLOCK_FILE).exists()
+
+    def get(self, key: str):
+        """Open one block as a pandas object backed by memory-mapped arrays.
+
+        Dense blocks and series stay backed by the map; sparse blocks are
+        copied into pandas sparse columns.
+        """
+        path = self._block_path(key)
+        meta_path = path / _BLOCK_FILE
+        if not meta_path.exists():
+            raise KeyError(key)
+
+        metadata = json.loads(meta_path.read_text())
+        index = self._get_axis(key, metadata["index"])
+
+        if metadata["kind"] == "series":
+            values = np.load(path / "values.npy", mmap_mode="c")
+            return pd.Series(values, index=index, name=metadata.get("name"), copy=False)
+
+        columns = self._get_axis(key, metadata["columns"])
+        if metadata["layout"] == "csr":
+            from scipy import sparse
+
+            data, indices, indptr = (np.load(path / f"{name}.npy", mmap_mode="r") for name in _CSR_COMPONENTS)
+            matrix = sparse.csr_matrix((data, indices, indptr), shape=tuple(metadata["shape"]))
+            return sparse_frame_from_spmatrix(matrix, index=index, columns=columns)
+
+        values = np.load(path / "values.npy", mmap_mode="c")
+        return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+    def put(self, key: str, value) -> None:
+        """Persist one dataframe or series block as binary arrays."""
+        if isinstance(value, pd.Series):
+            arrays = {"values": np.ascontiguousarray(value.to_numpy())}
+            metadata = {"kind": "series", "name": value.name, "layout": "dense"}
+            axes = {"index": value.index}
+        elif isinstance(value, pd.DataFrame):
+            if _is_sparse_backed_dataframe(value):
+                matrix = value.sparse.to_coo().tocsr()
+                matrix.sum_duplicates()
+                arrays = {name: getattr(matrix, name) for name in _CSR_COMPONENTS}
+                layout = "csr"
+            else:
+                arrays = {"values": np.ascontiguousarray(value.to_numpy())}
+                layout = "dense"
+            metadata = {"kind": "dataframe", "layout": layout, "shape": list(value.shape)}
+            axes = {"index": value.index, "columns": value.columns}
+        else:
+            raise TypeError("MemmapBlockRepository supports only pandas DataFrame or Series values.")
+
+        if any(array.dtype == object for array in arrays.values()):
+            raise TypeError("MemmapBlockRepository supports only numeric blocks.")
+
+        path = self._block_path(key)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, axis in axes.items():
+            metadata[name] = self._put_axis(key, axis)
+        stale = {"values", *_CSR_COMPONENTS}.difference(arrays)
+        for name, array in arrays.items():
+            _save_array(path / f"{name}.npy", array)
+        for name in stale:
+            (path / f"{name}.npy").unlink(missing_ok=True)
+        (path / _BLOCK_FILE).write_text(json.dumps(metadata))
+
+    def list_keys(self) -> tuple[str, ...]:
+        """List all stored block keys."""
+        keys = [path.parent.relative_to(self.root).as_posix() for path in self.root.rglob(_BLOCK_FILE)]
+        return tuple(sorted(keys))
@@ -8,11 +8,23 @@ from pathlib import Path
 import pandas as pd
 
 from mario._optional import require_pyarrow
-from mario.storage.base import BlockRepository
+from mario.storage.base import BlockRepository, axis_mask
+from mario.storage.sparse_parquet import (
+    is_coo_axes_path,
+    is_coo_frame,
+    read_coo_parquet,
+    remove_coo_axes,
+    write_coo_parquet,
+)
 
 
 class ParquetBlockRepository(BlockRepository):
-    """Persist DataFrame or Series blocks on disk using Parquet files."""
+    """Persist DataFrame or Series blocks on disk using Parquet files.
+
+    Sparse-backed dataframes are written in the sparse COO layout of
+    :mod:`mario.storage.sparse_parquet` and come back sparse; other blocks
+    are written as regular Parquet tables.
+    """
 
     def __init__(self, root: str | Path) -> None:
         """Initialize a parquet-backed repository rooted on disk."""
@@ -42,9 +54,12 @@ class ParquetBlockRepository(BlockRepository):
         if not data_path.exists():
             raise KeyError(key)
 
-        frame = pd.read_parquet(data_path)
         metadata = json.loads(meta_path.read_text()) if meta_path.exists() else {"kind": "dataframe"}
 
+        if metadata.get("layout") == "coo":
+            return read_coo_parquet(data_path)
+
+        frame = pd.read_parquet(data_path)
         if metadata["kind"] == "series":
             series = frame.iloc[:, 0]
             series.name = metadata.get("name")
@@ -68,13 +83,46 @@ class ParquetBlockRepository(BlockRepository):
         else:
             raise TypeError("ParquetBlockRepository supports only pandas DataFrame or Series values.")
 
-        frame.to_parquet(data_path)
+        if is_coo_frame(frame):
+            metadata["layout"] = "coo"
+            write_coo_parquet(frame, data_path)
+        else:
+            remove_coo_axes(data_path)
+            frame.to_parquet(data_path)
         meta_path.write_text(json.dumps(metadata))
 
+    def select(
+        self,
+        key: str,
+        *,
+        rows: dict[str, object] | None = None,
+        columns: dict[str, object] | None = None,
+    ) -> pd.DataFrame:
+        """Load the cells of one dataframe block matching ``level -> label(s)`` filters.
+
+        Sparse blocks push the filters to the Parquet reader, so row groups
+        outside the selection are skipped; other blocks are filtered after
+        loading.
+        """
+        require_pyarrow(feature="Parquet block storage")
+        meta_path = self._meta_path(key)
+        metadata = json.loads(meta_path.read_text()) if meta_path.exists() else {"kind": "dataframe"}
+        if metadata.get("layout") == "coo":
+            if not self._data_path(key).exists():
+                raise KeyError(key)
+            return read_coo_parquet(self._data_path(key), rows=rows, columns=columns)
+
+        frame = self.get(key)
+        if metadata["kind"] == "series":
+            raise TypeError(f"{key!r} holds a series block; select() filters dataframe blocks.")
+        return frame.loc[axis_mask(frame.index, dict(rows or {})), axis_mask(frame.columns, dict(columns or {}))]
+
     def list_keys(self) -> tuple[str, ...]:
         """List all stored parquet-backed keys."""
         keys = []
         for path in self.root.rglob("*.parquet"):
+            if is_coo_axes_path(path.relative_to(self.root)):
+                continue
             relative = path.relative_to(self.root).with_suffix("")
             keys.append(relative.as_posix())
         return tuple(sorted(keys))
@@ -0,0 +1,247 @@
+"""Sparse-native Parquet layout for pandas sparse blocks.
+
+A sparse block is written as COO triplets ``(row, col, value)`` holding
+only the stored non-zero cells, with integer axis codes. The labels of the
+two axes are written once as separate dictionary files next to the
+triplets (``<name>.axes/index.parquet`` and ``<name>.axes/columns.parquet``),
+so the payload never holds repeated labels and is never densified.
+
+Triplets are written in row-major order, so the min/max statistics of each
+row group cover a disjoint range of row codes and filtered reads skip the
+row groups that cannot match.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from mario.compute.helpers import _is_sparse_backed_dataframe, sparse_frame_from_spmatrix
+from mario.storage.base import axis_level_names, axis_mask
+
+# Key of the schema metadata entry marking (and describing) COO payloads.
+COO_METADATA_KEY = b"mario.coo"
+COO_ROW_GROUP_SIZE = 1 << 20
+_AXES_SUFFIX = ".axes"
+
+
+def coo_axes_path(path: str | Path) -> Path:
+    """Return the directory holding the axis dictionaries of one COO payload."""
+    path = Path(path)
+    return path.with_name(path.stem + _AXES_SUFFIX)
+
+
+def is_coo_axes_path(path: str | Path) -> bool:
+    """Return whether ``path`` lives inside the axis dictionaries of a COO payload."""
+    return any(part.endswith(_AXES_SUFFIX) for part in Path(path).parent.parts)
+
+
+def _coo_metadata(path: str | Path) -> dict | None:
+    """Return the COO description of one parquet file, or ``None`` for other layouts."""
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(path).metadata or {}
+    payload = metadata.get(COO_METADATA_KEY)
+    return None if payload is None else json.loads(payload)
+
+
+def is_coo_parquet(path: str | Path) -> bool:
+    """Return whether one parquet file holds a sparse COO block."""
+    return _coo_metadata(path) is not None
+
+
+def is_coo_frame(frame) -> bool:
+    """Return whether a block can be written as COO: every column sparse with zero fill."""
+    return _is_sparse_backed_dataframe(frame) and all(dtype.fill_value == 0 for dtype in frame.dtypes)
+
+
+def _write_axis(axis: pd.Index, path: Path) -> None:
+    """Write one axis dictionary: one column per level, one row per code."""
+    frame = axis.to_frame(index=False)
+    frame.columns = axis_level_names(axis)
+    frame.to_parquet(path, index=False)
+
+
+def _read_axis(path: Path, names: list) -> pd.Index:
+    """Read one axis dictionary written by :func:`_write_axis`."""
+    frame = pd.read_parquet(path)
+    if len(names) == 1:
+        return pd.Index(frame.iloc[:, 0], name=names[0])
+    return pd.MultiIndex.from_frame(frame, names=names)
+
+
+class CooParquetWriter:
+    """Stream one sparse block to the COO layout, a few rows at a time.
+
+    The axis dictionaries are written up front, so callers only hand over
+    the stored cells of consecutive row ranges and the whole block never
+    has to be held in memory. Chunks should arrive in increasing row order
+    to keep row groups disjoint on row codes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        index: pd.Index,
+        columns: pd.Index,
+        row_group_size: int = COO_ROW_GROUP_SIZE,
+    ) -> None:
+        """Write the axis dictionaries and open the triplet writer."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.path = Path(path)
+        self.shape = (len(index), len(columns))
+        self.row_group_size = row_group_size
+
+        axes = coo_axes_path(self.path)
+        axes.mkdir(parents=True, exist_ok=True)
+        _write_axis(index, axes / "index.parquet")
+        _write_axis(columns, axes / "columns.parquet")
+
+        code_type = pa.int32() if max(self.shape) < np.iinfo(np.int32).max else pa.int64()
+        description = {
+            "shape": list(self.shape),
+            "index_names": list(index.names),
+            "columns_names": list(columns.names),
+        }
+        self.schema = pa.schema(
+            [("row", code_type), ("col", code_type), ("value", pa.float64())],
+            metadata={COO_METADATA_KEY: json.dumps(description).encode()},
+        )
+        self._writer = pq.ParquetWriter(self.path, self.schema, write_statistics=True)
+
+    def write(self, matrix, *, row_offset: int = 0) -> None:
+        """Append the stored non-zero cells of one SciPy matrix starting at ``row_offset``."""
+        import pyarrow as pa
+
+        matrix = matrix.tocsr()
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+        matrix = matrix.tocoo()
+        table = pa.table(
+            {
+                "row": pa.array(matrix.row.astype(np.int64) + row_offset, type=self.schema.field("row").type),
+                "col": pa.array(matrix.col, type=self.schema.field("col").type),
+                "value": pa.array(matrix.data.astype(float, copy=False), type=pa.float64()),
+            },
+            schema=self.schema,
+        )
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self) -> None:
+        """Finalize the parquet footer."""
+        self._writer.close()
+
+
+def write_coo_parquet(
+    frame: pd.DataFrame,
+    path: str | Path,
+    *,
+    row_group_size: int = COO_ROW_GROUP_SIZE,
+) -> None:
+    """Write one sparse-backed dataframe as COO triplets plus axis dictionaries.
+
+    Parameters
+    ----------
+    frame:
+        Dataframe whose columns all use a pandas sparse dtype with zero fill.
+    path:
+        Target ``.parquet`` file of the triplets.
+    row_group_size:
+        Maximum number of triplets per Parquet row group.
+    """
+    writer = CooParquetWriter(path, index=frame.index, columns=frame.columns, row_group_size=row_group_size)
+    try:
+        writer.write(frame.sparse.to_coo())
+    finally:
+        writer.close()
+
+
+def _code_filters(name: str, codes: np.ndarray) -> list[tuple]:
+    """Return Parquet filters selecting ``codes``; the range lets row groups be skipped."""
+    return [(name, ">=", int(codes[0])), (name, "<=", int(codes[-1])), (name, "in", codes.tolist())]
+
+
+def read_coo_parquet(
+    path: str | Path,
+    *,
+    rows: dict[str, object] | None = None,
+    columns: dict[str, object] | None = None,
+) -> pd.DataFrame:
+    """Read one COO payload as a pandas sparse dataframe.
+
+    Parameters
+    ----------
+    path:
+        ``.parquet`` file written by :func:`write_coo_parquet`.
+    rows, columns:
+        Optional ``level -> label(s)`` filters on either axis. Filters are
+        pushed to the Parquet reader as code ranges, so row groups whose
+        statistics fall outside the selection are not read.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Sparse-backed dataframe restricted to the selected labels.
+    """
+    import pyarrow.parquet as pq
+    from scipy import sparse
+
+    path = Path(path)
+    description = _coo_metadata(path)
+    if description is None:
+        raise ValueError(f"{path} is not a sparse COO parquet payload.")
+
+    axes = coo_axes_path(path)
+    index = _read_axis(axes / "index.parquet", description["index_names"])
+    header = _read_axis(axes / "columns.parquet", description["columns_names"])
+
+    selected = {}
+    filters = []
+    for name, axis, selection in (("row", index, rows), ("col", header, columns)):
+        if selection:
+            codes = np.flatnonzero(axis_mask(axis, dict(selection)))
+            selected[name] = codes
+            if codes.size:
+                filters.extend(_code_filters(name, codes))
+    if any(codes.size == 0 for codes in selected.values()):
+        triplets = {name: np.empty(0, dtype=np.int64) for name in ("row", "col")}
+        triplets["value"] = np.empty(0, dtype=float)
+    else:
+        table = pq.read_table(path, filters=filters or None)
+        triplets = {name: table.column(name).to_numpy() for name in ("row", "col", "value")}
+
+    shape = list(description["shape"])
+    for position, name in enumerate(("row", "col")):
+        if name in selected:
+            codes = selected[name]
+            triplets[name] = np.searchsorted(codes, triplets[name])
+            shape[position] = codes.size
+    if "row" in selected:
+        index = index[selected["row"]]
+    if "col" in selected:
+        header = header[selected["col"]]
+
+    matrix = sparse.coo_matrix(
+        (triplets["value"], (triplets["row"], triplets["col"])),
+        shape=tuple(shape),
+    )
+    return sparse_frame_from_spmatrix(matrix.tocsc(), index=index, columns=header)
+
+
+def read_parquet_block(path: str | Path) -> pd.DataFrame:
+    """Read one matrix parquet file, keeping COO payloads sparse."""
+    if is_coo_parquet(path):
+        return read_coo_parquet(path)
+    return pd.read_parquet(path)
+
+
+def remove_coo_axes(path: str | Path) -> None:
+    """Remove the axis dictionaries left by a previous COO payload at ``path``."""
+    shutil.rmtree(coo_axes_path(path), ignore_errors=True)
@@ -95,6 +95,7 @@ setup(
         ],
         "storage": [
             "pyarrow>=17",
+            "duckdb>=1.0",
         ],
         "dev": [
             "pytest",
@@ -89,6 +89,80 @@ def test_clone_scenario(CoreDataIOT):
     assert "does not exist" in str(msg.value)
 
 
+def test_clone_scenario_shares_blocks_until_one_side_is_written(CoreDataIOT):
+
+    baseline_Y = CoreDataIOT['baseline'][_ENUM.Y].copy(deep=True)
+    CoreDataIOT.clone_scenario(scenario='baseline', name='dummy')
+
+    report = CoreDataIOT.memory_report()
+    assert report.loc['dummy', 'owned_bytes'] == 0
+    assert report.loc['dummy', 'shared_blocks'] == report.loc['dummy', 'blocks']
+    assert report.loc['dummy', 'shared_bytes'] == report.loc['baseline', 'owned_bytes']
+
+    CoreDataIOT.matrices['dummy'][_ENUM.Y].iloc[0, 0] += 1.0
+
+    pdt.assert_frame_equal(CoreDataIOT['baseline'][_ENUM.Y], baseline_Y)
+    report = CoreDataIOT.memory_report()
+    assert report.loc['dummy', 'owned_bytes'] == baseline_Y.to_numpy().nbytes
+    assert report.loc['dummy', 'shared_blocks'] == report.loc['dummy', 'blocks'] - 1
+
+
+def test_copy_and_backup_share_blocks_copy_on_write(CoreDataIOT):
+
+    original_Z = CoreDataIOT.Z.copy(deep=True)
+    CoreDataIOT.backup()
+    new = CoreDataIOT.copy()
+
+    assert new.memory_report().loc['baseline', 'owned_bytes'] > 0
+    new.matrices['baseline'][_ENUM.Z].iloc[0, 0] += 1.0
+    CoreDataIOT.matrices['baseline'][_ENUM.Z].iloc[1, 1] += 1.0
+
+    assert new.Z.iloc[1, 1] == original_Z.iloc[1, 1]
+    assert CoreDataIOT.Z.iloc[0, 0] == original_Z.iloc[0, 0]
+    pdt.assert_frame_equal(CoreDataIOT._backup.matrices['baseline'][_ENUM.Z], original_Z)
+    pdt.assert_frame_equal(new._backup.matrices['baseline'][_ENUM.Z], original_Z)
+
+
+def test_set_block_drops_only_blocks_derived_from_the_written_input(CoreDataIOT):
+
+    CoreDataIOT.calc_all([_ENUM.X, _ENUM.z, _ENUM.e, _ENUM.F, _ENUM.f])
+    CoreDataIOT.clone_scenario(scenario='baseline', name='dummy')
+    E = CoreDataIOT.get_block(_ENUM.E, scenario='dummy') * 2
+
+    CoreDataIOT.set_block(_ENUM.E, E, scenario='dummy')
+
+    stored = set(CoreDataIOT.list_matrices('dummy'))
+    assert {_ENUM.e, _ENUM.f, _ENUM.F}.isdisjoint(stored)
+    assert {_ENUM.X, _ENUM.z, _ENUM.Z, _ENUM.Y}.issubset(stored)
+
+    CoreDataIOT.calc_all([_ENUM.F], scenario='dummy')
+    pdt.assert_frame_equal(
+        CoreDataIOT.get_block(_ENUM.F, scenario='dummy'),
+        CoreDataIOT.get_block(_ENUM.F, scenario='baseline') * 2,
+    )
+    assert _ENUM.E in CoreDataIOT.list_matrices('baseline')
+    assert _ENUM.F in CoreDataIOT.list_matrices('baseline')
+
+
+def test_update_scenarios_invalidates_transitive_dependents_but_not_user_blocks(CoreDataIOT):
+
+    CoreDataIOT.calc_all([_ENUM.X, _ENUM.z, _ENUM.v])
+    CoreDataIOT.clone_scenario(scenario='baseline', name='dummy')
+    CoreDataIOT.reset_to_coefficients('dummy')
+    CoreDataIOT.calc_all([_ENUM.X], scenario='dummy')
+    Y = CoreDataIOT.get_block(_ENUM.Y, scenario='dummy') * 1.5
+
+    CoreDataIOT.update_scenarios('dummy', Y=Y)
+
+    stored = set(CoreDataIOT.list_matrices('dummy'))
+    assert _ENUM.X not in stored
+    assert {_ENUM.z, _ENUM.v}.issubset(stored)
+    pdt.assert_frame_equal(
+        CoreDataIOT.query(_ENUM.X, scenarios='dummy'),
+        CoreDataIOT.query(_ENUM.X, scenarios='baseline') * 1.5,
+    )
+
+
 def test_rename_scenario(CoreDataIOT):
 
     CoreDataIOT.clone_scenario(
@@ -1099,6 +1173,30 @@ def test_pc_ex_sut_returns_commodity_side_price_contributions(CoreDataSUT):
     pdt.assert_frame_equal(result, expected)
 
 
+def test_iter_exploded_streams_chunks_and_sparse_parquet_sink(CoreDataSUT, tmp_path):
+    from mario.storage.sparse_parquet import read_coo_parquet
+
+    expected = CoreDataSUT.fa_ex()
+    chunks = list(CoreDataSUT.iter_exploded("fa_ex", chunk_size=1))
+    assert max(len(chunk) for chunk in chunks) == 1
+    pdt.assert_frame_equal(pd.concat(chunks), expected)
+
+    threshold = float(np.quantile(np.abs(expected.to_numpy()), 0.75))
+    significant = expected.where(expected.abs() >= threshold, 0.0)
+    thresholded = pd.concat(list(CoreDataSUT.iter_exploded("fa_ex", threshold=threshold)))
+    np.testing.assert_allclose(thresholded.sparse.to_dense().to_numpy(), significant.to_numpy())
+
+    path = CoreDataSUT.exploded_to_parquet("fa_ex", tmp_path / "fa_ex.parquet", chunk_size=2, threshold=threshold)
+    written = read_coo_parquet(path)
+    assert written.index.equals(expected.index)
+    np.testing.assert_allclose(written.sparse.to_dense().to_numpy(), significant.to_numpy())
+
+    with pytest.raises(WrongInput):
+        list(CoreDataSUT.iter_exploded("f_ex"))
+    with pytest.raises(WrongInput):
+        list(CoreDataSUT.iter_exploded("fa_ex", chunk_size=0))
+
+
 def test_ex_methods_raise_on_unknown_selector(CoreDataIOT):
 
     with pytest.raises(WrongInput) as msg_f:
@@ -1,8 +1,10 @@
+import tracemalloc
 import warnings
 from copy import deepcopy
 
 import mario
 import mario.parsers as public_parsers
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import pytest
@@ -16,6 +18,7 @@ from mario.log_exc.logger import set_log_verbosity
 from mario.ops import export as export_module
 from mario.compute.ordering import SUTUnifiedOrderingPolicy
 from mario.compute.primitives import calc_w, calc_z
+from mario.compute.rows import model_row_cache
 from mario.compute.views import (
     concat_sut_e,
     concat_sut_f,
@@ -95,6 +98,30 @@ def test_calc_all_iot_solve_method_resolves_f_without_materializing_w():
     assert _ENUM.w not in database["baseline"]
 
 
+def test_resolve_rows_computes_selected_multiplier_rows_without_materializing():
+    database = load_test("IOT")
+    e = database.query([_ENUM.e])
+    rows = e.index[:2].tolist()
+
+    selected = database.resolve(_ENUM.f, rows=rows)
+
+    expected = e.dot(calc_w(calc_z(database.Z, database.X))).loc[rows]
+    pdt.assert_frame_equal(selected, expected)
+    assert _ENUM.f not in database["baseline"]
+    assert _ENUM.w not in database["baseline"]
+
+    selected.iloc[0, 0] = -1.0
+    cached = database.resolve(_ENUM.f, rows=rows)
+    assert model_row_cache(database).stats().hits == 1
+    assert cached is not selected
+    pdt.assert_frame_equal(cached, expected)
+    database.set_block(_ENUM.e, e * 2)
+    pdt.assert_frame_equal(database.resolve(_ENUM.f, rows=rows), expected * 2)
+
+    with pytest.raises(WrongInput):
+        database.resolve(_ENUM.f, rows=["not-a-satellite"])
+
+
 def test_calc_all_rejects_legacy_runtime_kwargs():
     database = load_test("IOT")
 
@@ -308,6 +335,28 @@ def test_calc_linkages_adds_local_and_foreign_shares_in_multi_mode():
         )
 
 
+@pytest.mark.parametrize("table", ["IOT", "SUT"])
+@pytest.mark.parametrize("multi_mode", [True, False])
+def test_calc_linkages_matrix_free_matches_inverse_path_without_materializing_inverses(table, multi_mode, caplog):
+    database = load_test(table)
+    inverses = [_ENUM.w, _ENUM.g, "gcc", "gca", "gac", "gaa"]
+    size = len(database.z.index)
+
+    with caplog.at_level("INFO"):
+        matrix_free = database.calc_linkages(
+            multi_mode=multi_mode,
+            compute_options=ComputeOptions(execution_mode="prefer_memory"),
+        )
+
+    assert any(
+        "matrix-free mode" in message and f"{2 * size} identity-column solves" in message
+        for message in caplog.messages
+    )
+    assert not any(name in database["baseline"] for name in inverses)
+    explicit = database.calc_linkages(multi_mode=multi_mode, matrix_free=False)
+    pdt.assert_frame_equal(matrix_free[explicit.columns], explicit, check_exact=False, rtol=1e-9, atol=1e-12)
+
+
 def test_calc_linkages_avoids_incompatible_dtype_warnings():
     database = load_test("IOT")
 
@@ -1369,6 +1418,136 @@ def test_calc_trades_content_exposure_alias_delegates_with_warning():
     pdt.assert_frame_equal(result, expected)
 
 
+def _build_wide_iot_database(regions, sectors):
+    rng = np.random.default_rng(0)
+    region_labels = [f"R{position}" for position in range(regions)]
+    sector_labels = [f"s{position}" for position in range(sectors)]
+    sector_axis = pd.MultiIndex.from_product(
+        [region_labels, [_MASTER_INDEX["s"]], sector_labels],
+        names=["Region", "Level", "Item"],
+    )
+    final_demand_axis = pd.MultiIndex.from_product(
+        [region_labels, [_MASTER_INDEX["n"]], ["FD"]],
+        names=["Region", "Level", "Item"],
+    )
+    size = len(sector_axis)
+
+    return mario.Database(
+        name="wide-iot",
+        table="IOT",
+        Z=pd.DataFrame(rng.random((size, size)), index=sector_axis, columns=sector_axis),
+        Y=pd.DataFrame(rng.random((size, regions)) * size, index=sector_axis, columns=final_demand_axis),
+        V=pd.DataFrame(rng.random((1, size)) * size, index=["VA"], columns=sector_axis),
+        E=pd.DataFrame(rng.random((1, size)), index=["CO2"], columns=sector_axis),
+        EY=pd.DataFrame(0.0, index=["CO2"], columns=final_demand_axis),
+        VY=pd.DataFrame(0.0, index=["VA"], columns=final_demand_axis),
+        units={
+            _MASTER_INDEX["s"]: pd.DataFrame({"unit": ["USD"] * sectors}, index=sector_labels),
+            _MASTER_INDEX["f"]: pd.DataFrame({"unit": ["USD"]}, index=["VA"]),
+            _MASTER_INDEX["k"]: pd.DataFrame({"unit": ["kg"]}, index=["CO2"]),
+        },
+        calc_all=True,
+    )
+
+
+def _build_wide_sut_database(regions, sectors):
+    rng = np.random.default_rng(0)
+    region_labels = [f"R{position}" for position in range(regions)]
+    sector_labels = [f"s{position}" for position in range(sectors)]
+    activity_axis, commodity_axis = (
+        pd.MultiIndex.from_product([region_labels, [level], sector_labels], names=["Region", "Level", "Item"])
+        for level in (_MASTER_INDEX["a"], _MASTER_INDEX["c"])
+    )
+    final_demand_axis = pd.MultiIndex.from_product(
+        [region_labels, [_MASTER_INDEX["n"]], ["FD"]],
+        names=["Region", "Level", "Item"],
+    )
+    axis = activity_axis.append(commodity_axis)
+    size = len(activity_axis)
+
+    Z = pd.DataFrame(0.0, index=axis, columns=axis)
+    # Each region supplies only its own commodities, so the table is not in
+    # Chenery-Moses format and trade content uses the commodity side.
+    Z.loc[activity_axis, commodity_axis] = np.kron(np.eye(regions), rng.random((sectors, sectors))) * size
+    Z.loc[commodity_axis, activity_axis] = rng.random((size, size))
+    Y = pd.DataFrame(0.0, index=axis, columns=final_demand_axis)
+    Y.loc[commodity_axis] = rng.random((size, regions)) * size
+    V = pd.DataFrame(0.0, index=["VA"], columns=axis)
+    V.loc[:, activity_axis] = rng.random((1, size)) * size * size
+    E = pd.DataFrame(0.0, index=["CO2"], columns=axis)
+    E.loc[:, activity_axis] = rng.random((1, size))
+
+    return mario.Database(
+        name="wide-sut",
+        table="SUT",
+        Z=Z,
+        Y=Y,
+        V=V,
+        E=E,
+        EY=pd.DataFrame(0.0, index=["CO2"], columns=final_demand_axis),
+        VY=pd.DataFrame(0.0, index=["VA"], columns=final_demand_axis),
+        units={
+            _MASTER_INDEX["a"]: pd.DataFrame({"unit": ["USD"] * sectors}, index=sector_labels),
+            _MASTER_INDEX["c"]: pd.DataFrame({"unit": ["USD"] * sectors}, index=sector_labels),
+            _MASTER_INDEX["f"]: pd.DataFrame({"unit": ["USD"]}, index=["VA"]),
+            _MASTER_INDEX["k"]: pd.DataFrame({"unit": ["kg"]}, index=["CO2"]),
+        },
+        calc_all=True,
+    )
+
+
+@pytest.mark.parametrize("method", ["direct", "total", "upstream"])
+def test_trade_content_breakdowns_peak_below_one_dense_sector_matrix(method):
+    database = _build_wide_iot_database(regions=4, sectors=150)
+    sector_count = len(database.get_index(_MASTER_INDEX["r"])) * len(database.get_index(_MASTER_INDEX["s"]))
+    dense_sector_matrix = sector_count * sector_count * np.dtype(float).itemsize
+    calls = {
+        "calc_trades_content_breakdown": lambda: database.calc_trades_content("CO2", method=method, breakdown=True),
+        "calc_trades_exposure": lambda: database.calc_trades_exposure("CO2", "R0", method=method),
+        "calc_trades_concentration": lambda: database.calc_trades_concentration("CO2", method=method),
+    }
+
+    for name, call in calls.items():
+        call()
+        tracemalloc.start()
+        try:
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < dense_sector_matrix, f"{name} peaked at {peak} bytes"
+
+
+@pytest.mark.parametrize("method", ["direct", "total", "upstream"])
+def test_sut_commodity_side_trade_content_weights_peak_below_one_dense_sector_matrix(method):
+    database = _build_wide_sut_database(regions=4, sectors=150)
+    assert not database.is_chenerymoses()
+    commodities = database.U.index
+    dense_sector_matrix = len(commodities) * len(commodities) * np.dtype(float).itemsize
+    flows = np.random.default_rng(1).random((len(commodities), 4))
+
+    def contributions():
+        weights, _ = database._resolve_trade_content_exploded(
+            "CO2",
+            scenario="baseline",
+            method=method,
+            use_activity_side=False,
+        )
+        return weights.contributions(commodities, flows)
+
+    expected = contributions()
+    tracemalloc.start()
+    try:
+        result = contributions()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    np.testing.assert_array_equal(result, expected)
+    assert peak < dense_sector_matrix, f"commodity-side weights peaked at {peak} bytes"
+
+
 def _expected_embodied_imports(trades):
     diagonal_labels = trades.index.intersection(trades.columns)
     imports = trades.sum(axis=0)
@@ -1539,6 +1718,41 @@ def test_calc_spa_sorts_by_absolute_contribution_and_applies_top_n():
     assert spa["cumulative_share"].is_monotonic_increasing
 
 
+def test_calc_spa_top_n_branch_and_bound_matches_exhaustive_ranking():
+    database = load_test("IOT")
+    indicator = database.get_index("Satellite account")[0]
+
+    exhaustive = database.calc_spa(
+        indicator,
+        item="Agriculture",
+        max_depth=4,
+        cutoff=0,
+        top_n=None,
+    )
+    pruned = database.calc_spa(
+        indicator,
+        item="Agriculture",
+        max_depth=4,
+        cutoff=0,
+        top_n=15,
+    )
+
+    assert pruned["path"].tolist() == exhaustive["path"].head(15).tolist()
+    assert pruned["contribution"].tolist() == pytest.approx(exhaustive["contribution"].head(15).tolist())
+
+
+def test_calc_spa_expands_subtrees_whose_upstream_content_exceeds_cutoff():
+    database = load_test("IOT")
+    indicator = database.get_index("Satellite account")[0]
+    reference = database.calc_spa(indicator, item="Agriculture", max_depth=3, cutoff=0, top_n=None)
+    cutoff = float(reference["contribution"].abs().median())
+
+    spa = database.calc_spa(indicator, item="Agriculture", max_depth=3, cutoff=cutoff, top_n=None)
+    expected = reference.loc[reference["contribution"].abs() >= cutoff, "path"]
+
+    assert sorted(spa["path"]) == sorted(expected)
+
+
 def test_calc_spa_accepts_renamed_baseline_aliases():
     database = load_test("IOT")
     indicator = database.get_index("Satellite account")[0]
@@ -2436,6 +2650,169 @@ def test_shock_calc_base_scenario_chains_on_scenario(tmp_path):
         database.shock_calc(str(path_a), z=True, scenario="s3", base_scenario="missing")
 
 
+def _write_z_column_shock(path, database, columns, value):
+    z = database.z
+    item = next(row for row in z.index if row[0] == "Reg1")[2]
+    sheet = pd.DataFrame(
+        [
+            {
+                SHOCK_FLAT_COLUMNS["region_from"]: "Reg1",
+                SHOCK_FLAT_COLUMNS["sector_from"]: item,
+                SHOCK_FLAT_COLUMNS["region_to"]: column[0],
+                SHOCK_FLAT_COLUMNS["sector_to"]: column[2],
+                SHOCK_FLAT_COLUMNS["type"]: "Update",
+                SHOCK_FLAT_COLUMNS["value"]: value,
+            }
+            for column in columns
+        ]
+    )
+    with pd.ExcelWriter(path) as writer:
+        sheet.to_excel(writer, sheet_name=_ENUM.z, index=False)
+
+
+def test_shock_calc_low_rank_update_matches_full_solve(tmp_path):
+    database = load_test("IOT")
+    database.calc_all([_ENUM.w, _ENUM.f, _ENUM.m])
+    path = tmp_path / "low_rank.xlsx"
+    _write_z_column_shock(path, database, list(database.z.columns)[:2], 0.05)
+
+    database.shock_calc(str(path), z=True, scenario="woodbury")
+    database.shock_calc(str(path), z=True, scenario="full", low_rank_update=False)
+
+    assert {_ENUM.w, _ENUM.f, _ENUM.m}.issubset(database.matrices["woodbury"])
+    assert _ENUM.w not in database.matrices["full"]
+    for matrix in (_ENUM.X, _ENUM.Z, _ENUM.w, _ENUM.f, _ENUM.m, _ENUM.F):
+        pdt.assert_frame_equal(
+            database.query(matrix, scenarios="woodbury"),
+            database.query(matrix, scenarios="full"),
+            check_exact=False,
+            rtol=1e-8,
+            atol=1e-10,
+        )
+
+
+def test_shock_calc_low_rank_update_falls_back_above_max_rank(tmp_path, monkeypatch):
+    database = load_test("IOT")
+    path = tmp_path / "rank.xlsx"
+    _write_z_column_shock(path, database, list(database.z.columns)[:3], 0.05)
+    calls = []
+    original = mario.Database._low_rank_shock_blocks
+
+    def _spy(self, *args, **kwargs):
+        blocks = original(self, *args, **kwargs)
+        calls.append(sorted(blocks))
+        return blocks
+
+    monkeypatch.setattr(mario.Database, "_low_rank_shock_blocks", _spy)
+
+    # One source row shocked in three columns is a rank-1 change of z.
+    database.shock_calc(str(path), z=True, scenario="high rank", max_update_rank=0)
+    database.shock_calc(str(path), z=True, scenario="low rank", max_update_rank=1)
+
+    assert calls == [[], [_ENUM.X]]
+    pdt.assert_frame_equal(
+        database.query(_ENUM.X, scenarios="high rank"),
+        database.query(_ENUM.X, scenarios="low rank"),
+        check_exact=False,
+        rtol=1e-8,
+    )
+
+
+def _sweep_table(database):
+    Y, v, e = database.Y, database.v, database.e
+    y_row, y_column = Y.index[0], Y.columns[0]
+    v_column, e_column = v.columns[1], e.columns[2]
+    return pd.DataFrame(
+        [
+            {
+                "Scenario": "demand",
+                "Matrix": _ENUM.Y,
+                SHOCK_FLAT_COLUMNS["region_from"]: y_row[0],
+                SHOCK_FLAT_COLUMNS["sector_from"]: y_row[2],
+                SHOCK_FLAT_COLUMNS["region_to"]: y_column[0],
+                SHOCK_FLAT_COLUMNS["category_to"]: y_column[2],
+                SHOCK_FLAT_COLUMNS["type"]: "Percentage",
+                SHOCK_FLAT_COLUMNS["value"]: 0.3,
+            },
+            {
+                "Scenario": "factors",
+                "Matrix": _ENUM.v,
+                SHOCK_FLAT_COLUMNS["factor_from"]: v.index[0],
+                SHOCK_FLAT_COLUMNS["region_to"]: v_column[0],
+                SHOCK_FLAT_COLUMNS["sector_to"]: v_column[2],
+                SHOCK_FLAT_COLUMNS["type"]: "Percentage",
+                SHOCK_FLAT_COLUMNS["value"]: -0.2,
+            },
+            {
+                "Scenario": "factors",
+                "Matrix": _ENUM.e,
+                SHOCK_FLAT_COLUMNS["satellite_from"]: e.index[0],
+                SHOCK_FLAT_COLUMNS["region_to"]: e_column[0],
+                SHOCK_FLAT_COLUMNS["sector_to"]: e_column[2],
+                SHOCK_FLAT_COLUMNS["type"]: "Update",
+                SHOCK_FLAT_COLUMNS["value"]: 0.5,
+            },
+            {
+                "Scenario": "factors",
+                "Matrix": _ENUM.Y,
+                SHOCK_FLAT_COLUMNS["region_from"]: y_row[0],
+                SHOCK_FLAT_COLUMNS["sector_from"]: y_row[2],
+                SHOCK_FLAT_COLUMNS["region_to"]: y_column[0],
+                SHOCK_FLAT_COLUMNS["category_to"]: y_column[2],
+                SHOCK_FLAT_COLUMNS["type"]: "Absolute",
+                SHOCK_FLAT_COLUMNS["value"]: 25.0,
+            },
+        ]
+    )
+
+
+def test_shock_sweep_matches_shock_calc_per_scenario():
+    database = load_test("IOT")
+    table = _sweep_table(database)
+    scenarios_before = list(database.matrices)
+
+    cube = database.shock_sweep(table)
+
+    assert list(database.matrices) == scenarios_before
+    assert list(cube) == [_ENUM.X, _ENUM.V, _ENUM.E]
+    assert list(cube[_ENUM.X].columns) == ["demand", "factors"]
+    for scenario, rows in table.groupby("Scenario", sort=False):
+        source = {
+            matrix: block.drop(columns=["Scenario", "Matrix"]).dropna(axis=1, how="all")
+            for matrix, block in rows.groupby("Matrix", sort=False)
+        }
+        database.shock_calc(source, Y=True, v=True, e=True, scenario=scenario)
+        X = database.query(_ENUM.X, scenarios=scenario)
+        V = database.query(_ENUM.V, scenarios=scenario)
+        E = database.query(_ENUM.E, scenarios=scenario)
+        assert cube[_ENUM.X][scenario].to_numpy() == pytest.approx(X.iloc[:, 0].to_numpy(), rel=1e-9)
+        assert cube[_ENUM.V][scenario].to_numpy() == pytest.approx(V.sum(axis=1).to_numpy(), rel=1e-9)
+        assert cube[_ENUM.E][scenario].to_numpy() == pytest.approx(E.sum(axis=1).to_numpy(), rel=1e-9)
+
+
+def test_shock_sweep_accepts_sampler_and_rejects_z_shocks():
+    database = load_test("IOT")
+    table = _sweep_table(database)
+    demand = table[table["Scenario"] == "demand"].drop(columns="Scenario")
+
+    def sampler(sample):
+        rows = demand.copy()
+        rows[SHOCK_FLAT_COLUMNS["value"]] = 0.1 * sample
+        return rows
+
+    cube = database.shock_sweep(sampler, samples=3, indicators=_ENUM.X)
+
+    assert list(cube) == [_ENUM.X]
+    assert list(cube[_ENUM.X].columns) == ["sample 0", "sample 1", "sample 2"]
+    assert cube[_ENUM.X]["sample 0"].to_numpy() == pytest.approx(
+        database.X.iloc[:, 0].to_numpy(), rel=1e-9
+    )
+    assert cube[_ENUM.X]["sample 2"].sum() > cube[_ENUM.X]["sample 1"].sum()
+
+    with pytest.raises(WrongInput, match="only accept Y, v and e"):
+        database.shock_sweep({"bad": {_ENUM.z: demand}})
+
+
 def _write_supply_mix_sheet(path, rows):
     sheet = pd.DataFrame(
         [
@@ -1,9 +1,12 @@
 import pytest
+import numpy as np
+import pandas as pd
 import pandas.testing as pdt
 
 from mario.internal import ModelState, ModelStateMetadata
 from mario.model.enums import TableKind
-from mario.storage import InMemoryBlockRepository, ParquetBlockRepository
+from mario.storage import DuckDBBlockRepository, InMemoryBlockRepository, MemmapBlockRepository, ParquetBlockRepository
+from mario.storage.sparse_parquet import read_coo_parquet, write_coo_parquet
 from mario.test.mario_test import load_test
 from mario.model.conventions import _ENUM
 
@@ -76,3 +79,105 @@ def test_parquet_repository_roundtrip(tmp_path):
     pdt.assert_frame_equal(state.get_block("Z"), database.Z)
     pdt.assert_frame_equal(state.get_block("X"), database.X)
     assert repository.list_keys() == ("baseline/X", "baseline/Z")
+
+
+def test_parquet_repository_keeps_sparse_blocks_in_coo_layout_and_prunes_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    repository = ParquetBlockRepository(tmp_path / "parquet_repo")
+    database = load_test("IOT")
+    sparse_z = database.Z.mask(database.Z.abs() < 100, 0.0).astype(pd.SparseDtype(float, 0.0))
+    repository.put("baseline/Z", sparse_z)
+    write_coo_parquet(sparse_z, tmp_path / "grouped.parquet", row_group_size=2)
+
+    payload = pq.read_table(tmp_path / "parquet_repo" / "baseline" / "Z.parquet")
+    assert payload.column_names == ["row", "col", "value"]
+    assert payload.num_rows == int((sparse_z.sparse.to_coo() != 0).sum())
+    assert repository.list_keys() == ("baseline/Z",)
+    pdt.assert_frame_equal(repository.get("baseline/Z"), sparse_z)
+
+    region = sparse_z.index.get_level_values("Region")[-1]
+    expected = sparse_z.loc[sparse_z.index.get_level_values("Region") == region]
+    pdt.assert_frame_equal(repository.select("baseline/Z", rows={"Region": region}), expected)
+    pdt.assert_frame_equal(read_coo_parquet(tmp_path / "grouped.parquet", rows={"Region": region}), expected)
+
+    row_groups = pq.ParquetFile(tmp_path / "grouped.parquet").metadata
+    assert row_groups.num_row_groups > 1
+    first_row = sparse_z.index.get_level_values("Region").tolist().index(region)
+    skipped = [
+        group
+        for group in range(row_groups.num_row_groups)
+        if row_groups.row_group(group).column(0).statistics.max < first_row
+    ]
+    assert skipped
+
+
+def test_memmap_repository_roundtrip_shares_axes_and_maps_dense_blocks(tmp_path):
+    repository = MemmapBlockRepository(tmp_path / "memmap_repo")
+    state = ModelState(
+        metadata=ModelStateMetadata(table_kind=TableKind.IOT, name="roundtrip"),
+        repository=repository,
+    )
+
+    database = load_test("IOT")
+    sparse_z = database.Z.astype(pd.SparseDtype(float, 0.0))
+    state.set_block("Z", sparse_z)
+    state.set_block("w", database.w)
+    state.set_block("X", database.X)
+
+    pdt.assert_frame_equal(state.get_block("Z"), sparse_z)
+    pdt.assert_frame_equal(state.get_block("w"), database.w)
+    pdt.assert_frame_equal(state.get_block("X"), database.X)
+    assert repository.list_keys() == ("baseline/X", "baseline/Z", "baseline/w")
+    assert len(list((tmp_path / "memmap_repo" / "baseline" / "_axes").iterdir())) == 2
+
+    w = state.get_block("w")
+    values = w._mgr.blocks[0].values
+    while not isinstance(values, np.memmap) and values.base is not None:
+        values = values.base
+    assert isinstance(values, np.memmap)
+
+    w.iloc[0, 0] = -1.0
+    assert state.get_block("w").iloc[0, 0] == database.w.iloc[0, 0]
+
+
+def test_duckdb_repository_roundtrip_and_query_pushdown_matches_pandas():
+    pytest.importorskip("duckdb")
+
+    database = load_test("IOT")
+    database.calc_all([_ENUM.F, _ENUM.X])
+    states = {
+        "duckdb": ModelState.from_database(database, repository=DuckDBBlockRepository()),
+        "memory": ModelState.from_database(database, repository=InMemoryBlockRepository()),
+    }
+    for state in states.values():
+        state.create_scenario("policy", parent="baseline")
+        state.set_block("F", database.F * 2, scenario="policy")
+
+    repository = states["duckdb"].repository
+    sparse_z = database.Z.astype(pd.SparseDtype(float, 0.0))
+    repository.put("extra/Z", sparse_z)
+    pdt.assert_frame_equal(repository.get("extra/Z"), sparse_z)
+    pdt.assert_frame_equal(states["duckdb"].get_block("Z"), database.Z)
+    pdt.assert_series_equal(repository.get("baseline/X").iloc[:, 0], database.X.iloc[:, 0])
+
+    item = database.F.index[0]
+    region = database.F.columns.get_level_values("Region")[0]
+    footprint = {
+        key: state.query("F", rows={"Item": item}, group_columns=["Region"])
+        for key, state in states.items()
+    }
+    pdt.assert_frame_equal(footprint["duckdb"], footprint["memory"], check_dtype=False)
+    expected = database.F.loc[item].xs(region, level="Region").sum()
+    assert footprint["duckdb"].loc[("baseline", item), region] == pytest.approx(expected)
+    assert footprint["duckdb"].loc[("policy", item), region] == pytest.approx(2 * expected)
+
+    totals = states["duckdb"].query("X", group_rows=["Region"], group_columns=[])
+    assert totals.index.names == ["Scenario", "Region"]
+    assert totals.loc["policy"].equals(totals.loc["baseline"])
+
+    for state in states.values():
+        with pytest.raises(KeyError, match="Sector"):
+            state.query("F", rows={"Sector": item})
+        with pytest.raises(KeyError, match="Missing"):
+            state.query("F", group_columns=["Missing"])
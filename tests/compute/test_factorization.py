@@ -0,0 +1,72 @@
+import copy
+
+import numpy as np
+import pandas.testing as pdt
+from scipy import sparse
+
+from mario.compute.factorization import (
+    FactorizationCache,
+    matrix_fingerprint,
+    model_factorization_cache,
+)
+from mario.compute.primitives import calc_w, calc_z
+from mario.compute.resolver import Resolver
+from mario.compute.types import ResolutionContext
+from mario.test.mario_test import load_test
+
+
+_SOLVE_CONTEXT = ResolutionContext(compute_method="solve", linear_solver="scipy", linear_strategy="direct")
+
+
+def test_matrix_fingerprint_depends_on_content_not_identity():
+    values = np.array([[0.1, 0.0], [0.2, 0.3]])
+
+    assert matrix_fingerprint(values) == matrix_fingerprint(values.copy())
+    assert matrix_fingerprint(sparse.csc_matrix(values)) == matrix_fingerprint(sparse.csr_matrix(values))
+
+    changed = values.copy()
+    changed[1, 0] = 0.25
+    assert matrix_fingerprint(changed) != matrix_fingerprint(values)
+
+
+def test_factorization_cache_evicts_least_recently_used_entries():
+    cache = FactorizationCache(max_entries=2, max_bytes=100)
+
+    cache.put("a", object(), nbytes=10)
+    cache.put("b", object(), nbytes=10)
+    assert cache.get("a") is not None
+    cache.put("c", object(), nbytes=10)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+    cache.put("d", object(), nbytes=95)
+    assert list(cache._entries) == ["d"]
+    cache.put("huge", object(), nbytes=1000)
+    assert "huge" not in cache
+    assert cache.stats().evictions == 3
+
+
+def test_factorization_cache_is_shared_across_resolvers_of_one_model():
+    iot = load_test("IOT")
+    expected = iot.e.dot(calc_w(calc_z(iot.Z, iot.X)))
+
+    first = Resolver(iot, context=_SOLVE_CONTEXT).resolve("f")
+    cache = model_factorization_cache(iot)
+    misses = cache.stats().misses
+    second = Resolver(iot, context=_SOLVE_CONTEXT).resolve("m")
+
+    pdt.assert_frame_equal(first, expected)
+    assert second.shape[1] == expected.shape[1]
+    assert cache.stats().entries == 1
+    assert cache.stats().hits >= 1
+    assert cache.stats().misses == misses
+
+
+def test_factorization_cache_is_not_copied_with_the_model():
+    iot = load_test("IOT")
+    Resolver(iot, context=_SOLVE_CONTEXT).resolve("f")
+
+    copied = copy.deepcopy(iot)
+
+    assert len(model_factorization_cache(iot)) == 1
+    assert len(model_factorization_cache(copied)) == 0
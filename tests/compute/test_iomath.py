@@ -39,7 +39,9 @@ from mario.compute.primitives import (
     calc_p,
     X_inverse,
     calc_all_shock,
+    linkages_calculation,
 )
+from mario.test.mario_test import load_test
 
 
 @pytest.fixture()
@@ -166,3 +168,84 @@ def test_calcM(IOT_table):
     pdt.assert_frame_equal(
         IOT_table[_ENUM.M],calc_M(IOT_table[_ENUM.m],IOT_table[_ENUM.Y])
     )
+
+
+def _per_sector_multi_linkages(cut_diag, matrices):
+    """Reference: the former per-sector label-slicing implementation."""
+    matrices = {name: block.copy() for name, block in matrices.items()}
+    if cut_diag:
+        for value in matrices.values():
+            for position in range(min(value.shape)):
+                value.iat[position, position] = 0.0
+
+    links = pd.DataFrame(
+        0.0,
+        index=matrices[_ENUM.g].index,
+        columns=pd.MultiIndex.from_product(
+            [["Total Forward", "Total Backward", "Direct Forward", "Direct Backward"], ["Local", "Foreign"]]
+        ),
+    )
+    for index, _ in links.iterrows():
+        for measure, name, transpose in (
+            ("Total Forward", _ENUM.g, False),
+            ("Total Backward", _ENUM.w, True),
+            ("Direct Forward", _ENUM.b, False),
+            ("Direct Backward", _ENUM.z, True),
+        ):
+            block = matrices[name].T if transpose else matrices[name]
+            local = block.loc[index, index[0]].sum().sum()
+            links.loc[index, (measure, "Local")] = local
+            links.loc[index, (measure, "Foreign")] = block.loc[index].sum().sum() - local
+    return links
+
+
+def _linkage_inputs(regions=4, sectors=30, seed=7):
+    rng = np.random.default_rng(seed)
+    index = pd.MultiIndex.from_product(
+        [[f"R{r}" for r in range(regions)], ["Sector"], [f"s{s}" for s in range(sectors)]]
+    )
+    size = len(index)
+    z = rng.random((size, size)) * (0.5 / size)
+    b = rng.random((size, size)) * (0.5 / size)
+    identity = np.eye(size)
+    blocks = {
+        _ENUM.z: z,
+        _ENUM.b: b,
+        _ENUM.w: np.linalg.inv(identity - z),
+        _ENUM.g: np.linalg.inv(identity - b),
+    }
+    return {name: pd.DataFrame(values, index=index, columns=index) for name, values in blocks.items()}
+
+
+@pytest.mark.parametrize("table", ["IOT", "SUT"])
+@pytest.mark.parametrize("cut_diag", [True, False])
+def test_multi_mode_linkages_match_per_sector_reference(table, cut_diag):
+    database = load_test(table)
+    if table == "SUT":
+        database.to_iot("A")
+    matrices = database.query(matrices=[_ENUM.w, _ENUM.b, _ENUM.z, _ENUM.g])
+
+    reference = _per_sector_multi_linkages(cut_diag, matrices)
+    vectorized = linkages_calculation(
+        cut_diag,
+        {name: block.copy() for name, block in matrices.items()},
+        True,
+        False,
+    )
+
+    pdt.assert_frame_equal(
+        vectorized[reference.columns],
+        reference,
+        check_exact=False,
+        rtol=1e-10,
+        atol=1e-12,
+    )
+
+
+def test_multi_mode_linkages_match_per_sector_reference_on_a_larger_table():
+    matrices = _linkage_inputs()
+
+    reference = _per_sector_multi_linkages(True, matrices)
+    vectorized = linkages_calculation(True, {name: block.copy() for name, block in matrices.items()}, True, False)
+
+    pdt.assert_frame_equal(vectorized[reference.columns], reference, check_exact=False, rtol=1e-10)
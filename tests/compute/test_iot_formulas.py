@@ -164,3 +164,53 @@ def test_iot_multiplier_and_price_formulas_handle_pandas_sparse_float32_inputs()
     pdt.assert_frame_equal(build_iot_m_from_v_w(v, w), expected_m, check_dtype=False)
     pdt.assert_frame_equal(build_iot_f_from_e_w(e, w), expected_f, check_dtype=False)
     pdt.assert_frame_equal(build_iot_p_from_v_w(v, w), expected_p)
+
+
+def _random_iot_coefficients(size, *, seed=0):
+    rng = np.random.default_rng(seed)
+    values = sparse.random(size, size, density=0.05, random_state=rng, format="csc").toarray() * 0.1
+    labels = [f"s{idx}" for idx in range(size)]
+    return pd.DataFrame(values, index=labels, columns=labels)
+
+
+def test_solve_iot_system_batches_multi_rhs_blocks_like_the_column_loop():
+    from scipy.sparse.linalg import factorized
+
+    from mario.compute.iot_formulas import _solve_iot_system
+    from mario.compute.linear import solve_factor_block
+    from mario.compute.types import ResolutionContext
+
+    z = _random_iot_coefficients(400)
+    rhs = pd.DataFrame(
+        np.random.default_rng(1).random((400, 300)),
+        index=z.index,
+        columns=[f"y{idx}" for idx in range(300)],
+    )
+    context = ResolutionContext(linear_solver="scipy", linear_strategy="direct")
+    factor = factorized(sparse.identity(400, format="csc") - sparse.csc_matrix(z.to_numpy()))
+    rhs_values = rhs.to_numpy()
+
+    looped = np.column_stack([factor(rhs_values[:, idx]) for idx in range(rhs_values.shape[1])])
+    batched = solve_factor_block(factor, rhs_values)
+    solved = _solve_iot_system(z, rhs, context=context)
+
+    np.testing.assert_allclose(batched, looped, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(solved.to_numpy(), looped, rtol=1e-10, atol=1e-12)
+    assert list(solved.columns) == list(rhs.columns)
+
+
+def test_solve_iot_system_iterative_chunks_match_direct_solution():
+    from mario.compute.iot_formulas import _solve_iot_system
+    from mario.compute.linear import RHS_CHUNK_SIZE
+    from mario.compute.types import ResolutionContext
+
+    z = _random_iot_coefficients(60, seed=3)
+    rhs = pd.DataFrame(
+        np.random.default_rng(4).random((60, 3 * RHS_CHUNK_SIZE + 5)),
+        index=z.index,
+    )
+
+    direct = _solve_iot_system(z, rhs, context=ResolutionContext(linear_solver="scipy", linear_strategy="direct"))
+    iterative = _solve_iot_system(z, rhs, context=ResolutionContext(linear_solver="scipy", linear_strategy="iterative"))
+
+    pdt.assert_frame_equal(iterative, direct, rtol=1e-6, atol=1e-8)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from mario.compute.factorization import FactorizationCache
+from mario.compute.lowrank import build_woodbury_solver, low_rank_difference
+
+
+def _coefficients(values):
+    labels = [f"s{idx}" for idx in range(values.shape[0])]
+    return pd.DataFrame(values, index=labels, columns=labels)
+
+
+def _random_pair(*, axis, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.random((30, 30)) * 0.02
+    shocked = base.copy()
+    if axis == "columns":
+        shocked[:, [3, 17]] *= 1.5
+    else:
+        shocked[[5], :] *= 0.5
+    return _coefficients(base), _coefficients(shocked)
+
+
+def test_low_rank_difference_picks_the_smaller_support():
+    base, by_columns = _random_pair(axis="columns")
+    _, by_rows = _random_pair(axis="rows")
+
+    column_update = low_rank_difference(base, by_columns)
+    row_update = low_rank_difference(base, by_rows)
+
+    assert column_update.rank == 2 and list(column_update.columns) == [3, 17]
+    assert row_update.rank == 1 and list(row_update.rows) == [5]
+    np.testing.assert_allclose(base.to_numpy() + column_update.left @ column_update.right, by_columns.to_numpy())
+    assert low_rank_difference(base, by_columns, max_rank=1) is None
+
+
+def test_woodbury_solver_matches_direct_solves_with_factor_and_with_w():
+    for axis in ("columns", "rows"):
+        base, shocked = _random_pair(axis=axis, seed=1)
+        identity = np.eye(base.shape[0])
+        expected_inverse = np.linalg.inv(identity - shocked.to_numpy())
+        rhs = np.random.default_rng(2).random((base.shape[0], 4))
+        w_base = _coefficients(np.linalg.inv(identity - base.to_numpy()))
+
+        cache = FactorizationCache()
+        from_factor = build_woodbury_solver(base, shocked, cache=cache)
+        from_w = build_woodbury_solver(base, shocked, w_base=w_base)
+
+        for solver in (from_factor, from_w):
+            np.testing.assert_allclose(solver.solve(rhs), expected_inverse @ rhs, rtol=1e-9)
+            np.testing.assert_allclose(solver.solve_transposed(rhs), expected_inverse.T @ rhs, rtol=1e-9)
+        np.testing.assert_allclose(from_w.update_inverse(w_base.to_numpy()), expected_inverse, rtol=1e-9)
+        assert len(cache) == 2
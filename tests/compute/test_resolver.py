@@ -11,7 +11,7 @@ from mario.compute.types import AxisSpec, FormulaStrategy, MatrixKey, MatrixSpec
 from mario.model.enums import TableKind
 from mario.model.labels import INDEX_LABELS, ITEM_LABEL
 from mario.compute.primitives import calc_w, calc_z
-from mario.compute.ordering import SUTUnifiedOrderingPolicy
+from mario.compute.ordering import SUTUnifiedOrderingPolicy, model_ordering_cache
 from mario.compute.sut_formulas import (
     build_sut_ea_from_Ea_Xa,
     build_sut_ec_from_Ec_Xc,
@@ -419,3 +419,123 @@ def test_dependency_graph_reports_cycles(monkeypatch):
 
     assert "cycle" in rendered
     assert "TEMP_A -> TEMP_B -> TEMP_A" in rendered
+
+
+def test_resolve_many_runs_independent_plan_steps_concurrently(monkeypatch):
+    import threading
+
+    from mario.compute import iot_formulas
+    from mario.compute.resolver import resolve_many
+    from mario.compute.types import ComputeOptions
+
+    sequential = resolve_many(
+        ["v", "e", "X"],
+        load_test("IOT"),
+        context=ResolutionContext(compute=ComputeOptions(max_workers=1)),
+    )
+
+    barrier = threading.Barrier(2, timeout=10)
+    threads = {}
+    for name in ("build_iot_v_from_V_X", "build_iot_e_from_E_X"):
+        original = getattr(iot_formulas, name)
+
+        def waiting(*args, _original=original, _name=name):
+            threads[_name] = threading.get_ident()
+            barrier.wait()
+            return _original(*args)
+
+        monkeypatch.setattr(iot_formulas, name, waiting)
+
+    iot = load_test("IOT")
+    parallel = resolve_many(
+        ["v", "e", "X"],
+        iot,
+        context=ResolutionContext(compute=ComputeOptions(max_workers=4)),
+    )
+
+    assert len(set(threads.values())) == 2
+    for name, value in sequential.items():
+        pdt.assert_frame_equal(parallel[name], value)
+    assert {"v", "e", "X"} <= set(iot["baseline"])
+
+
+def test_resolver_runs_sequentially_by_default_and_resolves_contended_targets_once(monkeypatch):
+    import threading
+    import time
+
+    from mario.compute import iot_formulas
+    from mario.compute.resolver import Resolver
+    from mario.compute.runtime import resolver_max_workers
+    from mario.compute.types import ComputeOptions
+
+    assert resolver_max_workers(ResolutionContext()) == 1
+    assert resolver_max_workers(ResolutionContext(compute=ComputeOptions())) == 1
+
+    calls = []
+    original = iot_formulas.build_iot_w_from_z
+
+    def slow(z):
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return original(z)
+
+    monkeypatch.setattr(iot_formulas, "build_iot_w_from_z", slow)
+
+    resolver = Resolver(
+        load_test("IOT"),
+        context=ResolutionContext(compute=ComputeOptions(execution_mode="prefer_speed")),
+    )
+    barrier = threading.Barrier(2, timeout=10)
+    results = {}
+
+    def worker(slot):
+        barrier.wait()
+        results[slot] = resolver.resolve("w")
+
+    threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results[0] is results[1]
+
+
+def test_resolve_many_rejects_invalid_worker_counts():
+    from mario.compute.resolver import resolve_many
+    from mario.compute.types import ComputeOptions
+    from mario.log_exc.exceptions import WrongInput
+
+    with pytest.raises(WrongInput, match="max_workers"):
+        resolve_many(["v"], load_test("IOT"), context=ResolutionContext(compute=ComputeOptions(max_workers=0)))
+
+
+def test_sut_ordering_is_cached_per_scenario_until_a_source_block_changes(monkeypatch):
+    db = load_test("SUT")
+    cache = model_ordering_cache(db)
+    calls = []
+    original = SUTUnifiedOrderingPolicy.from_blocks.__func__
+
+    def spy(cls, **blocks):
+        calls.append(sorted(blocks))
+        return original(cls, **blocks)
+
+    monkeypatch.setattr(SUTUnifiedOrderingPolicy, "from_blocks", classmethod(spy))
+    db.calc_all(["Z", "Y", "V", "E", "z"])
+    first = cache.stats()
+
+    assert first.builds == len(calls) <= 2
+    assert first.hits >= 3
+    assert all(len(names) <= 3 for names in calls)
+
+    db.calc_all(["X", "v"])
+    assert cache.stats().builds == first.builds
+
+    db.set_block("Ea", db.get_block("Ea").copy())
+    db.calc_all(["e"])
+    assert cache.stats().builds == first.builds
+
+    db.set_block("U", db.get_block("U").copy())
+    db.calc_all(["Z"], force_rewrite=True)
+    assert cache.stats().builds == first.builds + 1
@@ -0,0 +1,67 @@
+import itertools
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from mario.compute.spa import structural_paths
+
+
+def _synthetic_system(size, density, seed):
+    rng = np.random.default_rng(seed)
+    z = sparse.random(size, size, density=density, random_state=rng, format="csc")
+    z = (z * (0.6 / z.sum(axis=0).max())).tocsc()
+    direct = rng.random(size)
+    total = np.linalg.solve((sparse.identity(size) - z).T.toarray(), direct)
+    demand = np.zeros((size, 2))
+    demand[rng.choice(size, 3, replace=False), 0] = rng.random(3)
+    demand[rng.choice(size, 2, replace=False), 1] = rng.random(2)
+    return z, direct, total, demand
+
+
+def _enumerate_paths(z, direct, demand, max_depth):
+    dense = z.toarray()
+    paths = {}
+    for column in range(demand.shape[1]):
+        for root in np.flatnonzero(demand[:, column]):
+            frontier = [((root,), demand[root, column])]
+            for depth in range(max_depth + 1):
+                next_frontier = []
+                for nodes, weight in frontier:
+                    paths[(column, nodes)] = direct[nodes[0]] * weight
+                    for supplier in np.flatnonzero(dense[:, nodes[0]]):
+                        next_frontier.append(((supplier, *nodes), dense[supplier, nodes[0]] * weight))
+                frontier = next_frontier
+    return paths
+
+
+def test_structural_paths_match_exhaustive_enumeration():
+    z, direct, total, demand = _synthetic_system(12, 0.3, seed=3)
+    expected = _enumerate_paths(z, direct, demand, max_depth=3)
+
+    everything = structural_paths(z, direct, total, demand, max_depth=3)
+    found = {(path.demand_column, tuple(path.nodes.tolist())): path.contribution for path in everything}
+    assert found.keys() == expected.keys()
+    assert all(found[key] == pytest.approx(value) for key, value in expected.items())
+
+    ranked = sorted(expected.values(), key=abs, reverse=True)
+    top = structural_paths(z, direct, total, demand, max_depth=3, top_n=25)
+    assert sorted((path.contribution for path in top), key=abs, reverse=True) == pytest.approx(ranked[:25])
+
+    cutoff = abs(ranked[40])
+    pruned = structural_paths(z, direct, total, demand, max_depth=3, cutoff=cutoff)
+    assert len(pruned) == sum(abs(value) >= cutoff for value in expected.values())
+
+
+def test_structural_paths_keep_paths_compact_on_deep_traversals():
+    z, direct, total, demand = _synthetic_system(2000, 0.005, seed=11)
+
+    paths = structural_paths(z, direct, total, demand, max_depth=6, top_n=100)
+
+    assert len(paths) == 100
+    assert all(path.nodes.dtype == np.int64 and len(path.nodes) == path.depth + 1 for path in paths)
+    for path in paths:
+        weight = demand[path.nodes[-1], path.demand_column]
+        for buyer, supplier in itertools.pairwise(path.nodes[::-1]):
+            weight *= z[supplier, buyer]
+        assert direct[path.nodes[0]] * weight == pytest.approx(path.contribution)
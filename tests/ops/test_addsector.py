@@ -34,7 +34,7 @@ from mario.ops.add_sector_workbook import (
     group_advanced_inventories_by_target,
     read_advanced_add_sector_workbook,
 )
-from mario.ops.add_sector_engine import collect_missing_factor_of_production_inputs
+from mario.ops.add_sector_engine import _insert_blocks, collect_missing_factor_of_production_inputs
 from mario.log_exc.exceptions import NotImplementable, WrongExcelFormat, WrongInput
 from mario.ops.sectoradd import get_corresponding_keys,matrix_concat,fill_matrix
 from mario.model.conventions import _MASTER_INDEX
@@ -495,6 +495,30 @@ def test_matrix_concat():
     pdt.assert_index_equal(Y_index,data["v"].columns)
     pdt.assert_index_equal(Y_index,data["e"].columns)
 
+def test_insert_blocks_matches_concat_and_groupby_for_dense_and_sparse_blocks():
+    old_axis = pd.MultiIndex.from_product([["reg 1", "reg 2"], [_MASTER_INDEX["s"]], ["sector 1", "sector 3"]])
+    new_axis = pd.MultiIndex.from_product([["reg 1", "reg 2"], [_MASTER_INDEX["s"]], ["sector 2"]])
+    matrix = pd.DataFrame(
+        [[1.0, 2.0, 0.0, 4.0], [0.0, 6.0, 7.0, 0.0], [9.0, 0.0, 11.0, 12.0], [13.0, 0.0, 0.0, 16.0]],
+        index=old_axis,
+        columns=old_axis,
+    )
+    new_slice = pd.DataFrame(
+        [[0.5, 0.0], [0.0, 1.5], [2.5, 0.0], [0.0, 3.5], [4.5, 5.5], [0.0, 6.5]],
+        index=old_axis.append(new_axis),
+        columns=new_axis,
+    )
+    expected = pd.concat([matrix, new_slice], axis=1)
+    expected = expected.groupby(level=[0, 1, 2]).sum().T.groupby(level=[0, 1, 2]).sum().T
+
+    pdt.assert_frame_equal(_insert_blocks(matrix, new_slice), expected)
+
+    sparse_dtype = pd.SparseDtype(float, 0.0)
+    inserted = _insert_blocks(matrix.astype(sparse_dtype), new_slice)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in inserted.dtypes)
+    pdt.assert_frame_equal(inserted.sparse.to_dense(), expected)
+
+
 def test_fill_matrix(CoreDataIOT):
     
     # Empty matrix
@@ -1,11 +1,13 @@
 import os
 
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import pytest
 from pymrio import IOSystem
 from scipy import sparse
 
+import mario
 from mario.ops import (
     aggregate_database,
     build_new_instance_from_scenario,
@@ -14,8 +16,12 @@ from mario.ops import (
     transform_to_chenery_moses,
 )
 from mario.ops.aggregation_engine import _aggregate_axis, _aggregate_block, _drop_extension_rows
+from mario.ops.shocks import Y_shock, Z_shock
+from mario.ops.transform_engine import SUT_to_IOT
+from mario.ops.workbook_specs import SHOCK_FLAT_COLUMNS
 from mario.test.mario_test import load_test
-from mario.model.conventions import _ENUM
+from mario.log_exc.exceptions import WrongInput
+from mario.model.conventions import _ENUM, _MASTER_INDEX
 from mario.parsers.api import build_database_from_state, build_parser_state
 from mario.parsers.entrypoints import parse_from_excel
 from mario.parsers.matrix_layouts import sut_block_specs_for_matrix_layouts
@@ -263,6 +269,86 @@ def test_transform_sut_to_iot_preserves_custom_extension_and_factor_rows():
     )
 
 
+@pytest.mark.parametrize("method", ["A", "B", "C", "D"])
+def test_sut_to_iot_solves_without_explicit_inverses_on_sparse_blocks(monkeypatch, method):
+    expected, _, _ = SUT_to_IOT(load_test("SUT"), method)
+
+    sut = load_test("SUT")
+    for name, block in list(sut.matrices["baseline"].items()):
+        sut.set_block(name, block.astype(pd.SparseDtype(float, 0.0)))
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("SUT_to_IOT should not build explicit inverses or diagonal matrices.")
+
+    monkeypatch.setattr(np.linalg, "inv", forbidden)
+    monkeypatch.setattr(np, "diagflat", forbidden)
+    matrices, _, _ = SUT_to_IOT(sut, method)
+
+    for name, block in expected["baseline"].items():
+        result = matrices["baseline"][name]
+        if isinstance(result.dtypes.iloc[0], pd.SparseDtype):
+            result = result.sparse.to_dense()
+        pdt.assert_frame_equal(result, block, check_dtype=False)
+
+
+def _sut_with_zero_output(level):
+    database = load_test("SUT")
+    item = next(label for label in database.Z.index if label[1] == level)
+    Z = database.Z.copy()
+    Z.loc[item, :] = 0.0
+    Z.loc[:, item] = 0.0
+    Y = database.Y.copy()
+    Y.loc[item] = 0.0
+    V = database.V.copy()
+    V[item] = 0.0
+    E = database.E.copy()
+    E[item] = 0.0
+    return mario.Database(
+        name="zero output",
+        table="SUT",
+        Z=Z,
+        Y=Y,
+        V=V,
+        E=E,
+        EY=database.EY,
+        VY=database.VY,
+        units=database.units,
+    )
+
+
+@pytest.mark.parametrize("method", ["A", "B", "C", "D"])
+@pytest.mark.parametrize("level", [_MASTER_INDEX["a"], _MASTER_INDEX["c"]])
+def test_sut_to_iot_singular_supply_and_zero_output_fall_back_to_pseudo_inverses(caplog, level, method):
+    # Zeroing one activity (commodity) leaves a zero row (column) in S, so S is
+    # singular and g (q) has a zero, as in the pinv branches of the explicit inverses.
+    sut = _sut_with_zero_output(level)
+    S = sut.S.to_numpy()
+    U = sut.U.to_numpy()
+    activities = (slice(None), _MASTER_INDEX["a"], slice(None))
+    commodities = (slice(None), _MASTER_INDEX["c"], slice(None))
+    g = sut.X.loc[activities].to_numpy().ravel()
+    q = sut.X.loc[commodities].to_numpy().ravel()
+    Va = sut.V.loc[:, activities].to_numpy()
+    Ea = sut.E.loc[:, activities].to_numpy()
+    Yc = sut.Y.loc[commodities].to_numpy()
+
+    with caplog.at_level("CRITICAL"):
+        matrices, _, _ = SUT_to_IOT(sut, method)
+
+    if method in ("A", "B"):
+        T = np.linalg.pinv(S.T) @ np.diag(q) if method == "A" else np.linalg.pinv(np.diag(g)) @ S
+        expected = {_ENUM.Z: U @ T, _ENUM.V: Va @ T, _ENUM.E: Ea @ T, _ENUM.Y: Yc}
+    else:
+        T = np.diag(g) @ np.linalg.pinv(S.T) if method == "C" else S @ np.linalg.pinv(np.diag(q))
+        expected = {_ENUM.Z: T @ U, _ENUM.V: Va, _ENUM.E: Ea, _ENUM.Y: T @ Yc}
+    for name, values in expected.items():
+        np.testing.assert_allclose(matrices["baseline"][name].to_numpy(), values, rtol=1e-9, atol=1e-9)
+
+    zero_output = {"B": _MASTER_INDEX["a"], "D": _MASTER_INDEX["c"]}
+    singular = method in ("A", "C") or zero_output[method] == level
+    assert any("pseudo-inverse" in message for message in caplog.messages) == singular
+
+
 def test_aggregate_database_wrapper_returns_aggregated_copy():
     database = parse_from_excel(
         path=f"{MOCK_PATH}/IOT_aggregation.xlsx",
@@ -570,3 +656,87 @@ def test_export_to_pymrio_and_tabular_view_work_from_new_modules():
 
     assert isinstance(io, IOSystem)
     pdt.assert_frame_equal(frame, sut.DataFrame())
+
+
+def _z_shock_row(row, column, shock_type, value):
+    return {
+        SHOCK_FLAT_COLUMNS["region_from"]: row[0],
+        SHOCK_FLAT_COLUMNS["sector_from"]: row[2],
+        SHOCK_FLAT_COLUMNS["region_to"]: column[0],
+        SHOCK_FLAT_COLUMNS["sector_to"]: column[2],
+        SHOCK_FLAT_COLUMNS["type"]: shock_type,
+        SHOCK_FLAT_COLUMNS["value"]: value,
+    }
+
+
+def test_z_shock_batch_matches_row_by_row_application():
+    database = load_test("IOT")
+    z = database.z.copy()
+    Z = database.Z
+    X = database.X
+    rows, columns = list(z.index), list(z.columns)
+    sheet = pd.DataFrame(
+        [
+            _z_shock_row(rows[0], columns[0], "Update", 0.2),
+            _z_shock_row(rows[0], columns[0], "Percentage", 0.5),
+            _z_shock_row(rows[1], columns[2], "Percentage", -0.25),
+            _z_shock_row(rows[1], columns[2], "Percentage", 0.1),
+            _z_shock_row(rows[2], columns[3], "Absolute", 7.0),
+            _z_shock_row(rows[2], columns[3], "Percentage", 1.0),
+            {
+                **_z_shock_row(rows[3], columns[1], "Update", 0.3),
+                SHOCK_FLAT_COLUMNS["region_from"]: "EU",
+            },
+        ]
+    )
+
+    shocked, notes = Z_shock(
+        database,
+        {_ENUM.z: sheet},
+        True,
+        {_MASTER_INDEX["r"]: {"EU": ["Reg1", "Reg2"]}},
+        1,
+    )
+
+    expected = z.copy()
+    expected.loc[rows[0], columns[0]] = 0.2 * 1.5
+    expected.loc[rows[1], columns[2]] = z.loc[rows[1], columns[2]] * 0.75 * 1.1
+    expected.loc[rows[2], columns[3]] = (
+        (Z.loc[rows[2], columns[3]] + 7.0) / X.loc[columns[3], "production"] * 2.0
+    )
+    for region in ["Reg1", "Reg2"]:
+        expected.loc[(region, rows[3][1], rows[3][2]), columns[1]] = 0.3
+
+    pdt.assert_frame_equal(shocked, expected)
+    assert len(notes) == len(sheet)
+    assert "row_region_:['Reg1', 'Reg2']" in notes[-1]
+
+
+def test_y_shock_accumulates_repeated_rows_and_rejects_unknown_types():
+    database = load_test("IOT")
+    Y = database.Y.copy()
+    row, column = Y.index[0], Y.columns[0]
+    shock = {
+        SHOCK_FLAT_COLUMNS["region_from"]: row[0],
+        SHOCK_FLAT_COLUMNS["sector_from"]: row[2],
+        SHOCK_FLAT_COLUMNS["region_to"]: column[0],
+        SHOCK_FLAT_COLUMNS["category_to"]: column[2],
+        SHOCK_FLAT_COLUMNS["type"]: "Absolute",
+        SHOCK_FLAT_COLUMNS["value"]: 5.0,
+    }
+
+    shocked, notes = Y_shock(database, {_ENUM.Y: pd.DataFrame([shock, shock])}, True, {}, 1)
+
+    expected = Y.copy()
+    expected.loc[row, column] = Y.loc[row, column] + 10.0
+    pdt.assert_frame_equal(shocked, expected)
+    assert len(notes) == 2
+
+    with pytest.raises(WrongInput, match="Acceptable values for type"):
+        Y_shock(
+            database,
+            {_ENUM.Y: pd.DataFrame([{**shock, SHOCK_FLAT_COLUMNS["type"]: "Scale"}])},
+            True,
+            {},
+            1,
+        )
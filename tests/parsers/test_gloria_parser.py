@@ -420,7 +420,7 @@ def test_parse_gloria_sut_falls_back_to_placeholder_extensions_when_tq_yq_are_mi
     assert float(base["EY"].astype(np.float32).to_numpy().sum()) == 0.0
 
 
-def test_public_parse_gloria_can_reload_from_parquet_cache(tmp_path, monkeypatch):
+def test_public_parse_gloria_can_reload_from_binary_cache(tmp_path, monkeypatch):
     _write_gloria_year(tmp_path)
 
     first = mario.parse_gloria(str(tmp_path), table="SUT", calc_all=False, cache=True)
@@ -439,3 +439,99 @@ def test_public_parse_gloria_can_reload_from_parquet_cache(tmp_path, monkeypatch
         second.Z.sort_index().sort_index(axis=1).to_numpy(),
         first.Z.sort_index().sort_index(axis=1).to_numpy(),
     )
+
+
+def test_parse_gloria_sut_reads_files_on_a_process_pool_like_sequentially(tmp_path, monkeypatch):
+    root = _write_gloria_year(tmp_path)
+    process_pool = gloria_parser.ProcessPoolExecutor
+
+    def _unexpected_pool(*args, **kwargs):
+        raise AssertionError("GLORIA files should be read in-process by default")
+
+    monkeypatch.setattr(gloria_parser, "ProcessPoolExecutor", _unexpected_pool)
+    sequential, _, _, _ = parse_gloria_sut(root, regions=["ME"])
+    monkeypatch.setattr(gloria_parser, "ProcessPoolExecutor", process_pool)
+    concurrent, _, _, _ = parse_gloria_sut(root, regions=["ME"], workers=3)
+
+    for matrix_name, expected in sequential["baseline"].items():
+        pd.testing.assert_frame_equal(concurrent["baseline"][matrix_name], expected)
+
+    for workers in (0, None):
+        with pytest.raises(WrongInput):
+            parse_gloria_sut(root, workers=workers)
+        with pytest.raises(WrongInput):
+            mario.parse_gloria(str(tmp_path), table="SUT", calc_all=False, workers=workers)
+
+
+def test_public_parse_gloria_binary_cache_memory_maps_parsed_blocks(tmp_path):
+    _write_gloria_year(tmp_path)
+    cache_dir = tmp_path / "gloria_cache"
+
+    first = mario.parse_gloria(str(tmp_path), table="SUT", calc_all=False, cache=cache_dir, workers=1)
+    assert (cache_dir / "blocks" / "baseline" / "U" / "values.npy").exists()
+    assert (cache_dir / "blocks" / "baseline" / "S" / "indptr.npy").exists()
+
+    second = mario.parse_gloria(str(tmp_path), table="SUT", calc_all=False, cache=cache_dir)
+
+    for matrix_name, expected in first["baseline"].items():
+        pd.testing.assert_frame_equal(second["baseline"][matrix_name], expected)
+    assert second.units["Satellite account"].equals(first.units["Satellite account"])
+    assert second.meta.name == first.meta.name
+
+
+def test_parse_gloria_sut_region_subset_never_parses_unselected_rows(tmp_path, monkeypatch):
+    root = _write_gloria_year(tmp_path)
+    read_batches = gloria_parser._iter_csv_batches
+    parsed_rows = {}
+
+    def _recording_batches(path, *, rows=None, **kwargs):
+        name = Path(str(path)).name.split("_")[4].split("-")[0]
+        for row_numbers, values in read_batches(path, rows=rows, **kwargs):
+            parsed_rows.setdefault(name, []).extend(row_numbers.tolist())
+            yield row_numbers, values
+
+    def _full_batches(path, *, rows=None, **kwargs):
+        yield from read_batches(path, **kwargs)
+
+    monkeypatch.setattr(gloria_parser, "_iter_csv_batches", _recording_batches)
+    pushed, _, _, _ = parse_gloria_sut(root, regions=["ME"], workers=1)
+    monkeypatch.setattr(gloria_parser, "_iter_csv_batches", _full_batches)
+    filtered, _, _, _ = parse_gloria_sut(root, regions=["ME"], workers=1)
+
+    # ME is the second region: two sectors of activities and commodities, two factors.
+    assert parsed_rows["T"] == parsed_rows["Y"] == [4, 5, 6, 7]
+    assert parsed_rows["V"] == [2, 3]
+    for matrix_name, expected in filtered["baseline"].items():
+        pd.testing.assert_frame_equal(pushed["baseline"][matrix_name], expected)
+
+
+@pytest.mark.parametrize("rows", [[2, 3, 4], [1, 3, 4]])
+def test_iter_csv_batches_stops_tokenizing_after_the_last_selected_row(tmp_path, monkeypatch, rows):
+    path = tmp_path / "rows.csv"
+    lines = [f"{line},{10 * line}" for line in range(6)] + ["not,a number"] * 3
+    path.write_text("\n".join(lines) + "\n")
+    read_csv = pd.read_csv
+    options = {}
+
+    def _recording_read_csv(*args, **kwargs):
+        options.update(kwargs)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(gloria_parser.pd, "read_csv", _recording_read_csv)
+    batches = list(
+        gloria_parser._iter_csv_batches(
+            gloria_parser.GloriaResource(path),
+            columns=[0, 1],
+            dtype=np.dtype(float),
+            batch_size=2,
+            rows=np.array(rows),
+        )
+    )
+
+    assert np.concatenate([row_numbers for row_numbers, _ in batches]).tolist() == rows
+    np.testing.assert_array_equal(
+        np.vstack([values for _, values in batches]),
+        np.array([[line, 10 * line] for line in rows], dtype=float),
+    )
+    assert options["nrows"] == len(rows)
+    assert not callable(options["skiprows"])
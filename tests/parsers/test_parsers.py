@@ -18,6 +18,7 @@ from mario.parsers.excel import parse_state_from_excel
 from mario.parsers.parquet import parse_state_from_parquet
 from mario.parsers.txt import parse_state_from_txt
 from mario.parsers.registry import ParserRegistry, get_parser_registry, register_parser
+from mario.storage.sparse_parquet import is_coo_parquet
 from mario.parsers.entrypoints import parse_from_excel, parse_from_parquet, parse_from_txt
 from mario.parsers.matrix_layouts import sut_block_specs_for_matrix_layouts
 from mario.test.mario_test import load_test
@@ -1595,6 +1596,37 @@ def test_to_parquet_flat_separate_files_exports_trimmed_matrix_payloads(tmp_path
     )
 
 
+def test_flat_export_streams_small_chunks_and_can_skip_zero_cells(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    import mario.ops.export as export_module
+
+    monkeypatch.setattr(export_module, "_FLAT_EXPORT_CHUNK_CELLS", 7)
+    database = load_test("IOT")
+    database.to_parquet(path=tmp_path / "full", flat=True, separate_files=True)
+    database.to_txt(path=tmp_path / "sparse", flat=True, _format="csv", skip_zeros=True)
+
+    data_path = tmp_path / "full" / "flows" / "data.parquet"
+    assert pq.ParquetFile(data_path).metadata.num_row_groups > 6
+    state = parse_state_from_parquet(
+        path=str(tmp_path / "full" / "flows"),
+        table="IOT",
+        mode="flows",
+        name="IOT chunked flat parquet dataset",
+        flat=True,
+    )
+    pdt.assert_frame_equal(state.get_block("Z"), database.Z)
+    pdt.assert_frame_equal(state.get_block("Y"), database.Y)
+
+    full = pd.read_parquet(data_path)
+    nonzero = pd.read_csv(tmp_path / "sparse" / "flows" / "data.csv", keep_default_na=False)
+    assert len(nonzero) == int((full["Value"] != 0).sum())
+    pdt.assert_frame_equal(
+        nonzero.reset_index(drop=True),
+        full.loc[full["Value"] != 0].reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
 def test_parse_state_from_parquet_iot_flat_separate_files_roundtrip_preserves_blocks(tmp_path):
     pytest.importorskip("pyarrow")
 
@@ -1665,8 +1697,11 @@ def test_to_parquet_matrix_exports_sparse_backed_flow_blocks(tmp_path):
         name="IOT sparse parquet dataset",
     )
 
+    assert is_coo_parquet(tmp_path / "flows" / "Z.parquet")
     for matrix_name, expected in expected_blocks.items():
-        pdt.assert_frame_equal(state.get_block(matrix_name), expected)
+        parsed = state.get_block(matrix_name)
+        assert all(isinstance(dtype, pd.SparseDtype) for dtype in parsed.dtypes)
+        pdt.assert_frame_equal(parsed.sparse.to_dense(), expected)
 
 
 def test_to_parquet_flat_roundtrip_preserves_custom_iot_layouts_without_level_values(tmp_path):
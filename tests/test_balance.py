@@ -69,3 +69,44 @@ def test_database_ras_returns_balanced_copy_and_leaves_original_untouched():
 def test_database_ras_requires_iot():
     with pytest.raises(WrongInput, match="only available for IOT"):
         load_test("SUT").ras(target_rows=[1.0], target_cols=[1.0])
+
+
+def test_ras_keeps_sparse_inputs_sparse_and_matches_dense_result():
+    from scipy import sparse
+
+    rng = np.random.default_rng(7)
+    dense = rng.random((40, 40)) * (rng.random((40, 40)) < 0.2)
+    dense += np.eye(40)
+    target_rows = dense.sum(axis=1) * rng.uniform(0.8, 1.2, 40)
+    target_cols = dense.sum(axis=0) * rng.uniform(0.8, 1.2, 40)
+    target_cols *= target_rows.sum() / target_cols.sum()
+
+    expected = mario.ras(dense, target_rows, target_cols)
+    balanced = mario.ras(sparse.csr_matrix(dense), target_rows, target_cols)
+    frame = pd.DataFrame.sparse.from_spmatrix(sparse.csr_matrix(dense))
+    balanced_frame = mario.ras(frame, target_rows, target_cols)
+
+    assert sparse.issparse(balanced)
+    assert balanced.nnz <= np.count_nonzero(dense)
+    assert np.allclose(balanced.toarray(), expected)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in balanced_frame.dtypes)
+    assert np.allclose(balanced_frame.sparse.to_coo().toarray(), expected)
+
+
+def test_gras_balances_matrices_with_negative_entries_and_reports_diagnostics():
+    matrix = np.array([[4.0, -1.0, 2.0], [3.0, 5.0, -2.0], [-1.0, 2.0, 6.0]])
+    target_rows = np.array([6.0, 7.0, 8.0])
+    target_cols = np.array([7.0, 6.0, 8.0])
+
+    with pytest.raises(WrongInput, match="negative values"):
+        mario.ras(matrix, target_rows, target_cols, method="ras")
+
+    balanced, diagnostics = mario.ras(matrix, target_rows, target_cols, return_diagnostics=True)
+
+    assert diagnostics.method == "gras"
+    assert diagnostics.converged
+    assert diagnostics.iterations == len(diagnostics.row_residuals) == len(diagnostics.col_residuals)
+    assert diagnostics.row_residuals[-1] <= 1e-6
+    assert np.allclose(balanced.sum(axis=1), target_rows)
+    assert np.allclose(balanced.sum(axis=0), target_cols)
+    assert np.array_equal(np.sign(balanced), np.sign(matrix))